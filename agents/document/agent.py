@@ -2,23 +2,73 @@
 Document Agent - Parses RFP documents and extracts specifications
 """
 import logging
-import pdfplumber
+import os
 import re
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Any
 from pathlib import Path
 
-from shared.models import Specification
+from shared.models import LineItem, ParsedDocument, Specification
+from shared.pdf import backend_class, open_pdf, resolve_backend
+from .cache import ParsedDocumentCache, hash_file
+from .extraction import ExtractionState, SpecExtractionEngine
+from .line_items import LineItemExtractor
+from .tables import is_table_page, load_page_tables
 
 logger = logging.getLogger(__name__)
 
+# Fields the auditor rejects an RFP without (AuditorAgent compliance_rules["required_specs"])
+DEFAULT_REQUIRED_SPECS = ["voltage", "conductor_size", "conductor_material"]
+
+# Tail of the previous page re-scanned with the next one, so values split
+# across a page break are still matched
+STREAM_PAGE_OVERLAP = 64
+
+# Marks "cache not given": build the default cache (None disables caching)
+_DEFAULT_CACHE = object()
+
+def _parse_page_range(pdf_path: str, start: int, end: int, backend: str) -> List[str]:
+    """Process-pool worker: open the PDF and extract a shard of pages"""
+    with open_pdf(pdf_path, backend) as pdf:
+        return pdf.page_texts(start, end)
+
 
 class DocumentAgent:
     """Agent responsible for parsing documents and extracting specifications"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        parse_workers: Optional[int] = None,
+        parallel_min_pages: Optional[int] = None,
+        cache: Optional[ParsedDocumentCache] = _DEFAULT_CACHE,
+        text_backend: Optional[str] = None
+    ):
         self.name = "DocumentAgent"
         self.version = "1.0.0"
-        logger.info(f"{self.name} v{self.version} initialized")
+        
+        # Parallel parsing: large PDFs are sharded by page range across processes
+        if parse_workers is None:
+            parse_workers = int(os.getenv("PDF_PARSE_WORKERS", os.cpu_count() or 1))
+        self.parse_workers = parse_workers
+        if parallel_min_pages is None:
+            parallel_min_pages = int(os.getenv("PDF_PARALLEL_MIN_PAGES", 40))
+        self.parallel_min_pages = parallel_min_pages
+        
+        # Page text comes from PyMuPDF when installed; tables always use pdfplumber
+        self.text_backend = resolve_backend(text_backend)
+        
+        self.extraction_engine = SpecExtractionEngine()
+        self.line_item_extractor = LineItemExtractor(self.extraction_engine)
+        
+        # Content-addressed cache so repeat submissions of the same PDF skip parsing
+        self.cache = None if cache is _DEFAULT_CACHE else cache
+        if cache is _DEFAULT_CACHE and os.getenv("PDF_CACHE_ENABLED", "true").lower() == "true":
+            try:
+                self.cache = ParsedDocumentCache()
+            except Exception as e:
+                logger.warning(f"Parsed PDF cache unavailable: {e}")
+        
+        logger.info(f"{self.name} v{self.version} initialized (text backend: {self.text_backend})")
     
     def extract_specifications_from_text(self, text: str) -> Specification:
         """
@@ -33,48 +83,23 @@ class DocumentAgent:
         try:
             logger.info("Extracting specifications from raw text")
             
-            # Extract specifications
-            specifications = {
-                'voltage': self._extract_voltage(text),
-                'current': self._extract_current(text),
-                'conductor_material': self._extract_conductor_material(text),
-                'insulation_material': self._extract_insulation_material(text),
-                'conductor_size': self._extract_conductor_size(text),
-                'cable_type': self._extract_cable_type(text),
-                'length': self._extract_length(text),
-                'standards': self._extract_standards(text),
-                'raw_text_sample': text[:500]
-            }
-            
-            # Extract testing requirements
-            testing_requirements = self._extract_testing_requirements(text)
-            
-            # Calculate confidence score
-            confidence = self._calculate_confidence(specifications, testing_requirements)
-            
             # Create a dummy ID for text-based extraction if not provided context
-            rfp_id = "TEXT-EXTRACT"
-            
-            return Specification(
-                rfp_id=rfp_id,
-                specifications=specifications,
-                testing_requirements=testing_requirements,
-                confidence_score=confidence
-            )
+            return self._build_specification("TEXT-EXTRACT", text)
             
         except Exception as e:
             logger.error(f"Error extracting specifications from text: {str(e)}")
             raise
 
-    def parse_pdf(self, pdf_path: str) -> Dict[str, Any]:
+    def parse_document(self, pdf_path: str) -> ParsedDocument:
         """
-        Parse PDF document and extract text
+        Parse PDF document once into a reusable ParsedDocument
         
         Args:
             pdf_path: Path to PDF file (can be None)
             
         Returns:
-            Dictionary with extracted content
+            ParsedDocument with full text, per-page text, metadata and lazily
+            extracted tables
         """
         try:
             logger.info(f"Parsing PDF: {pdf_path}")
@@ -87,73 +112,200 @@ class DocumentAgent:
             if not Path(pdf_path).exists():
                 raise FileNotFoundError(f"PDF file not found: {pdf_path}")
             
-            content = {
-                'text': '',
-                'pages': 0,
-                'tables': [],
-                'metadata': {}
-            }
+            content_hash = None
+            if self.cache:
+                content_hash = hash_file(pdf_path)
+                cached = self.cache.get_document(content_hash, pdf_path, self.text_backend)
+                if cached:
+                    logger.info(f"Parsed PDF cache hit: {pdf_path} ({content_hash[:12]})")
+                    cached.table_loader = self._table_loader(content_hash)
+                    return cached
             
-            with pdfplumber.open(pdf_path) as pdf:
-                content['pages'] = len(pdf.pages)
-                content['metadata'] = pdf.metadata
+            with open_pdf(pdf_path, self.text_backend) as pdf:
+                metadata = pdf.metadata
+                page_count = pdf.page_count
+                backend = pdf.backend_name
                 
-                # Extract text from all pages
-                text_parts = []
-                for page in pdf.pages:
-                    text_parts.append(page.extract_text() or '')
-                    
-                    # Extract tables
-                    tables = page.extract_tables()
-                    if tables:
-                        content['tables'].extend(tables)
-                
-                content['text'] = '\n\n'.join(text_parts)
+                if self._use_parallel_parse(page_count, backend):
+                    page_texts = None
+                else:
+                    page_texts = pdf.page_texts()
             
-            logger.info(f"Parsed PDF: {content['pages']} pages, {len(content['text'])} characters")
-            return content
+            if page_texts is None:
+                page_texts = self._parse_pages_parallel(str(pdf_path), page_count, backend)
+            
+            # Table detection is the most expensive pdfplumber call, so tables
+            # are extracted lazily and only BOQ-like pages are candidates
+            document = ParsedDocument(
+                source_path=str(pdf_path),
+                text='\n\n'.join(page_texts),
+                page_texts=page_texts,
+                metadata=metadata,
+                content_hash=content_hash,
+                text_backend=backend,
+                table_pages=[i for i, text in enumerate(page_texts) if is_table_page(text)],
+                table_loader=self._table_loader(content_hash)
+            )
+            
+            if self.cache:
+                self.cache.put_document(document, self.text_backend)
+            
+            logger.info(f"Parsed PDF: {document.pages} pages, {len(document.text)} characters")
+            return document
             
         except Exception as e:
             logger.error(f"Error parsing PDF: {str(e)}")
             raise
+
+    def _table_loader(self, content_hash: Optional[str]):
+        """Table loader for a parsed document; tables it extracts are written to the cache"""
+        if not self.cache or not content_hash:
+            return load_page_tables
+        
+        cache = self.cache
+        
+        def load_and_cache(source_path: str, page_indexes: List[int]):
+            loaded = load_page_tables(source_path, page_indexes)
+            # Pages without tables are stored too, so they are not re-scanned
+            cache.put_tables(content_hash, {i: loaded.get(i, []) for i in page_indexes})
+            return loaded
+        
+        return load_and_cache
     
-    def extract_specifications(self, rfp_id: str, pdf_path: str) -> Specification:
+    def _use_parallel_parse(self, page_count: int, backend: str) -> bool:
         """
-        Extract technical specifications from RFP document
+        Small PDFs stay single-process; pool start-up would dominate
+        
+        parallel_min_pages is in pdfplumber pages; faster backends need
+        proportionally more pages before sharding pays off.
+        """
+        if self.parse_workers <= 1:
+            return False
+        return page_count * backend_class(backend).relative_page_cost >= self.parallel_min_pages
+    
+    def _parse_pages_parallel(self, pdf_path: str, page_count: int, backend: str) -> List[str]:
+        """
+        Shard page ranges across a process pool and reassemble in page order
         
         Args:
-            rfp_id: RFP identifier
             pdf_path: Path to PDF file
+            page_count: Total number of pages
+            backend: Text backend the workers should use
             
         Returns:
-            Specification object
+            List of page texts, in page order
         """
+        workers = min(self.parse_workers, page_count)
+        # Two shards per worker keeps the pool busy when page costs are uneven
+        shard_size = max(1, -(-page_count // (workers * 2)))
+        ranges = [
+            (start, min(start + shard_size, page_count))
+            for start in range(0, page_count, shard_size)
+        ]
+        
+        logger.info(f"Parsing {page_count} pages in {len(ranges)} shards across {workers} processes")
+        
         try:
-            logger.info(f"Extracting specifications from: {pdf_path}")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                shards = executor.map(
+                    _parse_page_range,
+                    [pdf_path] * len(ranges),
+                    [start for start, _ in ranges],
+                    [end for _, end in ranges],
+                    [backend] * len(ranges)
+                )
+                # executor.map yields in submission order, so pages stay ordered
+                return [text for shard in shards for text in shard]
+        except Exception as e:
+            logger.warning(f"Parallel PDF parse failed, falling back to serial: {e}")
+            with open_pdf(pdf_path, backend) as pdf:
+                return pdf.page_texts()
+
+    def parse_pdf(self, pdf_path: str) -> Dict[str, Any]:
+        """
+        Parse PDF document and extract text
+        
+        Args:
+            pdf_path: Path to PDF file (can be None)
             
-            # Parse PDF
-            content = self.parse_pdf(pdf_path)
-            text = content['text']
+        Returns:
+            Dictionary with extracted content
+        """
+        return self.parse_document(pdf_path).to_dict()
+    
+    def iter_page_texts(self, pdf_path: str) -> Iterator[str]:
+        """
+        Yield page text one page at a time without building the full document
+        
+        Args:
+            pdf_path: Path to PDF file
+            
+        Yields:
+            Text of each page, in order
+        """
+        if not pdf_path:
+            raise ValueError("PDF path cannot be None or empty")
+        
+        if not Path(pdf_path).exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        if self.cache:
+            cached = self.cache.get_document(hash_file(pdf_path), pdf_path, self.text_backend)
+            if cached:
+                yield from cached.page_texts
+                return
+        
+        with open_pdf(pdf_path, self.text_backend) as pdf:
+            yield from pdf.iter_page_texts()
+    
+    def extract_specifications_streaming(
+        self,
+        rfp_id: str,
+        pages: Iterable[str],
+        required_fields: Optional[List[str]] = None,
+        confidence_threshold: float = 1.0
+    ) -> Specification:
+        """
+        Extract specifications page by page, stopping once required fields are settled
+        
+        Args:
+            rfp_id: RFP identifier
+            pages: Page texts in document order (e.g. iter_page_texts(pdf_path))
+            required_fields: Fields that must reach the threshold before stopping
+                (defaults to the auditor's required specs)
+            confidence_threshold: Per-field confidence needed to stop early; 1.0
+                stops only when each field is matched by its top-priority pattern,
+                giving the same values as a full-document scan for those fields
             
-            # Extract specifications
-            specifications = {
-                'voltage': self._extract_voltage(text),
-                'current': self._extract_current(text),
-                'conductor_material': self._extract_conductor_material(text),
-                'insulation_material': self._extract_insulation_material(text),
-                'conductor_size': self._extract_conductor_size(text),
-                'cable_type': self._extract_cable_type(text),
-                'length': self._extract_length(text),
-                'standards': self._extract_standards(text),
-                'raw_text_sample': text[:500]  # First 500 chars for reference
-            }
+        Returns:
+            Specification object. When extraction stops early, optional fields
+            (standards, testing requirements, ...) only reflect the pages read.
+        """
+        try:
+            required = required_fields or DEFAULT_REQUIRED_SPECS
+            state = ExtractionState()
+            sample = ''
+            carry = ''
+            pages_read = 0
             
-            # Extract testing requirements
-            testing_requirements = self._extract_testing_requirements(text)
+            for page_text in pages:
+                pages_read += 1
+                if len(sample) < 500:
+                    sample = (sample + '\n\n' + page_text if sample else page_text)[:500]
+                
+                chunk = f"{carry}\n\n{page_text}" if carry else page_text
+                self.extraction_engine.feed(state, chunk)
+                carry = chunk[-STREAM_PAGE_OVERLAP:]
+                
+                if all(state.confidence(f) >= confidence_threshold for f in required):
+                    logger.info(f"Required specs settled after {pages_read} pages - stopping early")
+                    break
             
-            # Calculate confidence score
+            fields, testing_requirements = self.extraction_engine.finalize(state)
+            specifications = {**fields, 'raw_text_sample': sample}
             confidence = self._calculate_confidence(specifications, testing_requirements)
             
+            logger.info(f"Streaming extraction for {rfp_id} read {pages_read} pages")
             return Specification(
                 rfp_id=rfp_id,
                 specifications=specifications,
@@ -162,154 +314,97 @@ class DocumentAgent:
             )
             
         except Exception as e:
-            logger.error(f"Error extracting specifications: {str(e)}")
+            logger.error(f"Error in streaming specification extraction: {str(e)}")
             raise
     
-    def _extract_voltage(self, text: str) -> Optional[str]:
-        """Extract voltage specification"""
-        patterns = [
-            r'(\d+\.?\d*)\s*[kK][vV]',
-            r'voltage[:\s]+(\d+\.?\d*)\s*[kK]?[vV]',
-            r'rated voltage[:\s]+(\d+\.?\d*)\s*[kK]?[vV]'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        
-        return None
-    
-    def _extract_current(self, text: str) -> Optional[str]:
-        """Extract current rating"""
-        patterns = [
-            r'(\d+\.?\d*)\s*[aA]',
-            r'current[:\s]+(\d+\.?\d*)\s*[aA]',
-            r'rated current[:\s]+(\d+\.?\d*)\s*[aA]'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        
-        return None
-    
-    def _extract_conductor_material(self, text: str) -> Optional[str]:
-        """Extract conductor material"""
-        materials = ['copper', 'aluminium', 'aluminum', 'cu', 'al']
-        
-        text_lower = text.lower()
-        for material in materials:
-            if f'conductor' in text_lower and material in text_lower:
-                return material.upper() if len(material) <= 2 else material.capitalize()
-        
-        return None
-    
-    def _extract_insulation_material(self, text: str) -> Optional[str]:
-        """Extract insulation material"""
-        materials = ['XLPE', 'PVC', 'EPR', 'PE', 'rubber']
-        
-        for material in materials:
-            if material.lower() in text.lower():
-                return material
-        
-        return None
-    
-    def _extract_conductor_size(self, text: str) -> Optional[str]:
-        """Extract conductor cross-section size"""
-        patterns = [
-            r'(\d+\.?\d*)\s*[sS][qQ]\s*[mM][mM]',
-            r'(\d+\.?\d*)\s*mm[²2]',
-            r'cross[- ]section[:\s]+(\d+\.?\d*)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        
-        return None
-    
-    def _extract_cable_type(self, text: str) -> Optional[str]:
-        """Extract cable type"""
-        cable_types = [
-            'single core', 'multi-core', 'multicore', '3 core', '4 core',
-            'armoured', 'unarmoured', 'aerial', 'underground'
-        ]
-        
-        text_lower = text.lower()
-        found_types = []
-        
-        for cable_type in cable_types:
-            if cable_type in text_lower:
-                found_types.append(cable_type)
-        
-        return ', '.join(found_types) if found_types else None
-    
-    def _extract_length(self, text: str) -> Optional[str]:
-        """Extract cable length requirement"""
-        patterns = [
-            r'(\d+\.?\d*)\s*[kK]?[mM]',
-            r'length[:\s]+(\d+\.?\d*)',
-            r'quantity[:\s]+(\d+\.?\d*)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match and 'length' in text[max(0, match.start()-20):match.end()+20].lower():
-                return match.group(0)
+    def extract_specifications(
+        self,
+        rfp_id: str,
+        pdf_path: Optional[str] = None,
+        document: Optional[ParsedDocument] = None
+    ) -> Specification:
+        """
+        Extract technical specifications from RFP document
         
-        return None
+        Args:
+            rfp_id: RFP identifier
+            pdf_path: Path to PDF file (parsed only if no document is given)
+            document: Already parsed document to reuse instead of re-opening the PDF
+            
+        Returns:
+            Specification object
+        """
+        try:
+            if document is None:
+                document = self.parse_document(pdf_path)
+            
+            if self.cache and document.content_hash:
+                cached = self.cache.get_specification(document.content_hash, rfp_id)
+                if cached:
+                    logger.info(f"Specification cache hit: {document.source_path}")
+                    return cached
+            
+            logger.info(f"Extracting specifications from: {document.source_path}")
+            specification = self._build_specification(rfp_id, document.text)
+            
+            if self.cache and document.content_hash:
+                self.cache.put_specification(document.content_hash, specification)
+            
+            return specification
+            
+        except Exception as e:
+            logger.error(f"Error extracting specifications: {str(e)}")
+            raise
     
-    def _extract_standards(self, text: str) -> List[str]:
-        """Extract applicable standards"""
-        standards_patterns = [
-            r'IEC\s*\d+[-/]?\d*',
-            r'IS\s*\d+',
-            r'BS\s*\d+',
-            r'ASTM\s*[A-Z]\d+',
-            r'IEEE\s*\d+'
-        ]
-        
-        standards = []
-        for pattern in standards_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            standards.extend(matches)
+    def extract_line_items(
+        self,
+        document: ParsedDocument,
+        defaults: Optional[Specification] = None
+    ) -> List[LineItem]:
+        """
+        Extract BOQ line items (one spec + quantity per cable) from a parsed document
         
-        return list(set(standards))
+        Args:
+            document: Parsed document; tables are loaded for its BOQ-like pages only
+            defaults: Document-level specification supplying fields rows leave out
+                (e.g. conductor material stated once for the whole tender)
+            
+        Returns:
+            List of LineItem objects, empty if the document has no BOQ table
+        """
+        try:
+            if not document.table_pages:
+                return []
+            
+            page_tables = {i: document.get_page_tables(i) for i in document.table_pages}
+            return self.line_item_extractor.extract(
+                page_tables,
+                defaults.specifications if defaults else None
+            )
+            
+        except Exception as e:
+            logger.error(f"Error extracting line items: {str(e)}")
+            return []
     
-    def _extract_testing_requirements(self, text: str) -> Dict[str, List[str]]:
-        """Extract testing requirements"""
-        testing_requirements = {
-            'type_tests': [],
-            'routine_tests': [],
-            'sample_tests': []
+    def _build_specification(self, rfp_id: str, text: str) -> Specification:
+        """Run all field extractors over text and assemble a Specification"""
+        # Single precompiled scan over the text
+        fields, testing_requirements = self.extraction_engine.extract(text)
+        
+        specifications = {
+            **fields,
+            'raw_text_sample': text[:500]  # First 500 chars for reference
         }
         
-        # Type tests
-        type_test_keywords = [
-            'type test', 'voltage test', 'impulse test', 'partial discharge',
-            'thermal test', 'flame test'
-        ]
-        
-        # Routine tests
-        routine_test_keywords = [
-            'routine test', 'conductor resistance', 'voltage test',
-            'continuity test', 'insulation resistance'
-        ]
-        
-        text_lower = text.lower()
-        
-        for keyword in type_test_keywords:
-            if keyword in text_lower:
-                testing_requirements['type_tests'].append(keyword)
-        
-        for keyword in routine_test_keywords:
-            if keyword in text_lower:
-                testing_requirements['routine_tests'].append(keyword)
+        # Calculate confidence score
+        confidence = self._calculate_confidence(specifications, testing_requirements)
         
-        return testing_requirements
+        return Specification(
+            rfp_id=rfp_id,
+            specifications=specifications,
+            testing_requirements=testing_requirements,
+            confidence_score=confidence
+        )
     
     def _calculate_confidence(
         self,
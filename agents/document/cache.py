@@ -0,0 +1,225 @@
+"""
+Parsed Document Cache - Content-addressed on-disk cache of parsed PDFs
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from shared.models import ParsedDocument, Specification, Table
+
+logger = logging.getLogger(__name__)
+
+# Bump when the parser or extractors change so stale entries are ignored
+CACHE_FORMAT_VERSION = 3
+
+
+def hash_file(path: str, block_size: int = 1024 * 1024) -> str:
+    """Compute the SHA-256 hex digest of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ParsedDocumentCache:
+    """
+    On-disk cache of parsed documents and extracted specifications
+
+    Entries are keyed by the SHA-256 of the PDF bytes, so the same tender
+    re-submitted under a different filename is a cache hit. Total size is
+    bounded; least-recently-used entries (by file mtime) are evicted first.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.cache_dir = Path(cache_dir or os.getenv("PDF_CACHE_DIR", "data/cache/parsed_pdfs"))
+        self.max_bytes = max_bytes or int(os.getenv("PDF_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, content_hash: str) -> Path:
+        return self.cache_dir / f"{content_hash}.json"
+
+    def _read_entry(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        path = self._entry_path(content_hash)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        if entry.get('version') != CACHE_FORMAT_VERSION:
+            return None
+
+        # Refresh mtime so LRU eviction sees this entry as recently used
+        os.utime(path, None)
+        return entry
+
+    def _write_entry(self, content_hash: str, entry: Dict[str, Any]) -> None:
+        path = self._entry_path(content_hash)
+        entry['version'] = CACHE_FORMAT_VERSION
+        # Unique temp file: other processes may be writing the same entry
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=self.cache_dir, prefix=f"{content_hash}.", suffix='.tmp', delete=False
+        ) as f:
+            tmp_path = f.name
+            try:
+                json.dump(entry, f, default=str)
+            except Exception:
+                f.close()
+                os.unlink(tmp_path)
+                raise
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries until the cache fits in max_bytes"""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.info(f"Evicted parsed PDF cache entry {path.stem[:12]}")
+
+    def get_document(
+        self,
+        content_hash: str,
+        source_path: str,
+        text_backend: Optional[str] = None
+    ) -> Optional[ParsedDocument]:
+        """
+        Return the cached ParsedDocument for these bytes, or None
+
+        Page text differs slightly between backends, so an entry parsed by a
+        different text_backend than requested is treated as a miss. An entry
+        stored for a request of text_backend also hits when the file had to
+        fall back to another backend (it would again).
+        """
+        with self._lock:
+            entry = self._read_entry(content_hash)
+
+        if not entry or 'document' not in entry or (
+            text_backend
+            and text_backend not in (entry['document'].get('text_backend'), entry.get('requested_backend'))
+        ):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        data = entry['document']
+        data['source_path'] = str(source_path)
+        data['text'] = '\n\n'.join(data['page_texts'])
+        # JSON object keys are strings; page indexes are ints
+        data['page_tables'] = {int(i): t for i, t in data.get('page_tables', {}).items()}
+        return ParsedDocument(**data)
+
+    def put_document(self, document: ParsedDocument, requested_backend: Optional[str] = None) -> None:
+        """
+        Store a parsed document under its content hash
+
+        Args:
+            document: Parsed document
+            requested_backend: Backend the caller asked for, if the document
+                was read by a fallback backend instead
+        """
+        if not document.content_hash:
+            return
+
+        try:
+            with self._lock:
+                entry = self._read_entry(document.content_hash) or {}
+                previous = entry.get('document') or {}
+                if previous.get('text_backend') != document.text_backend:
+                    # Specification was extracted from the other backend's text
+                    entry.pop('specification', None)
+                data = {
+                    'source_path': document.source_path,
+                    'page_texts': document.page_texts,
+                    'metadata': document.metadata,
+                    'content_hash': document.content_hash,
+                    'text_backend': document.text_backend,
+                    'table_pages': document.table_pages,
+                    'page_tables': document.page_tables
+                }
+                # Full text is rebuilt from page_texts on load; don't store it twice
+                entry['document'] = data
+                entry['requested_backend'] = requested_backend or document.text_backend
+                self._write_entry(document.content_hash, entry)
+        except Exception as e:
+            logger.warning(f"Could not cache parsed document: {e}")
+
+    def put_tables(self, content_hash: str, page_tables: Dict[int, List[Table]]) -> None:
+        """Add tables extracted after parsing to the cached document"""
+        if not page_tables:
+            return
+
+        try:
+            with self._lock:
+                entry = self._read_entry(content_hash)
+                if not entry or 'document' not in entry:
+                    return
+                cached = entry['document'].setdefault('page_tables', {})
+                # JSON object keys are strings
+                cached.update({str(i): tables for i, tables in page_tables.items()})
+                self._write_entry(content_hash, entry)
+        except Exception as e:
+            logger.warning(f"Could not cache extracted tables: {e}")
+
+    def get_specification(self, content_hash: str, rfp_id: str) -> Optional[Specification]:
+        """Return the cached Specification for these bytes, re-labelled for rfp_id"""
+        with self._lock:
+            entry = self._read_entry(content_hash)
+
+        if not entry or 'specification' not in entry:
+            return None
+
+        data = entry['specification']
+        data['rfp_id'] = rfp_id
+        return Specification.from_dict(data)
+
+    def put_specification(self, content_hash: str, specification: Specification) -> None:
+        """Store the Specification extracted from these bytes"""
+        try:
+            with self._lock:
+                entry = self._read_entry(content_hash) or {}
+                entry['specification'] = asdict(specification)
+                self._write_entry(content_hash, entry)
+        except Exception as e:
+            logger.warning(f"Could not cache specification: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current on-disk size"""
+        entries = list(self.cache_dir.glob('*.json'))
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(entries),
+            'size_bytes': sum(p.stat().st_size for p in entries if p.exists()),
+            'max_bytes': self.max_bytes
+        }
@@ -0,0 +1,298 @@
+"""
+Spec Extraction Engine - Single-pass, precompiled specification extractor
+"""
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_FLAGS = re.IGNORECASE
+
+# Field patterns, in the same priority order as DocumentAgent._extract_*
+VOLTAGE_PATTERNS = [
+    re.compile(r'(\d+\.?\d*)\s*[kK][vV]', _FLAGS),
+    re.compile(r'voltage[:\s]+(\d+\.?\d*)\s*[kK]?[vV]', _FLAGS),
+    re.compile(r'rated voltage[:\s]+(\d+\.?\d*)\s*[kK]?[vV]', _FLAGS),
+]
+CURRENT_PATTERNS = [
+    re.compile(r'(\d+\.?\d*)\s*[aA]', _FLAGS),
+    re.compile(r'current[:\s]+(\d+\.?\d*)\s*[aA]', _FLAGS),
+    re.compile(r'rated current[:\s]+(\d+\.?\d*)\s*[aA]', _FLAGS),
+]
+CONDUCTOR_SIZE_PATTERNS = [
+    re.compile(r'(\d+\.?\d*)\s*[sS][qQ]\s*[mM][mM]', _FLAGS),
+    re.compile(r'(\d+\.?\d*)\s*mm[²2]', _FLAGS),
+    re.compile(r'cross[- ]section[:\s]+(\d+\.?\d*)', _FLAGS),
+]
+LENGTH_PATTERNS = [
+    re.compile(r'(\d+\.?\d*)\s*[kK]?[mM]', _FLAGS),
+    re.compile(r'length[:\s]+(\d+\.?\d*)', _FLAGS),
+    re.compile(r'quantity[:\s]+(\d+\.?\d*)', _FLAGS),
+]
+STANDARDS_PATTERNS = [
+    re.compile(r'IEC\s*\d+[-/]?\d*', _FLAGS),
+    re.compile(r'IS\s*\d+', _FLAGS),
+    re.compile(r'BS\s*\d+', _FLAGS),
+    re.compile(r'ASTM\s*[A-Z]\d+', _FLAGS),
+    re.compile(r'IEEE\s*\d+', _FLAGS),
+]
+
+CONDUCTOR_MATERIALS = ['copper', 'aluminium', 'aluminum', 'cu', 'al']
+INSULATION_MATERIALS = ['XLPE', 'PVC', 'EPR', 'PE', 'rubber']
+CABLE_TYPES = [
+    'single core', 'multi-core', 'multicore', '3 core', '4 core',
+    'armoured', 'unarmoured', 'aerial', 'underground'
+]
+TYPE_TEST_KEYWORDS = [
+    'type test', 'voltage test', 'impulse test', 'partial discharge',
+    'thermal test', 'flame test'
+]
+ROUTINE_TEST_KEYWORDS = [
+    'routine test', 'conductor resistance', 'voltage test',
+    'continuity test', 'insulation resistance'
+]
+
+# Slot name -> pattern; "first match wins" fields keep one slot per pattern
+_FIRST_MATCH_SLOTS: List[Tuple[str, re.Pattern]] = (
+    [(f'voltage:{i}', p) for i, p in enumerate(VOLTAGE_PATTERNS)]
+    + [(f'current:{i}', p) for i, p in enumerate(CURRENT_PATTERNS)]
+    + [(f'conductor_size:{i}', p) for i, p in enumerate(CONDUCTOR_SIZE_PATTERNS)]
+    + [(f'length:{i}', p) for i, p in enumerate(LENGTH_PATTERNS)]
+)
+_PHRASES = sorted(
+    set(CABLE_TYPES) | set(TYPE_TEST_KEYWORDS) | set(ROUTINE_TEST_KEYWORDS),
+    key=len,
+    reverse=True
+)
+
+# Scanner alternatives: every position where a field pattern or phrase can
+# start must match one of these (the field patterns re-check exactly)
+_SCAN_NUMERIC = r'\d+\.?\d*\s*(?:kv|sq\s*mm|mm[²2]|k?m|a)'
+_SCAN_WORDS = [
+    r'voltage[:\s]', r'current[:\s]', r'cross[- ]section', r'length[:\s]',
+    r'quantity[:\s]', r'rated (?:voltage|current)',
+    r'iec\s*\d', r'is\s*\d', r'bs\s*\d', r'ieee\s*\d', r'astm\s*[a-z]\d',
+] + [re.escape(phrase) for phrase in _PHRASES]
+
+
+def _build_scanner() -> re.Pattern:
+    """
+    Compile one zero-width scanner over the lowercased text
+
+    Alternatives are factored by first character so the engine does one
+    character-class test per position instead of trying every branch. The
+    scanner never consumes text, so overlapping hits (e.g. 'armoured' inside
+    'unarmoured') are all visited.
+    """
+    by_first: Dict[str, List[str]] = {}
+    for source in _SCAN_WORDS:
+        by_first.setdefault(source[0], []).append(source[1:])
+
+    branches = [_SCAN_NUMERIC] + [
+        f"{re.escape(first)}(?:{'|'.join(tails)})"
+        for first, tails in by_first.items()
+    ]
+    first_chars = '0-9' + ''.join(sorted(c for c in by_first if not c.isdigit()))
+    return re.compile(f"(?=[{first_chars}])(?=(?:{'|'.join(branches)}))")
+
+
+_SCANNER = _build_scanner()
+
+
+def _first_char_table() -> Dict[str, List[Tuple[str, Any]]]:
+    """Map each possible first character to the handlers that can start with it"""
+    table: Dict[str, List[Tuple[str, Any]]] = {}
+
+    def add(chars: str, handler: Tuple[str, Any]):
+        for c in chars:
+            table.setdefault(c, []).append(handler)
+
+    digits = '0123456789'
+    for slot, pattern in _FIRST_MATCH_SLOTS:
+        lead = pattern.pattern.lstrip('(')
+        if lead.startswith('\\d'):
+            add(digits, ('first', (slot, pattern)))
+        else:
+            add(lead[0].lower(), ('first', (slot, pattern)))
+
+    for pattern in STANDARDS_PATTERNS:
+        add(pattern.pattern[0].lower(), ('standard', pattern))
+
+    for phrase in _PHRASES:
+        add(phrase[0], ('phrase', phrase))
+
+    return table
+
+
+_DISPATCH = _first_char_table()
+
+
+class ExtractionState:
+    """Fields found so far; updated chunk by chunk by SpecExtractionEngine.feed"""
+
+    def __init__(self):
+        # slot -> matched value, or None when the slot's first match was rejected
+        self.first: Dict[str, Optional[str]] = {}
+        self.standards = set()
+        self.phrases = set()
+        # Lowercased keywords seen anywhere ('conductor' and material names)
+        self.keywords = set()
+
+    def priority(self, field: str) -> Optional[int]:
+        """Index of the best-priority alternative found for a field, or None"""
+        if field == 'conductor_material':
+            if 'conductor' not in self.keywords:
+                return None
+            alternatives = CONDUCTOR_MATERIALS
+        elif field == 'insulation_material':
+            alternatives = [m.lower() for m in INSULATION_MATERIALS]
+        else:
+            count = _SLOT_COUNTS.get(field, 0)
+            for i in range(count):
+                if self.first.get(f'{field}:{i}'):
+                    return i
+            return None
+
+        for i, keyword in enumerate(alternatives):
+            if keyword in self.keywords:
+                return i
+        return None
+
+    def confidence(self, field: str) -> float:
+        """
+        1.0 once the field is settled by its top-priority alternative; lower
+        while only a fallback alternative has matched (a better one may still
+        appear further into the document); 0.0 if nothing matched yet
+        """
+        priority = self.priority(field)
+        if priority is None:
+            return 0.0
+        if field == 'conductor_material':
+            total = len(CONDUCTOR_MATERIALS)
+        elif field == 'insulation_material':
+            total = len(INSULATION_MATERIALS)
+        else:
+            total = _SLOT_COUNTS[field]
+        return 1.0 - priority / total
+
+
+_SLOT_COUNTS = {
+    'voltage': len(VOLTAGE_PATTERNS),
+    'current': len(CURRENT_PATTERNS),
+    'conductor_size': len(CONDUCTOR_SIZE_PATTERNS),
+    'length': len(LENGTH_PATTERNS),
+}
+_KEYWORDS = ['conductor'] + CONDUCTOR_MATERIALS + [m.lower() for m in INSULATION_MATERIALS]
+
+
+class SpecExtractionEngine:
+    """
+    Extract all specification fields and testing keywords in one scan
+
+    Produces the same fields as the per-field DocumentAgent extractors, but
+    lowercases the text once and walks it with a single precompiled scanner
+    instead of running a dozen full-document regex searches. Text can also be
+    fed incrementally (e.g. page by page) through feed/finalize.
+    """
+
+    def extract(self, text: str) -> Tuple[Dict[str, Any], Dict[str, List[str]]]:
+        """
+        Extract specification fields and testing requirements
+
+        Args:
+            text: Raw document text
+
+        Returns:
+            Tuple of (specifications dict without raw_text_sample, testing_requirements)
+        """
+        state = ExtractionState()
+        self.feed(state, text)
+        return self.finalize(state)
+
+    def feed(self, state: ExtractionState, text: str) -> None:
+        """
+        Scan one chunk of text and merge its hits into state
+
+        Earlier chunks win for "first match" fields, so chunks must be fed in
+        document order.
+        """
+        text_lower = text.lower()
+        if len(text_lower) != len(text):
+            # 'İ' lowercases to two code points; fold it to 'i' (as re.IGNORECASE
+            # does) so offsets in text_lower line up with text
+            text_lower = text.replace('İ', 'I').lower()
+
+        first = state.first
+        phrases = state.phrases
+
+        for hit in _SCANNER.finditer(text_lower):
+            pos = hit.start()
+            for kind, handler in _DISPATCH.get(text_lower[pos], ()):
+                if kind == 'first':
+                    slot, pattern = handler
+                    if slot in first:
+                        continue
+                    match = pattern.match(text, pos)
+                    if match:
+                        first[slot] = self._slot_value(slot, text, match)
+                elif kind == 'standard':
+                    match = handler.match(text, pos)
+                    if match:
+                        state.standards.add(match.group(0))
+                elif handler not in phrases and text_lower.startswith(handler, pos):
+                    phrases.add(handler)
+
+        for keyword in _KEYWORDS:
+            if keyword not in state.keywords and keyword in text_lower:
+                state.keywords.add(keyword)
+
+    def finalize(self, state: ExtractionState) -> Tuple[Dict[str, Any], Dict[str, List[str]]]:
+        """Build the specifications and testing_requirements dicts from state"""
+        specifications = {
+            'voltage': self._first_of(state, 'voltage'),
+            'current': self._first_of(state, 'current'),
+            'conductor_material': self._conductor_material(state),
+            'insulation_material': self._insulation_material(state),
+            'conductor_size': self._first_of(state, 'conductor_size'),
+            'cable_type': ', '.join(t for t in CABLE_TYPES if t in state.phrases) or None,
+            'length': self._first_of(state, 'length'),
+            'standards': list(state.standards),
+        }
+
+        testing_requirements = {
+            'type_tests': [k for k in TYPE_TEST_KEYWORDS if k in state.phrases],
+            'routine_tests': [k for k in ROUTINE_TEST_KEYWORDS if k in state.phrases],
+            'sample_tests': []
+        }
+
+        return specifications, testing_requirements
+
+    def _slot_value(self, slot: str, text: str, match: re.Match) -> Optional[str]:
+        """Value recorded for a slot's first match"""
+        if slot.startswith('length:'):
+            # Length is only accepted when 'length' appears near the match
+            window = text[max(0, match.start() - 20):match.end() + 20].lower()
+            if 'length' not in window:
+                return None
+        return match.group(0)
+
+    def _first_of(self, state: ExtractionState, field: str) -> Optional[str]:
+        """Earliest match of the highest-priority pattern that matched anywhere"""
+        priority = state.priority(field)
+        if priority is None:
+            return None
+        return state.first[f'{field}:{priority}']
+
+    def _conductor_material(self, state: ExtractionState) -> Optional[str]:
+        priority = state.priority('conductor_material')
+        if priority is None:
+            return None
+        material = CONDUCTOR_MATERIALS[priority]
+        return material.upper() if len(material) <= 2 else material.capitalize()
+
+    def _insulation_material(self, state: ExtractionState) -> Optional[str]:
+        priority = state.priority('insulation_material')
+        if priority is None:
+            return None
+        return INSULATION_MATERIALS[priority]
@@ -0,0 +1,157 @@
+"""
+Line Item Extraction - Turns BOQ tables into per-item specifications
+"""
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+from shared.models import LineItem, Table
+from .extraction import CONDUCTOR_MATERIALS, SpecExtractionEngine
+
+logger = logging.getLogger(__name__)
+
+# Header cell patterns for each column role, checked in this order
+COLUMN_ROLES = [
+    ('item_no', re.compile(r'^(?:s\.?\s?no|sl\.?\s?no|sr\.?\s?no|item\s*no|no)\.?$', re.IGNORECASE)),
+    ('quantity', re.compile(r'\b(?:qty|quantity)\b', re.IGNORECASE)),
+    ('unit', re.compile(r'\b(?:unit|uom)\b', re.IGNORECASE)),
+    ('description', re.compile(r'\b(?:description|item|particulars|specification)\b', re.IGNORECASE)),
+]
+
+# BOQ shorthand for core count: "3C", "3 C x 185" -> "3 core"
+_CORE_SHORTHAND = re.compile(r'\b(\d+)\s*C\b(?=\s*(?:x|×|\*|,|$))', re.IGNORECASE)
+_NUMBER = re.compile(r'\d[\d,]*\.?\d*')
+_MATERIAL_WORDS = [
+    (material, re.compile(rf'\b{material}\b', re.IGNORECASE)) for material in CONDUCTOR_MATERIALS
+]
+
+# Fields that BOQ rows usually omit and that the tender states once for all items
+INHERITED_FIELDS = ['conductor_material', 'insulation_material']
+
+# Fields a row needs at least one of to count as a cable line item
+ITEM_SPEC_FIELDS = ['voltage', 'conductor_size', 'cable_type']
+
+
+def _cell(row: List[Optional[str]], index: Optional[int]) -> str:
+    if index is None or index >= len(row):
+        return ''
+    return ' '.join((row[index] or '').split())
+
+
+def _header_columns(row: List[Optional[str]]) -> Optional[Dict[str, int]]:
+    """Map column roles to indexes if row is a BOQ header row, else None"""
+    columns: Dict[str, int] = {}
+    for index, cell in enumerate(row):
+        text = ' '.join((cell or '').split())
+        if not text:
+            continue
+        for role, pattern in COLUMN_ROLES:
+            if role not in columns and pattern.search(text):
+                columns[role] = index
+                break
+
+    if 'description' in columns and 'quantity' in columns:
+        return columns
+    return None
+
+
+def _parse_quantity(text: str) -> Optional[float]:
+    match = _NUMBER.search(text)
+    if not match:
+        return None
+    try:
+        return float(match.group(0).replace(',', ''))
+    except ValueError:
+        return None
+
+
+class LineItemExtractor:
+    """
+    Extract cable line items from BOQ tables
+
+    Tables are read in page order. A table without its own header row is
+    treated as a continuation of the previous table when the column count
+    matches, so schedules split across pages are read as one.
+    """
+
+    def __init__(self, engine: Optional[SpecExtractionEngine] = None):
+        self.engine = engine or SpecExtractionEngine()
+
+    def extract(
+        self,
+        page_tables: Dict[int, List[Table]],
+        defaults: Optional[Dict[str, Any]] = None
+    ) -> List[LineItem]:
+        """
+        Extract line items from tables
+
+        Args:
+            page_tables: Page index -> tables on that page
+            defaults: Document-level specifications used for INHERITED_FIELDS
+                that a row does not state
+
+        Returns:
+            List of LineItem objects, in document order
+        """
+        items: List[LineItem] = []
+        columns: Optional[Dict[str, int]] = None
+        width = 0
+
+        for page in sorted(page_tables):
+            for table in page_tables[page]:
+                rows = [row for row in table if row and any(row)]
+                if not rows:
+                    continue
+
+                header = _header_columns(rows[0])
+                if header:
+                    columns, width = header, len(rows[0])
+                    rows = rows[1:]
+                elif columns is None or len(rows[0]) != width:
+                    continue
+
+                for row in rows:
+                    item = self._row_to_item(row, columns, page, defaults or {}, len(items) + 1)
+                    if item:
+                        items.append(item)
+
+        logger.info(f"Extracted {len(items)} line items from {len(page_tables)} pages")
+        return items
+
+    def _row_to_item(
+        self,
+        row: List[Optional[str]],
+        columns: Dict[str, int],
+        page: int,
+        defaults: Dict[str, Any],
+        position: int
+    ) -> Optional[LineItem]:
+        """Build a LineItem from one table row, or None if it is not a cable item"""
+        description = _cell(row, columns['description'])
+        quantity = _parse_quantity(_cell(row, columns['quantity']))
+        if not description or quantity is None:
+            return None
+
+        specs, _ = self.engine.extract(_CORE_SHORTHAND.sub(r'\1 core', description))
+        if not any(specs.get(f) for f in ITEM_SPEC_FIELDS):
+            return None
+
+        if not specs.get('conductor_material'):
+            # Rows name the material without the word 'conductor'
+            specs['conductor_material'] = next(
+                (m.upper() if len(m) <= 2 else m.capitalize()
+                 for m, pattern in _MATERIAL_WORDS if pattern.search(description)),
+                None
+            )
+        for field in INHERITED_FIELDS:
+            if not specs.get(field) and defaults.get(field):
+                specs[field] = defaults[field]
+
+        return LineItem(
+            item_no=_cell(row, columns.get('item_no')) or str(position),
+            description=description,
+            quantity=quantity,
+            unit=_cell(row, columns.get('unit')),
+            specifications=specs,
+            page=page
+        )
@@ -0,0 +1,75 @@
+"""
+Table helpers - BOQ page classification and on-demand table extraction
+"""
+import logging
+import re
+from typing import Dict, List
+
+
+from shared.models import Table
+
+logger = logging.getLogger(__name__)
+
+# Headings that mark a bill/schedule of quantities or price schedule
+BOQ_HEADING_PATTERN = re.compile(
+    r'schedule\s+of\s+(?:quantities|requirements|prices|rates)'
+    r'|bill\s+of\s+(?:quantities|materials)'
+    r'|\bboq\b|\bbom\b|price\s+(?:schedule|bid)|financial\s+bid',
+    re.IGNORECASE
+)
+
+# Column headers typical of line-item tables
+COLUMN_HEADER_PATTERN = re.compile(
+    r'\b(?:s\.?\s?no|sl\.?\s?no|item|description|qty|quantity|unit|uom|rate|amount)\b',
+    re.IGNORECASE
+)
+
+# Distinct column headers needed when there is no BOQ heading
+MIN_COLUMN_HEADERS = 3
+
+
+def is_table_page(text: str) -> bool:
+    """
+    Classify a page as a BOQ / schedule-of-quantities page
+
+    Args:
+        text: Extracted page text
+
+    Returns:
+        True if the page is worth running table extraction on
+    """
+    if not text:
+        return False
+
+    if BOQ_HEADING_PATTERN.search(text):
+        return True
+
+    headers = {
+        re.sub(r'[\s.]', '', m.group(0).lower())
+        for m in COLUMN_HEADER_PATTERN.finditer(text)
+    }
+    return len(headers) >= MIN_COLUMN_HEADERS
+
+
+def load_page_tables(pdf_path: str, page_indexes: List[int]) -> Dict[int, List[Table]]:
+    """
+    Extract tables for selected pages, opening the PDF once
+
+    Args:
+        pdf_path: Path to PDF file
+        page_indexes: Zero-based page indexes
+
+    Returns:
+        Mapping of page index to the tables found on that page
+    """
+    # Optional dependency: only table extraction needs it
+    import pdfplumber
+
+    results: Dict[int, List[Table]] = {}
+    with pdfplumber.open(pdf_path) as pdf:
+        for i in sorted(set(page_indexes)):
+            if 0 <= i < len(pdf.pages):
+                results[i] = pdf.pages[i].extract_tables() or []
+
+    logger.info(f"Extracted tables from {len(results)} pages of {pdf_path}")
+    return results
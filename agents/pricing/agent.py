@@ -2,10 +2,10 @@
 Pricing Agent - Calculates pricing for matched products
 """
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
-from shared.models import PricingBreakdown, ProductMatch
+from shared.models import LineItem, PricingBreakdown, ProductMatch
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +77,59 @@ class PricingAgent:
             logger.error(f"Error calculating pricing: {str(e)}")
             return []
     
+    def calculate_line_item_pricing(
+        self,
+        rfp_id: str,
+        line_items: List[LineItem],
+        item_matches: List[List[ProductMatch]],
+        deadline: datetime = None,
+        testing_requirements: List[str] = None
+    ) -> List[PricingBreakdown]:
+        """
+        Price a batch of BOQ line items, each with its own best match and quantity
+        
+        Args:
+            rfp_id: RFP identifier
+            line_items: Line items from DocumentAgent.extract_line_items
+            item_matches: Matches per line item (TechnicalAgent.match_line_items)
+            deadline: RFP deadline
+            testing_requirements: List of required tests
+            
+        Returns:
+            One PricingBreakdown (tagged with item_no) per line item that has a
+            match, in line-item order
+        """
+        try:
+            logger.info(f"Calculating pricing for {len(line_items)} line items of RFP: {rfp_id}")
+            
+            pricing_list = []
+            
+            for item, matches in zip(line_items, item_matches):
+                best = self._best_match(matches)
+                if best is None:
+                    logger.warning(f"No product match for line item {item.item_no} - not priced")
+                    continue
+                
+                pricing = self._calculate_product_pricing(
+                    best,
+                    int(round(item.quantity_in_meters)),
+                    deadline,
+                    testing_requirements or []
+                )
+                pricing.item_no = item.item_no
+                pricing_list.append(pricing)
+            
+            logger.info(f"Calculated pricing for {len(pricing_list)} line items")
+            return pricing_list
+            
+        except Exception as e:
+            logger.error(f"Error calculating line item pricing: {str(e)}")
+            return []
+    
+    def _best_match(self, matches: List[ProductMatch]) -> Optional[ProductMatch]:
+        """Top-ranked match, or None (matches arrive in fused rank order)"""
+        return matches[0] if matches else None
+    
     def _calculate_product_pricing(
         self,
         match: ProductMatch,
@@ -321,7 +374,8 @@ class PricingAgent:
             delivery_cost=pricing.delivery_cost,
             urgency_adjustment=pricing.urgency_adjustment,
             total=round(new_total, 2),
-            currency=pricing.currency
+            currency=pricing.currency,
+            item_no=pricing.item_no
         )
     
     def generate_cost_breakdown_report(
@@ -2,48 +2,63 @@
 Technical Agent - Matches RFP specifications with product catalog
 """
 import logging
-from typing import List, Dict, Any, Optional
+import operator
+from typing import List, Dict, Any, Optional, Tuple
 import json
 
-from shared.models import ProductMatch, Specification
+from shared.embeddings import get_embedding_model, get_query_embedding_cache
+from shared.models import LineItem, ProductMatch, Specification
+from shared.vectors import VectorStorageConfig, get_vector_client, models
+from .catalog import HARD_CONSTRAINT_KEYS, MATCH_KEYS, ProductCatalog, normalize_value
+from .catalog_store import CatalogStore, get_catalog_store
+from .ranking import competition_ranks, reciprocal_rank_fusion
 
 logger = logging.getLogger(__name__)
 
+# Query vectors sent per Qdrant search_batch request
+SEARCH_BATCH_SIZE = 64
+
+# Minimum SpecMatch score for a rule-based match
+MATCH_THRESHOLD = 0.3
+
+# Most pre-filtered SKUs per spec that hybrid matching sends to vector scoring
+HYBRID_CANDIDATES = 100
+
 
 class TechnicalAgent:
     """Agent responsible for matching RFP specs with products"""
     
-    def __init__(self):
+    def __init__(self, catalog_store: Optional[CatalogStore] = None):
         self.name = "TechnicalAgent"
         self.version = "1.0.0"
         self.embedding_model = None
+        self.query_cache = None
         self.vector_db = None
+        # Rescoring of quantized candidates, matching how the products collection was created
+        self.vector_storage = VectorStorageConfig.from_env("PRODUCTS")
+        # Shared, versioned product snapshot; loaded on first match
+        self.catalog_store = catalog_store or get_catalog_store()
         logger.info(f"{self.name} v{self.version} initialized")
     
     
     def initialize_vector_db(self):
-        """Initialize vector database connection (Qdrant)"""
+        """Initialize vector database connection (Qdrant, or the in-process fallback)"""
         try:
-            from qdrant_client import QdrantClient
-            import os
-            
-            host = os.getenv("QDRANT_HOST", "localhost")
-            port = int(os.getenv("QDRANT_PORT", 6333))
-            
-            self.vector_db = QdrantClient(host=host, port=port)
-            logger.info(f"Vector database initialized at {host}:{port}")
+            self.vector_db = get_vector_client()
+            if self.vector_db:
+                logger.info(f"Vector database initialized: {type(self.vector_db).__name__}")
         except Exception as e:
             logger.error(f"Error initializing vector DB: {str(e)}")
     
     
     def initialize_embedding_model(self):
-        """Initialize sentence embedding model"""
+        """Initialize sentence embedding model (shared across the process)"""
         try:
-            from sentence_transformers import SentenceTransformer
             import os
             
             model_name = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
-            self.embedding_model = SentenceTransformer(model_name)
+            self.embedding_model = get_embedding_model(model_name)
+            self.query_cache = get_query_embedding_cache(model_name)
             logger.info(f"Embedding model initialized: {model_name}")
         except Exception as e:
             logger.error(f"Error initializing embedding model: {str(e)}")
@@ -68,20 +83,16 @@ class TechnicalAgent:
         try:
             logger.info(f"Matching products for RFP: {rfp_id}")
             
-            # Create search query from specifications
-            query = self._create_search_query(specifications)
-            
-            # Perform semantic search (hybrid approach)
             matches = []
             
-            # 1. Try Vector Search first if DB initialized
+            # 1. Hybrid ranking (rules + vectors) if DB initialized
             if self.vector_db and self.embedding_model:
                 try:
-                    matches = self.semantic_search(query, top_k)
+                    matches = self._hybrid_matching([specifications], top_k)[0]
                 except Exception as e:
-                    logger.warning(f"Vector search failed, falling back to rules: {e}")
+                    logger.warning(f"Hybrid search failed, falling back to rules: {e}")
             
-            # 2. Fallback or augmentation with rules
+            # 2. Fallback to rules only
             if not matches:
                 matches = self._rule_based_matching(specifications, top_k)
             
@@ -92,6 +103,63 @@ class TechnicalAgent:
             logger.error(f"Error matching products: {str(e)}")
             return []
     
+    def match_line_items(
+        self,
+        rfp_id: str,
+        line_items: List[LineItem],
+        top_k: int = 3
+    ) -> List[List[ProductMatch]]:
+        """
+        Match a batch of BOQ line items against the product catalog
+        
+        Line items with the same matching attributes (e.g. the same cable
+        listed for several feeders) are matched once and share the result.
+        
+        Args:
+            rfp_id: RFP identifier
+            line_items: Line items from DocumentAgent.extract_line_items
+            top_k: Number of top matches per item
+            
+        Returns:
+            One list of ProductMatch objects per line item, in the same order
+        """
+        try:
+            logger.info(f"Matching {len(line_items)} line items for RFP: {rfp_id}")
+            
+            # Distinct specs, in first-seen order
+            specifications: Dict[Tuple, Specification] = {}
+            keys = []
+            for item in line_items:
+                key = tuple(str(item.specifications.get(k) or '') for k in MATCH_KEYS)
+                if key not in specifications:
+                    specifications[key] = Specification(
+                        rfp_id=rfp_id,
+                        specifications=item.specifications,
+                        testing_requirements={},
+                        confidence_score=1.0
+                    )
+                keys.append(key)
+            
+            # One batched hybrid ranking for all distinct specs
+            hybrid_results = [[] for _ in specifications]
+            if self.vector_db and self.embedding_model:
+                try:
+                    hybrid_results = self._hybrid_matching(list(specifications.values()), top_k)
+                except Exception as e:
+                    # Every spec then falls back to rules below
+                    logger.warning(f"Hybrid search failed, falling back to rules: {e}")
+            
+            results: Dict[Tuple, List[ProductMatch]] = {}
+            for (key, spec), matches in zip(specifications.items(), hybrid_results):
+                results[key] = matches or self._rule_based_matching(spec, top_k)
+            
+            logger.info(f"Matched {len(line_items)} line items with {len(results)} distinct specs")
+            return [results[key] for key in keys]
+            
+        except Exception as e:
+            logger.error(f"Error matching line items: {str(e)}")
+            return [[] for _ in line_items]
+    
     def _create_search_query(self, specifications: Specification) -> str:
         """Create search query from specifications"""
         query_parts = []
@@ -122,32 +190,174 @@ class TechnicalAgent:
     ) -> List[ProductMatch]:
         """
         Rule-based product matching (fallback when vector DB not available)
+        
+        Scores only the SKUs the catalog index says can pass the threshold
+        (same scores as _calculate_match_score per product) and drops those
+        violating a hard constraint, as hybrid matching does; alignment is
+        only computed for the returned top_k.
         """
         matches = []
         specs = specifications.specifications
         
-        # Mock product catalog
-        mock_products = self._get_mock_products()
+        catalog = self._get_catalog()
+        indexes, scores = catalog.score(
+            specs,
+            self._normalize_unit,
+            self._normalized_values_match,
+            MATCH_THRESHOLD
+        )
+        keep = catalog.satisfies(indexes, self._hard_constraints(specs))
         
-        for product in mock_products:
-            score = self._calculate_match_score(specs, product['specifications'])
+        for i, score in catalog.top_k(indexes[keep], scores[keep], top_k):
+            product = catalog.products[i]
+            alignment = self._get_specification_alignment(specs, product['specifications'])
             
-            if score > 0.3:  # Threshold
-                alignment = self._get_specification_alignment(specs, product['specifications'])
-                
-                match = ProductMatch(
+            match = ProductMatch(
+                sku=product['sku'],
+                product_name=product['product_name'],
+                match_score=score,
+                specification_alignment=alignment,
+                datasheet_url=product.get('datasheet_url', '')
+            )
+            matches.append(match)
+        
+        return matches
+    
+    def _hybrid_matching(
+        self,
+        specifications: List[Specification],
+        top_k: int
+    ) -> List[List[ProductMatch]]:
+        """
+        Hybrid product matching: attribute pre-filter, vector scoring, rank fusion
+        
+        1. The catalog index keeps the SKUs whose SpecMatch passes
+           MATCH_THRESHOLD (at most HYBRID_CANDIDATES per spec)
+        2. Only those SKUs are scored by vector search (Qdrant filter on sku
+           and the hard constraints), batched across all specs
+        3. Both rankings are fused with reciprocal rank fusion
+        
+        match_score stays the SpecMatch score, which downstream compliance
+        and pricing thresholds are defined on; fusion only decides the order.
+        
+        Args:
+            specifications: Specification objects
+            top_k: Number of top matches per specification
+            
+        Returns:
+            One list of ProductMatch objects per specification, in the same order
+        """
+        catalog = self._get_catalog()
+        
+        # 1. Cheap attribute pre-filter; SKUs violating a hard constraint are
+        #    dropped here, the same ones the vector filter below excludes
+        candidates = []
+        for spec in specifications:
+            indexes, scores = catalog.score(
+                spec.specifications,
+                self._normalize_unit,
+                self._normalized_values_match,
+                MATCH_THRESHOLD
+            )
+            keep = catalog.satisfies(indexes, self._hard_constraints(spec.specifications))
+            candidates.append(catalog.top_k(indexes[keep], scores[keep], HYBRID_CANDIDATES))
+        
+        # 2. Vector scoring of the survivors
+        searchable = [i for i, scored in enumerate(candidates) if scored]
+        vector_hits = self.semantic_search_many(
+            [self._create_search_query(specifications[i]) for i in searchable],
+            top_k=HYBRID_CANDIDATES,
+            filters=[
+                self._payload_filter(
+                    specifications[i].specifications,
+                    skus=[catalog.products[idx]['sku'] for idx, _ in candidates[i]]
+                )
+                for i in searchable
+            ]
+        )
+        hits_by_spec = dict(zip(searchable, vector_hits))
+        
+        # 3. Rank fusion
+        results = []
+        for i, (spec, scored) in enumerate(zip(specifications, candidates)):
+            rule_scores = {idx: score for idx, score in scored}
+            sku_index = {catalog.products[idx]['sku']: idx for idx, _ in scored}
+            vector_ranked = [
+                (sku_index[hit['sku']], hit['relevance_score'])
+                for hit in hits_by_spec.get(i, []) if hit.get('sku') in sku_index
+            ]
+            fused = reciprocal_rank_fusion([
+                competition_ranks(scored),
+                competition_ranks(vector_ranked)
+            ])
+            
+            matches = []
+            for idx, _ in fused[:top_k]:
+                product = catalog.products[idx]
+                matches.append(ProductMatch(
                     sku=product['sku'],
                     product_name=product['product_name'],
-                    match_score=score,
-                    specification_alignment=alignment,
+                    match_score=rule_scores[idx],
+                    specification_alignment=self._get_specification_alignment(
+                        spec.specifications, product['specifications']
+                    ),
                     datasheet_url=product.get('datasheet_url', '')
-                )
-                matches.append(match)
+                ))
+            results.append(matches)
+        
+        logger.info(
+            f"Hybrid matching: {len(specifications)} specs, "
+            f"{sum(len(c) for c in candidates)} candidates scored of {catalog.size} SKUs each"
+        )
+        return results
+    
+    def _payload_filter(
+        self,
+        specs: Dict[str, Any],
+        skus: Optional[List[str]] = None
+    ) -> Optional[Any]:
+        """
+        Qdrant filter for the hard constraints of a spec (and optional SKUs)
+        
+        Each HARD_CONSTRAINT_KEYS value becomes a MatchAny over the catalog's
+        canonical values it matches, against the 'normalized' payload written
+        by product_loader, so '11 kV' and '11kV' filter alike.
+        """
+        conditions = [
+            models.FieldCondition(key=f"normalized.{key}", match=models.MatchAny(any=accepted))
+            for key, accepted in self._hard_constraints(specs).items()
+        ]
         
-        # Sort by match score
-        matches.sort(key=lambda x: x.match_score, reverse=True)
+        if skus is not None:
+            conditions.append(models.FieldCondition(key='sku', match=models.MatchAny(any=skus)))
         
-        return matches[:top_k]
+        return models.Filter(must=conditions) if conditions else None
+    
+    def _hard_constraints(self, specs: Dict[str, Any]) -> Dict[str, List[str]]:
+        """
+        Accepted canonical catalog values per HARD_CONSTRAINT_KEYS key of a spec
+        
+        Hard constraints compare canonical values for equality: the substring
+        fallback of _normalized_values_match would let '11kV' accept 1 kV
+        ('1000.0' in '11000.0') and 'PE' accept XLPE. A constraint no catalog
+        value satisfies is left out rather than excluding every product.
+        """
+        catalog = self._get_catalog()
+        constraints = {}
+        for key in HARD_CONSTRAINT_KEYS:
+            rfp_val = specs.get(key)
+            if not rfp_val:
+                continue
+            accepted = catalog.matching_values(key, rfp_val, self._normalize_unit, operator.eq)
+            if accepted:
+                constraints[key] = accepted
+            else:
+                logger.debug(f"No catalog value matches {key}={rfp_val}; not filtering on it")
+        return constraints
+    
+    def _get_catalog(self) -> ProductCatalog:
+        """Current indexed snapshot of the product catalog"""
+        return self.catalog_store.get_catalog()
     
     def _calculate_match_score(
         self,
@@ -161,13 +371,7 @@ class TechnicalAgent:
         match_count = 0
         total_params = 0
         
-        # Keys to check
-        check_keys = [
-            'voltage', 'conductor_size', 'conductor_material', 
-            'insulation_material', 'cable_type'
-        ]
-        
-        for key in check_keys:
+        for key in MATCH_KEYS:
             rfp_val = rfp_specs.get(key)
             if rfp_val:
                 total_params += 1
@@ -186,26 +390,7 @@ class TechnicalAgent:
         Normalize technical values
         e.g. '11 kV' -> '11000', '185sqmm' -> '185'
         """
-        if not value: return ""
-        val = str(value).lower().replace(" ", "")
-        
-        # KV -> V
-        if 'kv' in val:
-            import re
-            nums = re.findall(r'(\d+\.?\d*)', val)
-            if nums:
-                try:
-                    return str(float(nums[0]) * 1000)
-                except: pass
-                
-        # MM2/SQMM -> Raw number
-        if 'mm' in val or 'sq' in val:
-            import re
-            nums = re.findall(r'(\d+\.?\d*)', val)
-            if nums:
-                return nums[0]
-                
-        return val
+        return normalize_value(value)
 
     def _specs_match_normalized(self, rfp_val: str, prod_val: str) -> bool:
         """Match using normalized values"""
@@ -214,10 +399,18 @@ class TechnicalAgent:
         # Try direct match first
         if str(rfp_val).lower() == str(prod_val).lower(): return True
         
-        # Try normalized match
-        norm_rfp = self._normalize_unit(rfp_val)
-        norm_prod = self._normalize_unit(prod_val)
+        return self._normalized_values_match(
+            self._normalize_unit(rfp_val),
+            self._normalize_unit(prod_val)
+        )
+    
+    def _normalized_values_match(self, norm_rfp: str, norm_prod: str) -> bool:
+        """
+        Match already-normalized values
         
+        A case-insensitive direct match always normalizes to equal values, so
+        this alone decides matches against the catalog's canonical values.
+        """
         if norm_rfp and norm_prod and norm_rfp == norm_prod:
             return True
             
@@ -254,120 +447,100 @@ class TechnicalAgent:
         
         return alignment
     
-    def _get_mock_products(self) -> List[Dict[str, Any]]:
-        """Get mock product catalog for testing"""
-        return [
-            {
-                'sku': 'XLPE-11KV-185',
-                'product_name': '11kV XLPE Cable 185 sq mm',
-                'specifications': {
-                    'voltage': '11kV',
-                    'conductor_material': 'Copper',
-                    'insulation_material': 'XLPE',
-                    'conductor_size': '185 sq mm',
-                    'cable_type': '3 core, armoured',
-                    'standards': ['IEC 60502', 'IS 7098']
-                },
-                'datasheet_url': 'http://example.com/datasheets/xlpe-11kv-185.pdf'
-            },
-            {
-                'sku': 'XLPE-11KV-240',
-                'product_name': '11kV XLPE Cable 240 sq mm',
-                'specifications': {
-                    'voltage': '11kV',
-                    'conductor_material': 'Copper',
-                    'insulation_material': 'XLPE',
-                    'conductor_size': '240 sq mm',
-                    'cable_type': '3 core, armoured',
-                    'standards': ['IEC 60502', 'IS 7098']
-                },
-                'datasheet_url': 'http://example.com/datasheets/xlpe-11kv-240.pdf'
-            },
-            {
-                'sku': 'XLPE-33KV-185',
-                'product_name': '33kV XLPE Cable 185 sq mm',
-                'specifications': {
-                    'voltage': '33kV',
-                    'conductor_material': 'Copper',
-                    'insulation_material': 'XLPE',
-                    'conductor_size': '185 sq mm',
-                    'cable_type': '3 core, armoured',
-                    'standards': ['IEC 60502', 'IS 7098']
-                },
-                'datasheet_url': 'http://example.com/datasheets/xlpe-33kv-185.pdf'
-            },
-            {
-                'sku': 'PVC-1.1KV-50',
-                'product_name': '1.1kV PVC Cable 50 sq mm',
-                'specifications': {
-                    'voltage': '1.1kV',
-                    'conductor_material': 'Copper',
-                    'insulation_material': 'PVC',
-                    'conductor_size': '50 sq mm',
-                    'cable_type': '4 core',
-                    'standards': ['IEC 60227', 'IS 694']
-                },
-                'datasheet_url': 'http://example.com/datasheets/pvc-1.1kv-50.pdf'
-            },
-            {
-                'sku': 'XLPE-11KV-300',
-                'product_name': '11kV XLPE Cable 300 sq mm',
-                'specifications': {
-                    'voltage': '11kV',
-                    'conductor_material': 'Aluminium',
-                    'insulation_material': 'XLPE',
-                    'conductor_size': '300 sq mm',
-                    'cable_type': '3 core, armoured',
-                    'standards': ['IEC 60502', 'IS 7098']
-                },
-                'datasheet_url': 'http://example.com/datasheets/xlpe-11kv-300-al.pdf'
-            }
-        ]
-    
-    def semantic_search(self, query: str, top_k: int = 10) -> List[Dict[str, Any]]:
+    def semantic_search(
+        self,
+        query: str,
+        top_k: int = 10,
+        specifications: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Perform semantic search in product catalog
         
         Args:
             query: Search query
             top_k: Number of results to return
+            specifications: Optional RFP specs whose hard constraints (voltage
+                class, conductor material, insulation) filter the search
             
         Returns:
             List of matching products
         """
+        logger.info(f"Performing semantic search: {query}")
+        filters = [self._payload_filter(specifications)] if specifications else None
+        return self.semantic_search_many([query], top_k, filters=filters)[0]
+    
+    def semantic_search_many(
+        self,
+        queries: List[str],
+        top_k: int = 10,
+        filters: Optional[List[Any]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Perform semantic search for many queries at once
+        
+        All queries are embedded in one batched forward pass and sent to
+        Qdrant as batch search requests instead of one round-trip per query.
+        
+        Args:
+            queries: Search queries
+            top_k: Number of results to return per query
+            filters: Optional Qdrant payload filter per query
+            
+        Returns:
+            One list of matching products per query, in the same order
+        """
         try:
-            logger.info(f"Performing semantic search: {query}")
+            if not queries:
+                return []
             
             if not self.vector_db or not self.embedding_model:
                 logger.warning("Vector DB or Model not initialized")
-                return []
-                
+                return [[] for _ in queries]
+            
             import os
             collection_name = os.getenv("QDRANT_COLLECTION", "products")
             
-            # Generate embedding
-            vector = self.embedding_model.encode(query).tolist()
+            # Generate embeddings (cached queries skip the model; the rest in one batched pass)
+            if self.query_cache:
+                vectors = self.query_cache.encode(self.embedding_model, queries)
+            else:
+                vectors = self.embedding_model.encode(queries, convert_to_numpy=True)
             
             # Search Qdrant
-            search_result = self.vector_db.search(
-                collection_name=collection_name,
-                query_vector=vector,
-                limit=top_k
-            )
+            search_params = self.vector_storage.search_params(models)
+            search_results = []
+            for start in range(0, len(queries), SEARCH_BATCH_SIZE):
+                requests = [
+                    models.SearchRequest(
+                        vector=vector.tolist(),
+                        filter=filters[start + offset] if filters else None,
+                        limit=top_k,
+                        with_payload=True,
+                        params=search_params
+                    )
+                    for offset, vector in enumerate(vectors[start:start + SEARCH_BATCH_SIZE])
+                ]
+                search_results.extend(
+                    self.vector_db.search_batch(collection_name=collection_name, requests=requests)
+                )
             
             results = []
-            for hit in search_result:
-                payload = hit.payload
-                # Add match score to payload for consistency
-                payload['relevance_score'] = hit.score
-                # Add dummy datasheet if missing
-                if 'datasheet_url' not in payload:
-                    payload['datasheet_url'] = ''
+            for hits in search_results:
+                products = []
+                for hit in hits:
+                    payload = hit.payload
+                    # Add match score to payload for consistency
+                    payload['relevance_score'] = hit.score
+                    # Add dummy datasheet if missing
+                    if 'datasheet_url' not in payload:
+                        payload['datasheet_url'] = ''
                     
-                results.append(payload)
-                
+                    products.append(payload)
+                results.append(products)
+            
+            logger.info(f"Semantic search: {len(queries)} queries in {-(-len(queries) // SEARCH_BATCH_SIZE)} batches")
             return results
             
         except Exception as e:
             logger.error(f"Error in semantic search: {str(e)}")
-            return []
+            return [[] for _ in queries]
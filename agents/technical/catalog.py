@@ -0,0 +1,216 @@
+"""
+Product Catalog - Normalized-attribute index for vectorized matching
+"""
+import logging
+import re
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Specification fields that decide a match; line items equal on these share results
+MATCH_KEYS = [
+    'voltage', 'conductor_size', 'conductor_material',
+    'insulation_material', 'cable_type'
+]
+
+# Attributes a product must satisfy to be eligible at all (exact canonical
+# value); pushed into vector search as payload filters on normalized values
+HARD_CONSTRAINT_KEYS = ['voltage', 'conductor_material', 'insulation_material']
+
+# Code for a missing / empty product attribute; never matches
+MISSING = -1
+
+# Bumped whenever the product data changes; catalogs built earlier are stale
+_generation = 0
+
+_NUMBER_PATTERN = re.compile(r'(\d+\.?\d*)')
+
+
+def normalize_value(value: Any) -> str:
+    """
+    Normalize a technical value to its canonical form
+    e.g. '11 kV' -> '11000.0', '185sqmm' -> '185', 'Copper' -> 'copper'
+    """
+    if not value: return ""
+    val = str(value).lower().replace(" ", "")
+    
+    # KV -> V
+    if 'kv' in val:
+        nums = _NUMBER_PATTERN.findall(val)
+        if nums:
+            try:
+                return str(float(nums[0]) * 1000)
+            except ValueError:
+                pass
+            
+    # MM2/SQMM -> Raw number
+    if 'mm' in val or 'sq' in val:
+        nums = _NUMBER_PATTERN.findall(val)
+        if nums:
+            return nums[0]
+            
+    return val
+
+
+def invalidate_catalogs() -> None:
+    """Mark every ProductCatalog built so far as stale (call after product updates)"""
+    global _generation
+    _generation += 1
+    logger.info(f"Product catalogs invalidated (generation {_generation})")
+
+
+def catalog_generation() -> int:
+    """Current product data generation"""
+    return _generation
+
+
+class ProductCatalog:
+    """
+    Product catalog indexed by canonical (normalized) attribute values
+
+    Product values are normalized once at build time, e.g. '11 kV' and
+    '11kV' both become the voltage class '11000.0' and '185sqmm' the size
+    '185'. Per attribute the index keeps:
+
+    - the distinct canonical values and an int32 code column per SKU
+    - an inverted index: canonical value -> sorted SKU indexes
+
+    Scoring an RFP compares its value against each distinct canonical value
+    once, then only touches the SKUs in the posting lists of values that
+    matched, so SKUs sharing nothing with the RFP are never scored.
+    """
+
+    def __init__(
+        self,
+        products: List[Dict[str, Any]],
+        match_keys: List[str],
+        normalize: Callable[[Any], str] = normalize_value
+    ):
+        self.products = products
+        self.match_keys = match_keys
+        self.size = len(products)
+        # key -> distinct canonical values, per-SKU codes, and posting lists
+        self.values: Dict[str, List[str]] = {}
+        self.codes: Dict[str, np.ndarray] = {}
+        self.postings: Dict[str, List[np.ndarray]] = {}
+
+        for key in match_keys:
+            lookup: Dict[str, int] = {}
+            # Raw values repeat across SKUs; normalize each distinct one once
+            raw_codes: Dict[str, int] = {}
+            codes = np.full(self.size, MISSING, dtype=np.int32)
+            for i, product in enumerate(products):
+                value = product['specifications'].get(key)
+                if not value:
+                    continue
+                raw = str(value)
+                code = raw_codes.get(raw)
+                if code is None:
+                    code = raw_codes[raw] = lookup.setdefault(normalize(raw), len(lookup))
+                codes[i] = code
+
+            # Group SKU indexes by code; a stable sort keeps each list in catalog order
+            order = np.argsort(codes, kind='stable').astype(np.int32)
+            counts = np.bincount(codes[codes != MISSING], minlength=len(lookup))
+            start = int(np.count_nonzero(codes == MISSING))
+            self.postings[key] = np.split(order[start:], np.cumsum(counts)[:-1]) if len(lookup) else []
+
+            self.values[key] = list(lookup)
+            self.codes[key] = codes
+
+        logger.info(
+            f"Product catalog indexed: {self.size} SKUs, "
+            + ', '.join(f"{k}={len(v)}" for k, v in self.values.items())
+        )
+
+    def matching_values(
+        self,
+        key: str,
+        rfp_value: Any,
+        normalize: Callable[[Any], str],
+        values_match: Callable[[str, str], bool]
+    ) -> List[str]:
+        """Canonical catalog values of key that match an RFP value"""
+        norm_rfp = normalize(rfp_value)
+        return [value for value in self.values.get(key, []) if values_match(norm_rfp, value)]
+    
+    def satisfies(self, indexes: np.ndarray, constraints: Dict[str, List[str]]) -> np.ndarray:
+        """
+        Boolean mask of the SKUs whose value for every constrained key is
+        one of the accepted canonical values (a missing value fails)
+        """
+        keep = np.ones(len(indexes), dtype=bool)
+        for key, accepted in constraints.items():
+            accepted = set(accepted)
+            codes = [code for code, value in enumerate(self.values[key]) if value in accepted]
+            keep &= np.isin(self.codes[key][indexes], codes)
+        return keep
+
+    def score(
+        self,
+        rfp_specs: Dict[str, Any],
+        normalize: Callable[[Any], str],
+        values_match: Callable[[str, str], bool],
+        threshold: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Equal-weight SpecMatch score of the SKUs that can pass threshold
+
+        Args:
+            rfp_specs: RFP specification dict
+            normalize: Normalizer used at build time, applied to RFP values
+            values_match: Comparison of (normalized RFP value, canonical product value)
+            threshold: Scores must be strictly greater to be returned
+
+        Returns:
+            Tuple of (SKU indexes in catalog order, float64 scores)
+        """
+        matched_postings = []
+        total_params = 0
+
+        for key in self.match_keys:
+            rfp_val = rfp_specs.get(key)
+            if not rfp_val:
+                continue
+            total_params += 1
+
+            norm_rfp = normalize(rfp_val)
+            postings = [
+                posting for value, posting in zip(self.values[key], self.postings[key])
+                if values_match(norm_rfp, value)
+            ]
+            if postings:
+                matched_postings.append(np.concatenate(postings))
+
+        empty = (np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float64))
+        if total_params == 0 or not matched_postings:
+            return empty
+
+        # Fewest matched attributes a SKU needs to score above threshold
+        min_matches = next(
+            (m for m in range(1, total_params + 1) if m / total_params > threshold),
+            None
+        )
+        if min_matches is None or min_matches > len(matched_postings):
+            return empty
+
+        indexes, matched = np.unique(np.concatenate(matched_postings), return_counts=True)
+        keep = matched >= min_matches
+        return indexes[keep], matched[keep] / total_params
+
+    def top_k(self, indexes: np.ndarray, scores: np.ndarray, k: int) -> List[Tuple[int, float]]:
+        """
+        The k best (SKU index, score) pairs
+
+        indexes must be in catalog order; ties keep that order, as a stable
+        sort of the catalog would.
+        """
+        if scores.size > k > 0:
+            # Narrow to scores >= the k-th best before sorting (keeps all ties)
+            kth = np.partition(scores, -k)[-k]
+            keep = scores >= kth
+            indexes, scores = indexes[keep], scores[keep]
+        order = np.argsort(-scores, kind='stable')[:k]
+        return [(int(indexes[i]), float(scores[i])) for i in order]
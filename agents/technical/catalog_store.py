@@ -0,0 +1,297 @@
+"""
+Catalog Store - Process-wide, versioned product catalog snapshot from PostgreSQL
+"""
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from shared.database.connection import get_db_manager
+from .catalog import MATCH_KEYS, ProductCatalog, catalog_generation
+
+logger = logging.getLogger(__name__)
+
+_PRODUCT_COLUMNS = """
+    SELECT sku, product_name, specifications, datasheet_url,
+           unit_price, stock_status, updated_at
+    FROM products
+"""
+
+# Catalog used when PostgreSQL is not available (local development, demos)
+FALLBACK_PRODUCTS: List[Dict[str, Any]] = [
+    {
+        'sku': 'XLPE-11KV-185',
+        'product_name': '11kV XLPE Cable 185 sq mm',
+        'specifications': {
+            'voltage': '11kV',
+            'conductor_material': 'Copper',
+            'insulation_material': 'XLPE',
+            'conductor_size': '185 sq mm',
+            'cable_type': '3 core, armoured',
+            'standards': ['IEC 60502', 'IS 7098']
+        },
+        'datasheet_url': 'http://example.com/datasheets/xlpe-11kv-185.pdf'
+    },
+    {
+        'sku': 'XLPE-11KV-240',
+        'product_name': '11kV XLPE Cable 240 sq mm',
+        'specifications': {
+            'voltage': '11kV',
+            'conductor_material': 'Copper',
+            'insulation_material': 'XLPE',
+            'conductor_size': '240 sq mm',
+            'cable_type': '3 core, armoured',
+            'standards': ['IEC 60502', 'IS 7098']
+        },
+        'datasheet_url': 'http://example.com/datasheets/xlpe-11kv-240.pdf'
+    },
+    {
+        'sku': 'XLPE-33KV-185',
+        'product_name': '33kV XLPE Cable 185 sq mm',
+        'specifications': {
+            'voltage': '33kV',
+            'conductor_material': 'Copper',
+            'insulation_material': 'XLPE',
+            'conductor_size': '185 sq mm',
+            'cable_type': '3 core, armoured',
+            'standards': ['IEC 60502', 'IS 7098']
+        },
+        'datasheet_url': 'http://example.com/datasheets/xlpe-33kv-185.pdf'
+    },
+    {
+        'sku': 'PVC-1.1KV-50',
+        'product_name': '1.1kV PVC Cable 50 sq mm',
+        'specifications': {
+            'voltage': '1.1kV',
+            'conductor_material': 'Copper',
+            'insulation_material': 'PVC',
+            'conductor_size': '50 sq mm',
+            'cable_type': '4 core',
+            'standards': ['IEC 60227', 'IS 694']
+        },
+        'datasheet_url': 'http://example.com/datasheets/pvc-1.1kv-50.pdf'
+    },
+    {
+        'sku': 'XLPE-11KV-300',
+        'product_name': '11kV XLPE Cable 300 sq mm',
+        'specifications': {
+            'voltage': '11kV',
+            'conductor_material': 'Aluminium',
+            'insulation_material': 'XLPE',
+            'conductor_size': '300 sq mm',
+            'cable_type': '3 core, armoured',
+            'standards': ['IEC 60502', 'IS 7098']
+        },
+        'datasheet_url': 'http://example.com/datasheets/xlpe-11kv-300-al.pdf'
+    }
+]
+
+
+def _row_to_product(row) -> Dict[str, Any]:
+    return {
+        'sku': row[0],
+        'product_name': row[1],
+        'specifications': row[2] if row[2] else {},
+        'datasheet_url': row[3] or '',
+        'unit_price': float(row[4]) if row[4] else 0.0,
+        'stock_status': row[5]
+    }
+
+
+class CatalogStore:
+    """
+    Versioned in-memory snapshot of the products table, shared across requests
+
+    The first get_catalog() loads every product once. Later calls return the
+    current snapshot and, at most every refresh_seconds (or right after
+    invalidate_catalogs()), pull only rows whose updated_at moved past the
+    last seen value, plus the list of SKUs to drop deleted ones. Each change builds a new immutable ProductCatalog and
+    bumps version; requests already holding the old snapshot keep using it.
+    """
+
+    def __init__(
+        self,
+        products: Optional[List[Dict[str, Any]]] = None,
+        refresh_seconds: Optional[float] = None,
+        overlap_seconds: Optional[float] = None
+    ):
+        """
+        Args:
+            products: Static product list; when given the store never reads the database
+            refresh_seconds: Minimum interval between incremental refreshes
+            overlap_seconds: Re-read window before the last updated_at, so rows
+                committed late with an older timestamp are not missed
+        """
+        self.refresh_seconds = refresh_seconds if refresh_seconds is not None else float(
+            os.getenv("CATALOG_REFRESH_SECONDS", 60)
+        )
+        self.overlap = timedelta(seconds=overlap_seconds if overlap_seconds is not None else float(
+            os.getenv("CATALOG_REFRESH_OVERLAP_SECONDS", 60)
+        ))
+        self.static = products is not None
+        self.version = 0
+        self.source = 'static' if self.static else None
+
+        self._lock = Lock()
+        self._products: Dict[str, Dict[str, Any]] = {}
+        self._catalog: Optional[ProductCatalog] = None
+        self._watermark: Optional[datetime] = None
+        self._last_refresh = 0.0
+        self._generation = catalog_generation()
+
+        if self.static:
+            self._publish({p['sku']: p for p in products})
+
+    def get_catalog(self) -> ProductCatalog:
+        """Current catalog snapshot, refreshed from the database when due"""
+        if self._catalog is None:
+            with self._lock:
+                if self._catalog is None:
+                    self._full_load()
+            return self._catalog
+
+        if not self.static and self._refresh_due() and self._lock.acquire(blocking=False):
+            # Another request already refreshing keeps serving the current snapshot
+            try:
+                self._incremental_refresh()
+            finally:
+                self._lock.release()
+
+        return self._catalog
+
+    def _refresh_due(self) -> bool:
+        return (
+            self._generation != catalog_generation()
+            or time.monotonic() - self._last_refresh >= self.refresh_seconds
+        )
+
+    def _publish(self, products: Dict[str, Dict[str, Any]]) -> None:
+        """Swap in a new snapshot built from products keyed by SKU"""
+        self._products = products
+        # Database snapshots are in SKU order so ties rank the same in every
+        # process; static and fallback lists keep their given order
+        if self.source == 'postgres':
+            ordered = [products[sku] for sku in sorted(products)]
+        else:
+            ordered = list(products.values())
+        self._catalog = ProductCatalog(ordered, MATCH_KEYS)
+        self.version += 1
+        logger.info(f"Product catalog snapshot v{self.version}: {len(ordered)} SKUs ({self.source})")
+
+    def _mark_refreshed(self) -> None:
+        self._last_refresh = time.monotonic()
+        self._generation = catalog_generation()
+
+    def _full_load(self) -> None:
+        """Load every product, falling back to FALLBACK_PRODUCTS without a database"""
+        self._mark_refreshed()
+        if self.static:
+            return
+
+        db = get_db_manager()
+        if not db:
+            logger.warning("Database unavailable - using fallback product catalog")
+            self._use_fallback()
+            return
+
+        try:
+            with db.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(_PRODUCT_COLUMNS)
+                    rows = cursor.fetchall()
+        except Exception as e:
+            logger.error(f"Error loading product catalog: {str(e)}")
+            self._use_fallback()
+            return
+
+        self.source = 'postgres'
+        self._watermark = max((row[6] for row in rows if row[6]), default=None)
+        self._publish({row[0]: _row_to_product(row) for row in rows})
+
+    def _use_fallback(self) -> None:
+        if self.source == 'fallback' and self._catalog is not None:
+            return
+        self.source = 'fallback'
+        self._watermark = None
+        self._publish({p['sku']: p for p in FALLBACK_PRODUCTS})
+
+    def _incremental_refresh(self) -> None:
+        """Apply rows changed since the last refresh and drop deleted SKUs"""
+        if self.source != 'postgres':
+            # Started without a database; retry the full load
+            self._full_load()
+            return
+
+        self._mark_refreshed()
+        db = get_db_manager()
+        if not db:
+            return
+
+        try:
+            with db.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    if self._watermark is None:
+                        cursor.execute(_PRODUCT_COLUMNS)
+                    else:
+                        cursor.execute(
+                            _PRODUCT_COLUMNS + " WHERE updated_at > %s",
+                            (self._watermark - self.overlap,)
+                        )
+                    rows = cursor.fetchall()
+                    # Deleted rows leave no updated_at behind; compare SKU sets
+                    # (a count would miss a delete plus an insert). Read after
+                    # the changes, so a row inserted in between forces a reload
+                    # instead of looking deleted
+                    cursor.execute("SELECT sku FROM products")
+                    current_skus = {row[0] for row in cursor.fetchall()}
+        except Exception as e:
+            logger.warning(f"Product catalog refresh failed, keeping v{self.version}: {e}")
+            return
+
+        changed = {}
+        for row in rows:
+            product = _row_to_product(row)
+            if self._products.get(product['sku']) != product:
+                changed[product['sku']] = product
+        
+        stamps = [row[6] for row in rows if row[6]]
+        if self._watermark:
+            stamps.append(self._watermark)
+        self._watermark = max(stamps, default=None)
+
+        products = {**self._products, **changed}
+        if not current_skus <= products.keys():
+            # Rows we have no data for (e.g. committed behind the overlap window)
+            logger.info("Products missing from the incremental refresh - reloading catalog")
+            self._full_load()
+            return
+
+        deleted = products.keys() - current_skus
+        for sku in deleted:
+            del products[sku]
+
+        if changed or deleted:
+            logger.info(f"Product catalog refresh: {len(changed)} changed, {len(deleted)} deleted SKUs")
+            self._publish(products)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot version, size and source"""
+        return {
+            'version': self.version,
+            'source': self.source,
+            'products': len(self._products),
+            'watermark': self._watermark.isoformat() if self._watermark else None
+        }
+
+
+_catalog_store = None
+
+
+def get_catalog_store() -> CatalogStore:
+    """Get the process-wide catalog store"""
+    global _catalog_store
+    if _catalog_store is None:
+        _catalog_store = CatalogStore()
+    return _catalog_store
@@ -17,6 +17,7 @@ load_dotenv()
 
 from shared.database.connection import get_db_connection
 from shared.models import ProductMatch
+from agents.technical.catalog import HARD_CONSTRAINT_KEYS, MATCH_KEYS, invalidate_catalogs, normalize_value
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -139,6 +140,9 @@ def load_products_postgres(products: List[Dict[str, Any]]):
         cursor.close()
         conn.close()
         logger.info("PostgreSQL load successful.")
+        
+        # Product attributes changed; matchers rebuild their catalog index
+        invalidate_catalogs()
         return True
     except Exception as e:
         logger.error(f"Error loading Postgres: {e}")
@@ -147,36 +151,47 @@ def load_products_postgres(products: List[Dict[str, Any]]):
 def load_products_qdrant(products: List[Dict[str, Any]]):
     """Load products into Qdrant"""
     try:
-        from qdrant_client import QdrantClient
-        from qdrant_client.http import models
-        from sentence_transformers import SentenceTransformer
+        from shared.embeddings import get_embedding_model
+        from shared.vectors import VectorStorageConfig, get_vector_client, models
         
-        # Connect to Qdrant
-        host = os.getenv("QDRANT_HOST", "localhost")
-        port = int(os.getenv("QDRANT_PORT", 6333))
-        client = QdrantClient(host=host, port=port)
+        # Connect to Qdrant (or the in-process index when it isn't running)
+        client = get_vector_client()
+        if client is None:
+            logger.error("No vector store available")
+            return False
         
         collection_name = os.getenv("QDRANT_COLLECTION", "products")
         
         # Initialize embedding model
         model_name = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
         logger.info(f"Loading embedding model: {model_name}...")
-        model = SentenceTransformer(model_name)
+        model = get_embedding_model(model_name)
         
         # Create collection if likely not exists (or recreate)
         collections = client.get_collections().collections
         exists = any(c.name == collection_name for c in collections)
         
         if not exists:
-            logger.info(f"Creating collection {collection_name}...")
+            # Quantization / on-disk settings (PRODUCTS_VECTOR_* over VECTOR_*)
+            storage = VectorStorageConfig.from_env("PRODUCTS")
+            logger.info(f"Creating collection {collection_name} ({storage.describe()})...")
             client.create_collection(
                 collection_name=collection_name,
-                vectors_config=models.VectorParams(
+                **storage.create_kwargs(
+                    models,
                     size=384,  # all-MiniLM-L6-v2 output size
                     distance=models.Distance.COSINE
                 )
             )
         
+        # Keyword indexes so filtered searches only visit eligible points
+        for field in ['sku'] + [f"normalized.{key}" for key in HARD_CONSTRAINT_KEYS]:
+            client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field,
+                field_schema=models.PayloadSchemaType.KEYWORD
+            )
+        
         logger.info("Generating embeddings and uploading to Qdrant...")
         
         points = []
@@ -193,7 +208,12 @@ def load_products_qdrant(products: List[Dict[str, Any]]):
                 payload={
                     "sku": p['sku'],
                     "product_name": p['product_name'],
-                    "specifications": p['specifications']
+                    "specifications": p['specifications'],
+                    # Canonical values for payload filtering ('11 kV' -> '11000.0')
+                    "normalized": {
+                        key: normalize_value(specs[key])
+                        for key in MATCH_KEYS if specs.get(key)
+                    }
                 }
             ))
             
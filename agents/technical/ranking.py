@@ -0,0 +1,40 @@
+"""
+Ranking - Rank fusion helpers for hybrid (rule + vector) product matching
+"""
+from typing import Dict, Hashable, List, Sequence, Tuple
+
+# Reciprocal rank fusion damping constant (Cormack et al. use 60)
+RRF_K = 60
+
+
+def competition_ranks(scored: Sequence[Tuple[Hashable, float]]) -> Dict[Hashable, int]:
+    """
+    1-based ranks of (key, score) pairs sorted best first; equal scores share
+    a rank ("1, 1, 3"), so ties are left for the other rankings to break
+    """
+    ranks = {}
+    previous = None
+    for position, (key, score) in enumerate(scored, start=1):
+        if previous is None or score != previous[1]:
+            previous = (position, score)
+        ranks[key] = previous[0]
+    return ranks
+
+
+def reciprocal_rank_fusion(rankings: List[Dict[Hashable, int]], k: int = RRF_K) -> List[Tuple[Hashable, float]]:
+    """
+    Fuse several rankings: score(d) = sum over rankings of 1 / (k + rank(d))
+
+    Args:
+        rankings: key -> 1-based rank, one dict per ranker; keys missing
+            from a ranking get no contribution from it
+        k: Damping constant
+
+    Returns:
+        (key, fused score) pairs, best first; ties keep first-seen order
+    """
+    fused: Dict[Hashable, float] = {}
+    for ranking in rankings:
+        for key, rank in ranking.items():
+            fused[key] = fused.get(key, 0.0) + 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda item: -item[1])
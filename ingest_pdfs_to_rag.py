@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from shared.rag import get_rag_service
+from shared.rag import get_ingestion_queue, get_rag_service
 from shared.database.connection import get_db_connection
 from orchestrator.config import settings
 
@@ -36,6 +36,48 @@ def ingest_existing_pdfs():
     
     logger.info("✅ RAG service initialized")
     
+    # Documents are ingested by the background queue (RAG_INGEST_WORKERS at a time)
+    queue = get_ingestion_queue()
+    jobs = []
+    # Submitted (pinned) jobs not reported yet; results are collected while
+    # submitting, and released once read so the queue may forget them
+    pending = {}
+    total_ingested = 0
+    total_chunks = 0
+    total_seconds = 0.0
+    total_failed = 0
+    
+    def collect(timeout=0):
+        """Report pending jobs that have finished (waiting up to timeout)"""
+        nonlocal total_ingested, total_chunks, total_seconds, total_failed
+        if not pending:
+            return
+        for job in queue.wait(list(pending), timeout=timeout):
+            name = os.path.basename(pending[job['job_id']])
+            if job['status'] == 'running':
+                if timeout:
+                    logger.info(
+                        f"   ⏳ {name}: {job.get('pages_parsed', 0)}/{job.get('pages_total') or '?'} pages, "
+                        f"{job.get('chunks_embedded', 0)} embedded, {job.get('chunks_upserted', 0)} upserted"
+                    )
+            elif job['status'] == 'completed':
+                del pending[job['job_id']]
+                queue.release([job['job_id']])
+                total_ingested += 1
+                total_chunks += job.get('chunks', 0)
+                total_seconds += job.get('seconds', 0.0)
+                logger.info(
+                    f"   ✅ {name} ({job.get('rfp_id')}): "
+                    f"{job.get('chunks', 0)} new, {job.get('skipped', 0)} unchanged, "
+                    f"{job.get('removed', 0)} removed; {job.get('chunks_per_second', 0)} chunks/s"
+                )
+            elif job['status'] != 'queued':
+                # failed, or 'unknown' if the job record is gone
+                del pending[job['job_id']]
+                queue.release([job['job_id']])
+                total_failed += 1
+                logger.warning(f"   ⚠️  Failed to ingest {name} ({job['status']}): {job.get('error')}")
+    
     # Get all RFPs with attachments from database
     try:
         conn = get_db_connection()
@@ -54,7 +96,6 @@ def ingest_existing_pdfs():
         
         upload_dir = getattr(settings, 'UPLOAD_DIR', 'data/uploads')
         
-        total_ingested = 0
         total_pdfs = 0
         
         for rfp in rfps:
@@ -94,31 +135,40 @@ def ingest_existing_pdfs():
                 else:
                     full_path = file_path
                 
-                # Ingest if file exists
+                # Queue if file exists
                 if os.path.exists(full_path):
-                    logger.info(f"   📄 Ingesting: {os.path.basename(full_path)}")
+                    logger.info(f"   📄 Queued: {os.path.basename(full_path)}")
                     
-                    success = rag_service.ingest_document(
-                        pdf_path=full_path,
-                        rfp_id=rfp_id,
-                        metadata={
-                            'title': title,
-                            'source': source,
-                            'deadline': deadline.isoformat() if deadline else None
-                        }
-                    )
-                    
-                    if success:
-                        total_ingested += 1
-                        logger.info(f"   ✅ Successfully ingested!")
-                    else:
-                        logger.warning(f"   ⚠️  Failed to ingest")
+                    while True:
+                        collect()
+                        try:
+                            job = queue.submit(
+                                pdf_path=full_path,
+                                rfp_id=rfp_id,
+                                metadata={
+                                    'title': title,
+                                    'source': source,
+                                    'deadline': deadline.isoformat() if deadline else None
+                                },
+                                pin=True
+                            )
+                            break
+                        except RuntimeError as e:
+                            # Queue full: let some jobs finish first
+                            logger.info(f"   ⏳ {e}; waiting...")
+                            collect(timeout=2)
+                    jobs.append(job)
+                    pending.setdefault(job['job_id'], full_path)
                 else:
                     logger.warning(f"   ❌ File not found: {full_path}")
         
         cursor.close()
         conn.close()
         
+        # Report progress until every job has finished
+        while pending:
+            collect(timeout=5)
+        
         logger.info("\n" + "=" * 60)
         logger.info("  ✅ INGESTION COMPLETE!")
         logger.info("=" * 60)
@@ -126,7 +176,10 @@ def ingest_existing_pdfs():
         logger.info(f"   • Total RFPs processed: {len(rfps)}")
         logger.info(f"   • Total PDFs found: {total_pdfs}")
         logger.info(f"   • Successfully ingested: {total_ingested}")
-        logger.info(f"   • Failed: {total_pdfs - total_ingested}")
+        logger.info(f"   • Failed: {total_failed}")
+        logger.info(f"   • Missing files: {total_pdfs - len(jobs)}")
+        if total_seconds > 0:
+            logger.info(f"   • Chunks: {total_chunks} ({total_chunks / total_seconds:.1f} chunks/s)")
         logger.info("=" * 60)
         logger.info("\n🤖 Chatbot is now ready to answer questions about the PDFs!")
         logger.info("   Try asking: 'What are the technical specifications?'")
@@ -59,6 +59,22 @@ async def get_performance_metrics():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/models")
+async def get_model_metrics():
+    """
+    Get embedding model load/memory metrics and query cache hit rates
+    """
+    try:
+        from shared.embeddings import get_embedding_registry, query_cache_stats
+        return {
+            "embedding_models": get_embedding_registry().stats(),
+            "query_embedding_cache": query_cache_stats()
+        }
+    except Exception as e:
+        logger.error(f"Error fetching model metrics: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/reports/monthly")
 async def get_monthly_report(
     year: int,
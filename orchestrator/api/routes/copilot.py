@@ -7,7 +7,7 @@ import os
 from datetime import datetime
 
 from orchestrator.config import settings
-from shared.rag import get_rag_service
+from shared.rag import get_async_rag_service, get_ingestion_queue
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -36,6 +36,10 @@ class ChatResponse(BaseModel):
     timestamp: datetime
     rag_sources: Optional[List[Dict[str, Any]]] = None # Sources used for RAG
 
+class IngestRequest(BaseModel):
+    rfp_id: str # The RFP's uploaded PDF is ingested; clients can't name server paths
+    title: Optional[str] = None
+
 
 @router.post("/chat", response_model=ChatResponse)
 async def chat_with_copilot(request: ChatRequest):
@@ -163,12 +167,81 @@ I can help you with these common RFP questions:
 
 Please ask about liability risks, technical specifications, or pricing strategy, and I'll provide detailed insights!"""
         
+        # Supporting chunks from the RFP documents (non-blocking)
+        rag_sources = None
+        if request.use_rag and last_user_msg:
+            try:
+                rag_sources = await get_async_rag_service().query_documents(
+                    last_user_msg,
+                    rfp_id=request.rfp_id,
+                    limit=3
+                ) or None
+            except Exception as e:
+                logger.warning(f"RAG lookup failed: {str(e)}")
+        
         return ChatResponse(
             response=response_text,
             timestamp=datetime.now(),
-            rag_sources=None
+            rag_sources=rag_sources
         )
 
     except Exception as e:
         logger.error(f"Error in Copilot chat: {str(e)}")
         raise HTTPException(status_code=500, detail=f"AI Error: {str(e)}")
+
+
+# The ingest routes are plain functions: FastAPI runs them on its threadpool,
+# keeping the upload directory scan, Redis progress reads and Celery
+# apply_async off the event loop
+
+@router.post("/ingest", status_code=202)
+def queue_document_ingestion(request: IngestRequest):
+    """
+    Queue an RFP's uploaded PDF for RAG ingestion; poll /ingest/{job_id} for progress
+    """
+    pdf_path = None
+    upload_dir = os.path.realpath(getattr(settings, 'UPLOAD_DIR', 'data/uploads'))
+    if request.rfp_id and os.path.isdir(upload_dir):
+        # Uploads are saved as {rfp_id}_{filename}; the separator keeps
+        # RFP-1 from picking RFP-10_*.pdf
+        prefix = f"{request.rfp_id}_"
+        for f in sorted(os.listdir(upload_dir)):
+            if f.startswith(prefix) and f.lower().endswith('.pdf'):
+                candidate = os.path.realpath(os.path.join(upload_dir, f))
+                # Symlinks must not lead out of the upload directory
+                if os.path.dirname(candidate) == upload_dir:
+                    pdf_path = candidate
+                break
+    if not pdf_path or not os.path.isfile(pdf_path):
+        raise HTTPException(status_code=404, detail=f"No PDF found for RFP {request.rfp_id}")
+    
+    try:
+        return get_ingestion_queue().submit(
+            pdf_path=pdf_path,
+            rfp_id=request.rfp_id,
+            metadata={'title': request.title} if request.title else None
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+
+@router.get("/ingest")
+def list_ingestion_jobs(rfp_id: Optional[str] = None):
+    """Recent ingestion jobs (optionally for one RFP) and queue counters"""
+    queue = get_ingestion_queue()
+    return {"jobs": queue.jobs(rfp_id), "queue": queue.stats()}
+
+
+@router.get("/ingest/{job_id}")
+def get_ingestion_job(job_id: str):
+    """Status and progress (pages parsed, chunks embedded/upserted) of an ingestion job"""
+    job = get_ingestion_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Ingestion job not found")
+    return job
+
+
+@router.get("/documents/{rfp_id}/stats")
+async def get_document_stats(rfp_id: str, exact: bool = False):
+    """Chunk count and preview of an RFP's ingested documents"""
+    return await get_async_rag_service().get_document_stats(rfp_id, exact=exact)
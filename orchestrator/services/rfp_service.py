@@ -337,15 +337,9 @@ class RFPService:
                 
                 result = None
                 try:
-                    from orchestrator.workflow import RFPWorkflow
-                    wf = RFPWorkflow()
-                    
-                    # Init (optional, may fail if Qdrant not running)
-                    try:
-                        wf.technical_agent.initialize_vector_db()
-                        wf.technical_agent.initialize_embedding_model()
-                    except Exception as e:
-                        logger.warning(f"Vector DB/Embedding init failed (using fallback): {e}")
+                    # Shared per process - agents and the embedding model load once
+                    from orchestrator.workflow import get_workflow
+                    wf = get_workflow()
                     
                     if source.startswith('http'):
                         result = await wf.process_rfp_from_url(url=source)
@@ -12,7 +12,7 @@ from datetime import datetime
 load_dotenv()
 
 from orchestrator.config import settings
-from orchestrator.workflow import RFPWorkflow
+from orchestrator.workflow import get_workflow
 from shared.database.connection import get_db_connection
 
 # Configure logging
@@ -26,18 +26,7 @@ celery_app = Celery(
     backend=os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0")
 )
 
-# Workflow instance (will be initialized per worker process)
-workflow = None
-
-def get_workflow():
-    """Get or initialize workflow instance"""
-    global workflow
-    if workflow is None:
-        workflow = RFPWorkflow()
-        # Initialize agents (TechnicalAgent needs DB connection)
-        workflow.technical_agent.initialize_vector_db()
-        workflow.technical_agent.initialize_embedding_model()
-    return workflow
+# Workflow instance is shared per worker process (orchestrator.workflow.get_workflow)
 
 def update_rfp_status_sync(rfp_id: str, status: str):
     """Update RFP status (synchronous for Celery)"""
@@ -115,6 +104,15 @@ def process_rfp_task(rfp_id: str, url: str = None, pdf_path: str = None):
         logger.error(f"Error in background task for {rfp_id}: {e}", exc_info=True)
         update_rfp_status_sync(rfp_id, 'failed')
 
+@celery_app.task(name="ingest_rag_document_task")
+def ingest_rag_document_task(job_id: str, pdf_path: str, rfp_id: str, metadata: dict = None):
+    """
+    Celery task to ingest an RFP document for RAG (queued by RAGIngestionQueue)
+    """
+    from shared.rag import get_ingestion_queue
+    
+    return get_ingestion_queue().run_job(job_id, pdf_path, rfp_id, metadata)
+
 def save_results_sync(rfp_id: str, result: dict):
     """Save processing results to DB"""
     try:
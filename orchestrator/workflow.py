@@ -2,6 +2,8 @@
 Workflow Orchestrator - Coordinates AI agents for RFP processing
 """
 import logging
+import os
+from threading import Lock
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
@@ -11,10 +13,13 @@ from agents.technical.agent import TechnicalAgent
 from agents.pricing.agent import PricingAgent
 from agents.learning.agent import LearningAgent
 from agents.auditor.agent import AuditorAgent
+from shared.embeddings import get_embedding_registry
 
 from shared.models import (
     RFPSummary, 
     Specification, 
+    ParsedDocument,
+    LineItem,
     ProductMatch, 
     PricingBreakdown
 )
@@ -312,23 +317,31 @@ class RFPWorkflow:
                     'rfp_id': rfp_metadata.get('rfp_id', 'unknown')
                 }
             
-            # Step 1: Parse PDF
+            rfp_id = rfp_metadata.get('rfp_id', f"RFP-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
+            deadline = rfp_metadata.get('deadline')
+            
+            # Step 1: Parse PDF (once - the parsed document is shared by later steps)
             logger.info("Step 1: Parsing PDF...")
-            text_content = self.document_agent.parse_pdf(pdf_path)
+            document = self.document_agent.parse_document(pdf_path)
             
             # Step 2: Extract specifications
             logger.info("Step 2: Extracting specifications...")
-            specifications = self.document_agent.extract_specifications(pdf_path)
+            specifications = self.document_agent.extract_specifications(
+                rfp_id,
+                document=document
+            )
+            self._ingest_for_rag(rfp_id, document, rfp_metadata)
+            
+            # BOQ line items (empty for single-item tenders)
+            line_items = self.document_agent.extract_line_items(document, defaults=specifications)
             
             # Step 3: Match products
             logger.info("Step 3: Matching products...")
-            matches = self.technical_agent.match_products(specifications)
+            matches = self.technical_agent.match_products(rfp_id, specifications)
+            item_matches = self.technical_agent.match_line_items(rfp_id, line_items) if line_items else []
             
             # Step 4: Calculate pricing
             logger.info("Step 4: Calculating pricing...")
-            rfp_id = rfp_metadata.get('rfp_id', f"RFP-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
-            deadline = rfp_metadata.get('deadline')
-            
             pricing_list = self.pricing_agent.calculate_pricing(
                 rfp_id=rfp_id,
                 matches=matches,
@@ -336,6 +349,13 @@ class RFPWorkflow:
                 deadline=deadline,
                 testing_requirements=testing_requirements or []
             )
+            line_item_pricing = self.pricing_agent.calculate_line_item_pricing(
+                rfp_id=rfp_id,
+                line_items=line_items,
+                item_matches=item_matches,
+                deadline=deadline,
+                testing_requirements=testing_requirements or []
+            ) if line_items else []
             
             # Step 5: Get recommendation
             logger.info("Step 5: Generating recommendation...")
@@ -352,7 +372,7 @@ class RFPWorkflow:
                 title=rfp_metadata.get('title', 'Unknown'),
                 source=rfp_metadata.get('source', 'PDF'),
                 deadline=deadline,
-                scope=text_content.get('text', '')[:500] if isinstance(text_content, dict) else str(text_content)[:500],
+                scope=document.text[:500],
                 testing_requirements=testing_requirements or [],
                 discovered_at=datetime.now(),
                 status='auditing'
@@ -382,21 +402,17 @@ class RFPWorkflow:
             return {
                 'status': 'success',
                 'rfp_id': rfp_id,
-                'specifications': [
-                    {
-                        'type': spec.spec_type,
-                        'value': spec.value,
-                        'unit': spec.unit,
-                        'confidence': spec.confidence
-                    }
-                    for spec in specifications
-                ],
+                'specifications': {
+                    **specifications.specifications,
+                    'testing_requirements': specifications.testing_requirements,
+                    'confidence_score': specifications.confidence_score
+                },
                 'matches': [
                     {
                         'sku': match.sku,
-                        'name': match.name,
+                        'name': match.product_name,
                         'match_score': match.match_score,
-                        'matched_specs': match.matched_specs
+                        'matched_specs': match.specification_alignment
                     }
                     for match in matches
                 ],
@@ -412,6 +428,8 @@ class RFPWorkflow:
                 'recommendation': {
                     'sku': recommended_sku
                 },
+                'line_items': self._serialize_line_items(line_items, item_matches, line_item_pricing),
+                'line_items_total': round(sum(p.total for p in line_item_pricing), 2),
                 'processing_time': processing_time
             }
             
@@ -422,6 +440,62 @@ class RFPWorkflow:
                 'message': str(e)
             }
     
+    def _serialize_line_items(
+        self,
+        line_items: List[LineItem],
+        item_matches: List[List[ProductMatch]],
+        line_item_pricing: List[PricingBreakdown]
+    ) -> List[Dict[str, Any]]:
+        """Line items with their top match and price, for the API response"""
+        # Pricing is in line-item order and skips items without a match;
+        # item numbers can repeat, so they can't key the lookup
+        remaining_pricing = iter(line_item_pricing)
+        
+        results = []
+        for item, matches in zip(line_items, item_matches):
+            pricing = next(remaining_pricing, None) if matches else None
+            results.append({
+                'item_no': item.item_no,
+                'description': item.description,
+                'quantity': item.quantity,
+                'unit': item.unit,
+                'specifications': item.specifications,
+                'matches': [
+                    {'sku': m.sku, 'name': m.product_name, 'match_score': m.match_score}
+                    for m in matches
+                ],
+                'pricing': {
+                    'sku': pricing.sku,
+                    'unit_price': pricing.unit_price,
+                    'quantity': pricing.quantity,
+                    'total': pricing.total
+                } if pricing else None
+            })
+        return results
+    
+    def _ingest_for_rag(
+        self,
+        rfp_id: str,
+        document: ParsedDocument,
+        rfp_metadata: Dict[str, Any]
+    ) -> None:
+        """Queue the already-parsed document for copilot RAG ingestion (opt-in)"""
+        if os.getenv("RAG_INGEST_ON_PROCESS", "false").lower() != "true":
+            return
+        
+        try:
+            from shared.rag import get_ingestion_queue
+            
+            # Runs in the background; RFP processing doesn't wait for embedding
+            get_ingestion_queue().submit(
+                pdf_path=document.source_path,
+                rfp_id=rfp_id,
+                metadata={'title': rfp_metadata.get('title', 'Unknown')},
+                document=document
+            )
+        except Exception as e:
+            logger.warning(f"RAG ingestion skipped for {rfp_id}: {e}")
+    
     def submit_feedback(
         self,
         rfp_id: str,
@@ -495,5 +569,30 @@ class RFPWorkflow:
                     'version': self.learning_agent.version,
                     'status': 'ready'
                 }
-            }
+            },
+            'embedding_models': get_embedding_registry().stats()
         }
+
+
+# Process-wide workflow: agents, caches and the embedding model are built once
+_workflow = None
+_workflow_lock = Lock()
+
+
+def get_workflow() -> RFPWorkflow:
+    """Get or initialize the shared workflow instance"""
+    global _workflow
+    if _workflow is None:
+        with _workflow_lock:
+            if _workflow is None:
+                workflow = RFPWorkflow()
+                
+                # Init (optional, may fail if Qdrant not running)
+                try:
+                    workflow.technical_agent.initialize_vector_db()
+                    workflow.technical_agent.initialize_embedding_model()
+                except Exception as e:
+                    logger.warning(f"Vector DB/Embedding init failed (using fallback): {e}")
+                
+                _workflow = workflow
+    return _workflow
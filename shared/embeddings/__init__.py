@@ -0,0 +1,10 @@
+"""
+Embeddings module - process-wide embedding model registry and query cache
+"""
+from .registry import EmbeddingModelRegistry, get_embedding_model, get_embedding_registry
+from .query_cache import QueryEmbeddingCache, get_query_embedding_cache, query_cache_stats
+
+__all__ = [
+    'EmbeddingModelRegistry', 'get_embedding_model', 'get_embedding_registry',
+    'QueryEmbeddingCache', 'get_query_embedding_cache', 'query_cache_stats'
+]
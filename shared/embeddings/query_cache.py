@@ -0,0 +1,215 @@
+"""
+Query Embedding Cache - Bounded LRU of query text -> embedding vector
+"""
+import base64
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .registry import canonical_model_name
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str, lowercase: bool = False) -> str:
+    """
+    Cache key for a query: whitespace folded, case only if lowercase
+
+    Case is only safe to fold for models whose tokenizer lowercases anyway;
+    for cased models "PE" and "pe" embed differently.
+    """
+    key = ' '.join(query.split())
+    return key.lower() if lowercase else key
+
+
+def tokenizer_lowercases(model: Any) -> bool:
+    """True if the model's tokenizer lowercases its input (do_lower_case)"""
+    tokenizer = getattr(model, 'tokenizer', None)
+    return bool(getattr(tokenizer, 'do_lower_case', False))
+
+
+class QueryEmbeddingCache:
+    """
+    LRU cache of query embeddings for one model, optionally backed by Redis
+
+    Spec queries built by TechnicalAgent repeat heavily ("voltage 11kV XLPE
+    insulation 185 sq mm cross section"), so the common ones are served from
+    memory and only unseen queries reach the model. With Redis enabled,
+    vectors embedded by one worker are reused by the others.
+
+    Keys fold whitespace, and case too when the model's tokenizer
+    lowercases (do_lower_case, e.g. the default all-MiniLM-L6-v2), so the
+    folding never changes which vector a query gets.
+    """
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        max_size: Optional[int] = None,
+        use_redis: Optional[bool] = None,
+        redis_ttl: Optional[int] = None
+    ):
+        """
+        Args:
+            model_name: Model the vectors belong to (part of the Redis key)
+            max_size: Maximum in-memory entries
+            use_redis: Also read/write vectors through RedisManager
+            redis_ttl: Expiry of Redis entries in seconds (0 = never)
+        """
+        self.model_name = canonical_model_name(model_name)
+        self.max_size = max_size if max_size is not None else int(
+            os.getenv("QUERY_EMBEDDING_CACHE_SIZE", 4096)
+        )
+        if use_redis is None:
+            use_redis = os.getenv("QUERY_EMBEDDING_CACHE_REDIS", "false").lower() == "true"
+        self.redis_ttl = redis_ttl if redis_ttl is not None else int(
+            os.getenv("QUERY_EMBEDDING_CACHE_TTL", 86400)
+        )
+
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+        self.redis = None
+        if use_redis:
+            try:
+                from shared.cache.redis_manager import RedisManager
+                manager = RedisManager()
+                if manager.connected:
+                    self.redis = manager.client
+            except Exception as e:
+                logger.warning(f"Redis query embedding cache unavailable: {e}")
+
+    def _redis_key(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return f"qemb:{self.model_name}:{digest}"
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _redis_get(self, keys: List[str]) -> List[Optional[np.ndarray]]:
+        if not self.redis or not keys:
+            return [None] * len(keys)
+        try:
+            values = self.redis.mget([self._redis_key(k) for k in keys])
+        except Exception as e:
+            logger.warning(f"Redis query embedding lookup failed: {e}")
+            return [None] * len(keys)
+        return [
+            np.frombuffer(base64.b64decode(v), dtype=np.float32) if v else None
+            for v in values
+        ]
+
+    def _redis_put(self, entries: Dict[str, np.ndarray]) -> None:
+        if not self.redis or not entries:
+            return
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key, vector in entries.items():
+                value = base64.b64encode(vector.astype(np.float32).tobytes()).decode('ascii')
+                pipe.set(self._redis_key(key), value, ex=self.redis_ttl or None)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis query embedding store failed: {e}")
+
+    def encode(self, model: Any, queries: List[str]) -> np.ndarray:
+        """
+        Embed queries, using cached vectors where available
+
+        Args:
+            model: SentenceTransformer used for cache misses
+            queries: Query strings
+
+        Returns:
+            float32 array of shape (len(queries), dimension)
+        """
+        lowercase = tokenizer_lowercases(model)
+        keys = [normalize_query(q, lowercase) for q in queries]
+        vectors: Dict[str, np.ndarray] = {}
+
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    vectors[key] = vector
+
+        # Distinct misses, first-seen order, with the original text to embed
+        pending = {}
+        for key, query in zip(keys, queries):
+            if key not in vectors and key not in pending:
+                pending[key] = query
+        # Repeats within the batch count as hits too
+        self.hits += len(keys) - len(pending)
+
+        if pending:
+            for key, vector in zip(list(pending), self._redis_get(list(pending))):
+                if vector is not None:
+                    vectors[key] = vector
+                    self._remember(key, vector)
+                    del pending[key]
+                    self.redis_hits += 1
+
+        if pending:
+            self.misses += len(pending)
+            encoded = np.asarray(
+                model.encode(list(pending.values()), convert_to_numpy=True),
+                dtype=np.float32
+            )
+            fresh = dict(zip(pending, encoded))
+            for key, vector in fresh.items():
+                vectors[key] = vector
+                self._remember(key, vector)
+            self._redis_put(fresh)
+
+        return np.stack([vectors[key] for key in keys]) if keys else np.empty((0, 0), dtype=np.float32)
+
+    def clear(self) -> None:
+        """Drop in-memory entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.redis_hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            'model': self.model_name,
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'redis_hits': self.redis_hits,
+            'misses': self.misses,
+            'hit_rate': round((self.hits + self.redis_hits) / lookups, 4) if lookups else 0.0,
+            'redis': self.redis is not None
+        }
+
+
+_caches: Dict[str, QueryEmbeddingCache] = {}
+_caches_lock = Lock()
+
+
+def get_query_embedding_cache(model_name: Optional[str] = None) -> QueryEmbeddingCache:
+    """Get the process-wide query embedding cache for a model"""
+    name = canonical_model_name(model_name)
+    cache = _caches.get(name)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.setdefault(name, QueryEmbeddingCache(name))
+    return cache
+
+
+def query_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats of every query embedding cache in this process"""
+    return {name: cache.stats() for name, cache in _caches.items()}
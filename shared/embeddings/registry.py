@@ -0,0 +1,124 @@
+"""
+Embedding Model Registry - One lazily loaded SentenceTransformer per model per process
+"""
+import logging
+import os
+import time
+from threading import Lock
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def canonical_model_name(model_name: Optional[str] = None) -> str:
+    """
+    Resolve a model name so aliases share one instance
+    e.g. 'all-MiniLM-L6-v2' -> 'sentence-transformers/all-MiniLM-L6-v2'
+    """
+    name = model_name or os.getenv("EMBEDDING_MODEL", DEFAULT_EMBEDDING_MODEL)
+    if '/' not in name and not os.path.exists(name):
+        name = f"sentence-transformers/{name}"
+    return name
+
+
+def _process_rss_bytes() -> Optional[int]:
+    """Resident set size of this process, if psutil is installed"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return None
+
+
+class EmbeddingModelRegistry:
+    """
+    Process-wide cache of embedding models
+
+    Each model is loaded on first get() and then shared by every agent and
+    service in the process. Concurrent first calls for the same model wait
+    for a single load instead of loading it twice.
+    """
+
+    def __init__(self):
+        self._models: Dict[str, Any] = {}
+        self._metrics: Dict[str, Dict[str, Any]] = {}
+        self._locks: Dict[str, Lock] = {}
+        self._registry_lock = Lock()
+
+    def get(self, model_name: Optional[str] = None):
+        """
+        Get a loaded SentenceTransformer, loading it on first use
+
+        Args:
+            model_name: Model name or path; defaults to EMBEDDING_MODEL
+
+        Returns:
+            SentenceTransformer instance shared across the process
+        """
+        name = canonical_model_name(model_name)
+        model = self._models.get(name)
+        if model is not None:
+            self._metrics[name]['requests'] += 1
+            return model
+
+        with self._registry_lock:
+            lock = self._locks.setdefault(name, Lock())
+
+        with lock:
+            if name not in self._models:
+                self._load(name)
+            self._metrics[name]['requests'] += 1
+            return self._models[name]
+
+    def _load(self, name: str) -> None:
+        from sentence_transformers import SentenceTransformer
+
+        logger.info(f"Loading embedding model: {name}...")
+        rss_before = _process_rss_bytes()
+        start = time.perf_counter()
+
+        model = SentenceTransformer(name)
+
+        load_seconds = time.perf_counter() - start
+        rss_after = _process_rss_bytes()
+        parameter_bytes = sum(p.numel() * p.element_size() for p in model.parameters())
+
+        self._models[name] = model
+        self._metrics[name] = {
+            'load_seconds': round(load_seconds, 3),
+            'parameter_bytes': parameter_bytes,
+            'rss_delta_bytes': rss_after - rss_before if rss_before is not None and rss_after is not None else None,
+            'dimension': model.get_sentence_embedding_dimension(),
+            'loaded_at': time.time(),
+            'requests': 0
+        }
+        logger.info(
+            f"Embedding model {name} loaded in {load_seconds:.2f}s "
+            f"({parameter_bytes / 1024 / 1024:.0f} MB of parameters)"
+        )
+
+    def is_loaded(self, model_name: Optional[str] = None) -> bool:
+        """True if the model has already been loaded in this process"""
+        return canonical_model_name(model_name) in self._models
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Load time, memory and request count per loaded model"""
+        return {name: dict(metrics) for name, metrics in self._metrics.items()}
+
+
+_registry = None
+
+
+def get_embedding_registry() -> EmbeddingModelRegistry:
+    """Get the process-wide embedding model registry"""
+    global _registry
+    if _registry is None:
+        _registry = EmbeddingModelRegistry()
+    return _registry
+
+
+def get_embedding_model(model_name: Optional[str] = None):
+    """Shared SentenceTransformer for model_name (default EMBEDDING_MODEL)"""
+    return get_embedding_registry().get(model_name)
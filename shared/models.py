@@ -1,11 +1,14 @@
 """
 Data models for RFP Automation System
 """
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 import json
 
+# A table as extracted by pdfplumber: rows of cell strings (None for empty cells)
+Table = List[List[Optional[str]]]
+
 
 @dataclass
 class RFPSummary:
@@ -70,6 +73,87 @@ class Specification:
         return cls(**data)
 
 
+@dataclass
+class ParsedDocument:
+    """Parsed PDF content from Document Agent, shared across pipeline stages"""
+    source_path: str
+    text: str
+    page_texts: List[str]
+    metadata: Dict[str, Any]
+    content_hash: Optional[str] = None  # SHA-256 of the source PDF bytes
+    text_backend: Optional[str] = None  # Backend that produced page_texts ('pymupdf', 'pdfplumber')
+    # Pages that look like BOQ / schedule-of-quantities pages
+    table_pages: List[int] = field(default_factory=list)
+    # Per-page cache of extracted tables, filled on demand
+    page_tables: Dict[int, List[Table]] = field(default_factory=dict)
+    # Callable(source_path, page_indexes) -> {page_index: tables}
+    table_loader: Optional[Callable[[str, List[int]], Dict[int, List[Table]]]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    @property
+    def pages(self) -> int:
+        """Number of pages in the document"""
+        return len(self.page_texts)
+
+    @property
+    def tables(self) -> List[Table]:
+        """Tables on BOQ-like pages, extracted on first access"""
+        self.load_tables(self.table_pages)
+        return [table for i in self.table_pages for table in self.page_tables.get(i, [])]
+
+    def get_page_tables(self, page_index: int) -> List[Table]:
+        """Tables on one page (any page), extracted on first access"""
+        self.load_tables([page_index])
+        return self.page_tables.get(page_index, [])
+
+    def load_tables(self, page_indexes: List[int]) -> None:
+        """Extract tables for the given pages that are not cached yet"""
+        missing = [i for i in page_indexes if i not in self.page_tables]
+        if not missing:
+            return
+        loaded = self.table_loader(self.source_path, missing) if self.table_loader else {}
+        for i in missing:
+            self.page_tables[i] = loaded.get(i, [])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the legacy parse_pdf content dictionary"""
+        return {
+            'text': self.text,
+            'pages': self.pages,
+            'tables': self.tables,
+            'metadata': self.metadata
+        }
+
+
+@dataclass
+class LineItem:
+    """One BOQ / schedule-of-quantities line item from Document Agent"""
+    item_no: str
+    description: str
+    quantity: float
+    unit: str
+    specifications: Dict[str, Any]
+    page: Optional[int] = None  # Zero-based page the item was read from
+
+    @property
+    def quantity_in_meters(self) -> float:
+        """Quantity converted to meters for length units (km, rkm); as-is otherwise"""
+        unit = self.unit.lower().replace('.', '').strip()
+        if unit in ('km', 'kms', 'rkm', 'ckm'):
+            return self.quantity * 1000
+        return self.quantity
+
+    def to_json(self) -> str:
+        """Convert to JSON string"""
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LineItem':
+        """Create from dictionary"""
+        return cls(**data)
+
+
 @dataclass
 class ProductMatch:
     """Product match from Technical Agent"""
@@ -101,6 +185,7 @@ class PricingBreakdown:
     urgency_adjustment: float
     total: float
     currency: str = "INR"
+    item_no: Optional[str] = None  # BOQ line item this price is for, if any
     
     def to_json(self) -> str:
         """Convert to JSON string"""
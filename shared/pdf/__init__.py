@@ -0,0 +1,11 @@
+"""
+PDF module - pluggable text-extraction backends
+"""
+from .backends import (
+    PdfTextDocument, available_backends, backend_class, open_pdf, register_backend, resolve_backend
+)
+
+__all__ = [
+    'PdfTextDocument', 'available_backends', 'backend_class', 'open_pdf', 'register_backend',
+    'resolve_backend'
+]
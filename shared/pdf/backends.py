@@ -0,0 +1,225 @@
+"""
+PDF Text Backends - Pluggable page-text extraction for PDFs
+"""
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pymupdf
+except ImportError:
+    try:
+        import fitz as pymupdf  # PyMuPDF < 1.24 only ships the legacy name
+    except ImportError:
+        pymupdf = None
+
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+# PyMuPDF metadata keys that are not part of the PDF info dictionary
+_PYMUPDF_NON_INFO_KEYS = {'format', 'encryption'}
+
+
+class PdfTextDocument(ABC):
+    """An open PDF, read page by page; use as a context manager"""
+
+    backend_name = 'base'
+    # Per-page extraction cost relative to pdfplumber; scales the page count
+    # at which a process pool pays for its start-up (PDF_PARALLEL_MIN_PAGES)
+    relative_page_cost = 1.0
+
+    def __init__(self, pdf_path: str):
+        self.pdf_path = str(pdf_path)
+
+    @property
+    @abstractmethod
+    def page_count(self) -> int:
+        """Number of pages"""
+
+    @property
+    @abstractmethod
+    def metadata(self) -> Dict[str, Any]:
+        """PDF info dictionary (Title, Author, CreationDate, ...)"""
+
+    @abstractmethod
+    def page_text(self, index: int) -> str:
+        """Text of one zero-based page ('' if the page has no text layer)"""
+
+    def page_texts(self, start: int = 0, end: Optional[int] = None) -> List[str]:
+        """Text of pages [start, end)"""
+        end = self.page_count if end is None else min(end, self.page_count)
+        return [self.page_text(i) for i in range(start, end)]
+
+    def iter_page_texts(self) -> Iterator[str]:
+        """Yield page text in page order"""
+        for i in range(self.page_count):
+            yield self.page_text(i)
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> 'PdfTextDocument':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class PdfPlumberDocument(PdfTextDocument):
+    """pdfplumber reader: slowest, but keeps layout and backs table extraction"""
+
+    backend_name = 'pdfplumber'
+
+    def __init__(self, pdf_path: str):
+        super().__init__(pdf_path)
+        self._pdf = pdfplumber.open(self.pdf_path)
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pdf.pages)
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self._pdf.metadata
+
+    def page_text(self, index: int) -> str:
+        page = self._pdf.pages[index]
+        text = page.extract_text() or ''
+        # Release pdfplumber's per-page layout objects as we go
+        page.flush_cache()
+        return text
+
+    def close(self) -> None:
+        self._pdf.close()
+
+
+class PyMuPDFDocument(PdfTextDocument):
+    """
+    PyMuPDF reader: an order of magnitude faster than pdfplumber on text PDFs
+
+    Pages PyMuPDF cannot decode are re-read with pdfplumber, so one damaged
+    content stream does not fail the whole document.
+    """
+
+    backend_name = 'pymupdf'
+    # ~2 ms/page vs ~200 ms/page for pdfplumber on text PDFs: a pool only
+    # helps for very large documents
+    relative_page_cost = 0.02
+
+    def __init__(self, pdf_path: str):
+        super().__init__(pdf_path)
+        self._doc = pymupdf.open(self.pdf_path)
+        self._fallback: Optional[PdfPlumberDocument] = None
+
+    @property
+    def page_count(self) -> int:
+        return self._doc.page_count
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        # Same shape as pdfplumber: info-dictionary key names, empty values dropped
+        return {
+            key[0].upper() + key[1:]: value
+            for key, value in (self._doc.metadata or {}).items()
+            if value and key not in _PYMUPDF_NON_INFO_KEYS
+        }
+
+    def page_text(self, index: int) -> str:
+        try:
+            # Content-stream order; sort=True would match pdfplumber's reading
+            # order more closely but costs ~10x, and layout-sensitive work
+            # (tables) goes through pdfplumber anyway
+            return self._doc[index].get_text('text')
+        except Exception as e:
+            if pdfplumber is None:
+                raise
+            logger.warning(f"PyMuPDF failed on page {index + 1} of {self.pdf_path}, using pdfplumber: {e}")
+            if self._fallback is None:
+                self._fallback = PdfPlumberDocument(self.pdf_path)
+            return self._fallback.page_text(index)
+
+    def close(self) -> None:
+        self._doc.close()
+        if self._fallback is not None:
+            self._fallback.close()
+
+
+# Backend name -> reader class, in "auto" preference order
+TEXT_BACKENDS: Dict[str, Type[PdfTextDocument]] = {
+    'pymupdf': PyMuPDFDocument,
+    'pdfplumber': PdfPlumberDocument,
+}
+
+_BACKEND_MODULES = {'pymupdf': pymupdf, 'pdfplumber': pdfplumber}
+
+
+def register_backend(name: str, document_class: Type[PdfTextDocument]) -> None:
+    """Register an additional text backend under name"""
+    TEXT_BACKENDS[name] = document_class
+
+
+def backend_class(name: str) -> Type[PdfTextDocument]:
+    """Reader class registered under name"""
+    return TEXT_BACKENDS[name]
+
+
+def available_backends() -> List[str]:
+    """Names of backends whose library is installed, in preference order"""
+    return [
+        name for name in TEXT_BACKENDS
+        if name not in _BACKEND_MODULES or _BACKEND_MODULES[name] is not None
+    ]
+
+
+def resolve_backend(name: Optional[str] = None) -> str:
+    """
+    Pick the text backend to use
+
+    Args:
+        name: 'auto', a backend name, or None to read PDF_TEXT_BACKEND
+
+    Returns:
+        Name of an installed backend; 'auto' (and any unavailable backend)
+        resolves to the fastest installed one
+    """
+    requested = (name or os.getenv("PDF_TEXT_BACKEND", "auto")).lower()
+    installed = available_backends()
+    if not installed:
+        raise ImportError("No PDF text backend installed. Install: pip install PyMuPDF pdfplumber")
+
+    if requested == 'auto':
+        return installed[0]
+    if requested in installed:
+        return requested
+
+    logger.warning(f"PDF text backend '{requested}' unavailable, using {installed[0]}")
+    return installed[0]
+
+
+def open_pdf(pdf_path: str, backend: Optional[str] = None) -> PdfTextDocument:
+    """
+    Open a PDF for page-text extraction
+
+    Args:
+        pdf_path: Path to PDF file
+        backend: Backend name ('auto', 'pymupdf', 'pdfplumber'); defaults to PDF_TEXT_BACKEND
+
+    Returns:
+        Open PdfTextDocument (backend_name tells which backend actually
+        opened it); close it (or use it as a context manager)
+    """
+    name = resolve_backend(backend)
+
+    try:
+        return TEXT_BACKENDS[name](pdf_path)
+    except Exception as e:
+        if name == 'pdfplumber' or pdfplumber is None:
+            raise
+        # Files the fast backend rejects are retried with pdfplumber
+        logger.warning(f"{name} could not open {pdf_path}, falling back to pdfplumber: {e}")
+        return PdfPlumberDocument(pdf_path)
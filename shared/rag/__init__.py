@@ -1,6 +1,14 @@
 """
 RAG (Retrieval-Augmented Generation) module
 """
+from .async_rag import AsyncDocumentRAGService, get_async_rag_service
+from .chunker import TokenChunker
 from .document_rag import DocumentRAGService, get_rag_service
+from .ingest_queue import IngestProgressStore, RAGIngestionQueue, get_ingestion_queue
+from .result_cache import RAGResultCache
+from .text_store import ChunkTextStore
 
-__all__ = ['DocumentRAGService', 'get_rag_service']
+__all__ = [
+    'AsyncDocumentRAGService', 'ChunkTextStore', 'DocumentRAGService', 'IngestProgressStore', 'RAGIngestionQueue',
+    'RAGResultCache', 'TokenChunker', 'get_async_rag_service', 'get_ingestion_queue', 'get_rag_service'
+]
@@ -0,0 +1,199 @@
+"""
+Async Document RAG Service - Non-blocking RAG for FastAPI handlers
+"""
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+from shared.models import ParsedDocument
+from shared.vectors import is_local_client
+from .document_rag import DocumentRAGService, get_rag_service
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDocumentRAGService:
+    """
+    Async front end of DocumentRAGService for the event loop
+
+    Searches go through AsyncQdrantClient; embedding (and anything else
+    CPU-bound or blocking) runs on a bounded thread pool, so concurrent
+    copilot users no longer stall the loop or queue behind each other's
+    encode() calls. Ingestion gets its own smaller pool so a large PDF
+    can't take every embedding worker from interactive queries.
+
+    Collection setup, chunking, the result cache and payload formatting
+    are shared with the wrapped synchronous service. That service is built
+    on first use on the query pool (it probes Qdrant and sets up
+    collections), never on the loop.
+    """
+
+    def __init__(
+        self,
+        service: Optional[DocumentRAGService] = None,
+        query_workers: Optional[int] = None,
+        ingest_workers: Optional[int] = None
+    ):
+        """
+        Args:
+            service: Synchronous service to share state with (default: the
+                global one, built on first use)
+            query_workers: Threads for query embedding
+            ingest_workers: Threads for parsing/embedding during ingestion
+        """
+        self._service = service
+        self._query_executor = ThreadPoolExecutor(
+            max_workers=query_workers or int(os.getenv("RAG_QUERY_WORKERS", 4)),
+            thread_name_prefix="rag-query"
+        )
+        self._ingest_executor = ThreadPoolExecutor(
+            max_workers=ingest_workers or int(os.getenv("RAG_INGEST_WORKERS", 1)),
+            thread_name_prefix="rag-ingest"
+        )
+        self._async_client = None
+
+    @property
+    def service(self) -> DocumentRAGService:
+        """Wrapped synchronous service (blocks while building it; prefer _get_service on the loop)"""
+        if self._service is None:
+            self._service = get_rag_service()
+        return self._service
+
+    async def _get_service(self) -> DocumentRAGService:
+        """Wrapped service, built on the query pool the first time"""
+        if self._service is None:
+            self._service = await self._run(self._query_executor, get_rag_service)
+        return self._service
+
+    def _get_async_client(self, service: DocumentRAGService):
+        """AsyncQdrantClient for a Qdrant server; None for the in-process index"""
+        if self._async_client is None and not is_local_client(service.client):
+            from qdrant_client import AsyncQdrantClient
+
+            host = os.getenv("QDRANT_HOST", "localhost")
+            port = int(os.getenv("QDRANT_PORT", 6333))
+            self._async_client = AsyncQdrantClient(host=host, port=port)
+        return self._async_client
+
+    async def _run(self, executor: ThreadPoolExecutor, func: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+    def _encode_query(self, service: DocumentRAGService, query: str) -> List[float]:
+        return service.embedding_model.encode(query).tolist()
+
+    async def query_documents(
+        self,
+        query: str,
+        rfp_id: Optional[str] = None,
+        limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Query documents using semantic search without blocking the event loop
+
+        Args:
+            query: User query
+            rfp_id: Optional RFP ID to filter results
+            limit: Number of results to return
+
+        Returns:
+            List of relevant document chunks with metadata
+        """
+        service = await self._get_service()
+        if not service.client:
+            logger.error("Qdrant client not initialized")
+            return []
+
+        if service.result_cache.redis:
+            # Shared invalidations cost a Redis round trip per lookup
+            cached = await self._run(self._query_executor, service.result_cache.get, query, rfp_id, limit)
+        else:
+            cached = service.result_cache.get(query, rfp_id, limit)
+        if cached is not None:
+            return cached
+
+        try:
+            query_embedding = await self._run(self._query_executor, self._encode_query, service, query)
+            query_filter = service._rfp_filter(rfp_id) if rfp_id else None
+
+            client = self._get_async_client(service)
+            if client is not None:
+                results = await client.search(
+                    collection_name=service.collection_name,
+                    query_vector=query_embedding,
+                    query_filter=query_filter,
+                    limit=limit,
+                    search_params=service.storage.search_params(service.models)
+                )
+            else:
+                results = await self._run(
+                    self._query_executor,
+                    service.client.search,
+                    collection_name=service.collection_name,
+                    query_vector=query_embedding,
+                    query_filter=query_filter,
+                    limit=limit
+                )
+
+            if service.text_store is not None:
+                # Chunk text comes from SQLite; keep that off the loop too
+                formatted_results = await self._run(self._query_executor, service._format_results, results)
+            else:
+                formatted_results = service._format_results(results)
+            logger.info(f"Found {len(formatted_results)} relevant chunks for query: {query}")
+            service.result_cache.put(query, rfp_id, limit, formatted_results)
+            return formatted_results
+
+        except Exception as e:
+            logger.error(f"Error querying documents: {e}")
+            return []
+
+    async def ingest_document(
+        self,
+        pdf_path: str,
+        rfp_id: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        document: Optional[ParsedDocument] = None
+    ) -> bool:
+        """Ingest a PDF document on the ingestion pool (see DocumentRAGService.ingest_document)"""
+        service = await self._get_service()
+        return await self._run(
+            self._ingest_executor,
+            service.ingest_document,
+            pdf_path,
+            rfp_id,
+            metadata=metadata,
+            document=document
+        )
+
+    async def delete_document(self, rfp_id: str) -> bool:
+        """Delete all chunks for a specific RFP"""
+        service = await self._get_service()
+        return await self._run(self._query_executor, service.delete_document, rfp_id)
+
+    async def get_document_stats(self, rfp_id: str, exact: bool = False) -> Dict[str, Any]:
+        """Get statistics about ingested document (see DocumentRAGService.get_document_stats)"""
+        service = await self._get_service()
+        return await self._run(self._query_executor, service.get_document_stats, rfp_id, exact=exact)
+
+    async def close(self) -> None:
+        """Close the async client and stop the worker pools"""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+        self._query_executor.shutdown(wait=False)
+        self._ingest_executor.shutdown(wait=False)
+
+
+# Global instance
+_async_rag_service = None
+
+def get_async_rag_service() -> AsyncDocumentRAGService:
+    """Get or create async RAG service instance (cheap; safe to call on the loop)"""
+    global _async_rag_service
+    if _async_rag_service is None:
+        _async_rag_service = AsyncDocumentRAGService()
+    return _async_rag_service
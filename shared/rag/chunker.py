@@ -0,0 +1,168 @@
+"""
+Token Chunker - Linear-time, token-aware text chunking for RAG ingestion
+"""
+import logging
+import re
+from collections import deque
+from typing import Any, Callable, Deque, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_LINE_PATTERN = re.compile(r'[^\n]*\n|[^\n]+$')
+_SENTENCE_END = re.compile(r'(?<=[.!?;])\s+')
+_APPROX_TOKEN = re.compile(r'\w+|[^\w\s]')
+# Columns separated by tabs, pipes or runs of spaces (BOQ / spec tables)
+_TABLE_ROW = re.compile(r'\t|\||\S {2,}\S.* {2,}\S')
+
+
+def approximate_token_count(text: str) -> int:
+    """Word/punctuation count; a close lower bound for WordPiece tokenizers"""
+    return len(_APPROX_TOKEN.findall(text))
+
+
+def model_token_counter(model: Any) -> Tuple[Callable[[str], int], Optional[int]]:
+    """
+    Token counter and max sequence length of a SentenceTransformer
+
+    Falls back to approximate_token_count when the model exposes no tokenizer.
+    """
+    tokenizer = getattr(model, 'tokenizer', None)
+    max_length = getattr(model, 'max_seq_length', None)
+    if tokenizer is None:
+        return approximate_token_count, max_length
+    return (lambda text: len(tokenizer.tokenize(text))), max_length
+
+
+class TokenChunker:
+    """
+    Split text into chunks that fit the embedding model's token limit
+
+    Text is read line by line and lines are split into sentences; table
+    rows (tab, pipe or multi-space separated columns) are kept whole. Segments
+    are packed into chunks of at most max_tokens, each new chunk starting
+    with up to overlap_tokens of trailing segments from the previous one.
+    Blank lines mark section boundaries: a chunk that is already half full
+    ends there instead of spilling into the next section.
+
+    Each segment is tokenized once and every position of the text is
+    visited a bounded number of times, so chunking is linear in the text
+    length. Chunks are yielded as they are completed.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 200,
+        overlap_tokens: int = 40,
+        count_tokens: Callable[[str], int] = approximate_token_count
+    ):
+        """
+        Args:
+            max_tokens: Token budget per chunk (excluding special tokens)
+            overlap_tokens: Tokens repeated from the end of the previous chunk
+            count_tokens: Token counter of the embedding model
+        """
+        self.max_tokens = max(8, max_tokens)
+        self.overlap_tokens = max(0, min(overlap_tokens, self.max_tokens // 2))
+        self.count_tokens = count_tokens
+
+    def _segments(self, text: str) -> Iterator[Tuple[str, bool]]:
+        """(segment, starts_section) pairs; segments keep their trailing separator"""
+        section_start = True
+        for match in _LINE_PATTERN.finditer(text):
+            line = match.group(0)
+            if not line.strip():
+                section_start = True
+                continue
+
+            if _TABLE_ROW.search(line):
+                pieces = [line]
+            else:
+                pieces = _SENTENCE_END.split(line.rstrip('\n'))
+                pieces = [p + ' ' for p in pieces[:-1]] + [pieces[-1] + '\n']
+
+            for piece in pieces:
+                if piece.strip():
+                    yield piece, section_start
+                    section_start = False
+
+    def _split_word(self, word: str, tokens: int) -> Iterator[Tuple[str, int]]:
+        """Cut a single word longer than the budget (e.g. a URL) into pieces that fit"""
+        # Piece length from the word's average characters per token
+        step = max(1, len(word) * self.max_tokens // tokens)
+        start = 0
+        while start < len(word):
+            size = step
+            piece = word[start:start + size]
+            piece_tokens = self.count_tokens(piece)
+            while piece_tokens > self.max_tokens and size > 1:
+                size //= 2
+                piece = word[start:start + size]
+                piece_tokens = self.count_tokens(piece)
+            yield piece, piece_tokens
+            start += size
+
+    def _split_long(self, segment: str) -> Iterator[Tuple[str, int]]:
+        """Hard-wrap a segment longer than the budget at word boundaries"""
+        part = []
+        part_tokens = 0
+        for word in segment.split(' '):
+            tokens = self.count_tokens(word) if word.strip() else 0
+            if tokens > self.max_tokens:
+                if part:
+                    yield ' '.join(part) + ' ', part_tokens
+                    part, part_tokens = [], 0
+                pieces = list(self._split_word(word, tokens))
+                yield from pieces[:-1]
+                # The tail joins the following words like any other word
+                word, tokens = pieces[-1]
+            if part and part_tokens + tokens > self.max_tokens:
+                yield ' '.join(part) + ' ', part_tokens
+                part, part_tokens = [], 0
+            part.append(word)
+            part_tokens += tokens
+        if part:
+            yield ' '.join(part), part_tokens
+
+    def _sized_segments(self, text: str) -> Iterator[Tuple[str, int, bool]]:
+        for segment, section_start in self._segments(text):
+            tokens = self.count_tokens(segment)
+            if tokens <= self.max_tokens:
+                yield segment, tokens, section_start
+                continue
+            for i, (part, part_tokens) in enumerate(self._split_long(segment)):
+                yield part, part_tokens, section_start and i == 0
+
+    def iter_chunks(self, text: str) -> Iterator[str]:
+        """Yield chunks of text in document order"""
+        current: Deque[Tuple[str, int]] = deque()
+        current_tokens = 0
+        fresh = 0  # segments added since the last emitted chunk
+
+        def emit():
+            return ''.join(segment for segment, _ in current).strip()
+
+        for segment, tokens, section_start in self._sized_segments(text):
+            over_budget = current_tokens + tokens > self.max_tokens
+            section_break = section_start and current_tokens >= self.max_tokens // 2
+
+            if fresh and (over_budget or section_break):
+                yield emit()
+                fresh = 0
+                if section_break and not over_budget:
+                    # New section: no overlap with the previous one
+                    current.clear()
+                    current_tokens = 0
+                else:
+                    # Keep trailing segments as overlap, within budget
+                    while current and (
+                        current_tokens > self.overlap_tokens
+                        or current_tokens + tokens > self.max_tokens
+                    ):
+                        current_tokens -= current.popleft()[1]
+
+            current.append((segment, tokens))
+            current_tokens += tokens
+            fresh += 1
+
+        if fresh:
+            yield emit()
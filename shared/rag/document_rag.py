@@ -1,36 +1,91 @@
 """
 Document RAG Service - Ingest PDFs into Qdrant for RAG queries
 """
+import hashlib
 import logging
 import os
-from typing import List, Dict, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from threading import Lock
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
 import uuid
 from datetime import datetime
 
+from shared.embeddings import get_embedding_model
+from shared.models import ParsedDocument
+from shared.pdf import open_pdf
+from shared.vectors import VectorStorageConfig, get_vector_client, models
+from .chunker import TokenChunker, model_token_counter
+from .result_cache import RAGResultCache
+from .text_store import ChunkTextStore
+
 logger = logging.getLogger(__name__)
 
+# Namespace for deterministic chunk point IDs
+CHUNK_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_DNS, "rfp-automation.rfp_documents")
+# Receives ingestion progress as keyword fields (pages_parsed, chunks_embedded, ...)
+ProgressCallback = Callable[..., None]
+
+# Chunks shown in get_document_stats previews, and characters per preview
+PREVIEW_CHUNKS = 3
+PREVIEW_CHARS = 100
+
+
+def chunk_point_id(rfp_id: str, chunk: str) -> str:
+    """Deterministic point ID for a chunk: same RFP and text -> same ID"""
+    digest = hashlib.sha256(chunk.encode('utf-8')).hexdigest()
+    return str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"{rfp_id}:{digest}"))
+
+
+def stats_point_id(rfp_id: str) -> str:
+    """Point ID of an RFP's ingest summary in the stats collection"""
+    return str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"stats:{rfp_id}"))
+
+
+def _preview(index: int, text: str) -> Dict[str, Any]:
+    return {"index": index, "text_preview": text[:PREVIEW_CHARS] + "..."}
+
+
 class DocumentRAGService:
     """Service for ingesting documents into Qdrant and querying them"""
     
     def __init__(self):
         self.collection_name = "rfp_documents"
-        self.chunk_size = 500  # characters per chunk
-        self.chunk_overlap = 100  # overlap between chunks
+        # One summary point per RFP, written at ingest time, so stats are a single lookup
+        self.stats_collection_name = "rfp_document_stats"
+        self.store_ingest_stats = os.getenv("RAG_STORE_INGEST_STATS", "true").lower() == "true"
+        # Tokens per chunk (capped by the model's max sequence length) and overlap
+        self.chunk_tokens = int(os.getenv("RAG_CHUNK_TOKENS", 200))
+        self.chunk_overlap_tokens = int(os.getenv("RAG_CHUNK_OVERLAP_TOKENS", 40))
+        self._chunker: Optional[TokenChunker] = None
+        self.embedding_model_name = 'all-MiniLM-L6-v2'
+        # Chunks per encode() call and points per upsert request
+        self.embed_batch_size = int(os.getenv("RAG_EMBED_BATCH_SIZE", 64))
+        self.upsert_batch_size = int(os.getenv("RAG_UPSERT_BATCH_SIZE", 256))
+        # Upsert requests in flight at once (1 = sequential)
+        self.upload_parallelism = int(os.getenv("RAG_UPLOAD_PARALLEL", 1))
+        self.last_ingest_stats: Dict[str, Any] = {}
+        # Repeated copilot questions per RFP; cleared when that RFP's chunks change
+        self.result_cache = RAGResultCache()
+        # Quantization / on-disk settings (RAG_VECTOR_* over VECTOR_*)
+        self.storage = VectorStorageConfig.from_env("RAG")
+        # Chunk text in the point payload, or out-of-band in a SQLite store
+        self.text_store: Optional[ChunkTextStore] = None
+        if os.getenv("RAG_CHUNK_TEXT_STORE", "payload").lower() == "sqlite":
+            self.text_store = ChunkTextStore()
         
-        # Initialize Qdrant client
+        # Initialize Qdrant client (in-process index if Qdrant is not running)
         try:
-            from qdrant_client import QdrantClient
-            from qdrant_client.http import models
-            from sentence_transformers import SentenceTransformer
+            import sentence_transformers  # noqa: F401 - model itself loads on first use
             
-            self.client = QdrantClient(host="localhost", port=6333)
-            self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+            self.client = get_vector_client()
             self.models = models
             
-            # Create collection if it doesn't exist
-            self._ensure_collection()
-            
-            logger.info("DocumentRAGService initialized successfully")
+            if self.client:
+                # Create collection if it doesn't exist
+                self._ensure_collection()
+                logger.info("DocumentRAGService initialized successfully")
         except ImportError as e:
             logger.error(f"Missing dependencies: {e}")
             logger.error("Install: pip install qdrant-client sentence-transformers")
@@ -39,6 +94,11 @@ class DocumentRAGService:
             logger.error(f"Error initializing DocumentRAGService: {e}")
             self.client = None
     
+    @property
+    def embedding_model(self):
+        """Shared embedding model from the process-wide registry, loaded on first use"""
+        return get_embedding_model(self.embedding_model_name)
+    
     def _ensure_collection(self):
         """Create Qdrant collection if it doesn't exist"""
         try:
@@ -48,75 +108,137 @@ class DocumentRAGService:
             if self.collection_name not in collection_names:
                 self.client.create_collection(
                     collection_name=self.collection_name,
-                    vectors_config=self.models.VectorParams(
+                    **self.storage.create_kwargs(
+                        self.models,
                         size=384,  # all-MiniLM-L6-v2 embedding size
                         distance=self.models.Distance.COSINE
                     )
                 )
-                logger.info(f"Created collection: {self.collection_name}")
+                logger.info(f"Created collection: {self.collection_name} ({self.storage.describe()})")
             else:
+                # Storage settings apply when the collection is created
                 logger.info(f"Collection {self.collection_name} already exists")
+            
+            # Every query, ingest and stats lookup filters on rfp_id; a keyword
+            # index keeps those from scanning all payloads (idempotent, so
+            # collections created before it get it too)
+            self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name="rfp_id",
+                field_schema=self.models.PayloadSchemaType.KEYWORD
+            )
+            
+            if self.store_ingest_stats and self.stats_collection_name not in collection_names:
+                # Summaries are only fetched by ID; the vector is a placeholder
+                self.client.create_collection(
+                    collection_name=self.stats_collection_name,
+                    vectors_config=self.models.VectorParams(
+                        size=1,
+                        distance=self.models.Distance.DOT
+                    )
+                )
+                logger.info(f"Created collection: {self.stats_collection_name}")
         except Exception as e:
             logger.error(f"Error ensuring collection: {e}")
     
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
+    def extract_text_from_pdf(self, pdf_path: str, on_progress: Optional[ProgressCallback] = None) -> str:
         """Extract text from PDF file"""
         try:
-            import PyPDF2
+            with open_pdf(pdf_path) as pdf:
+                if on_progress is None:
+                    text = "".join(page + "\n" for page in pdf.iter_page_texts())
+                else:
+                    on_progress(pages_total=pdf.page_count, pages_parsed=0)
+                    pages = []
+                    for page in pdf.iter_page_texts():
+                        pages.append(page + "\n")
+                        on_progress(pages_parsed=len(pages))
+                    text = "".join(pages)
+                backend = pdf.backend_name
             
-            text = ""
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-            
-            logger.info(f"Extracted {len(text)} characters from {pdf_path}")
+            logger.info(f"Extracted {len(text)} characters from {pdf_path} ({backend})")
             return text
-        except ImportError:
-            logger.error("PyPDF2 not installed. Install: pip install PyPDF2")
+        except ImportError as e:
+            logger.error(str(e))
             return ""
         except Exception as e:
             logger.error(f"Error extracting text from PDF: {e}")
             return ""
     
+    @property
+    def chunker(self) -> TokenChunker:
+        """Chunker sized to the embedding model's tokenizer and sequence limit"""
+        if self._chunker is None:
+            count_tokens, max_seq_length = model_token_counter(self.embedding_model)
+            max_tokens = self.chunk_tokens
+            if max_seq_length:
+                # Leave room for the [CLS] / [SEP] special tokens
+                max_tokens = min(max_tokens, max_seq_length - 2)
+            self._chunker = TokenChunker(max_tokens, self.chunk_overlap_tokens, count_tokens)
+            logger.info(f"RAG chunker: {max_tokens} tokens per chunk, {self.chunk_overlap_tokens} overlap")
+        return self._chunker
+    
+    def iter_chunks(self, text: str) -> Iterator[str]:
+        """Yield overlapping, token-bounded chunks without materializing them all"""
+        return self.chunker.iter_chunks(text)
+    
     def chunk_text(self, text: str) -> List[str]:
         """Split text into overlapping chunks"""
-        chunks = []
-        start = 0
-        
-        while start < len(text):
-            end = start + self.chunk_size
-            chunk = text[start:end]
-            
-            # Try to break at sentence boundary
-            if end < len(text):
-                last_period = chunk.rfind('.')
-                last_newline = chunk.rfind('\n')
-                break_point = max(last_period, last_newline)
-                
-                if break_point > 0:
-                    chunk = chunk[:break_point + 1]
-                    end = start + break_point + 1
-            
-            chunks.append(chunk.strip())
-            start = end - self.chunk_overlap
-        
+        chunks = list(self.iter_chunks(text))
         logger.info(f"Created {len(chunks)} chunks from text")
         return chunks
     
+    def _rfp_filter(self, rfp_id: str):
+        """Payload filter selecting one RFP's chunks"""
+        return self.models.Filter(
+            must=[
+                self.models.FieldCondition(
+                    key="rfp_id",
+                    match=self.models.MatchValue(value=rfp_id)
+                )
+            ]
+        )
+    
+    def _existing_chunks(self, rfp_id: str) -> Dict[str, Any]:
+        """Point ID -> chunk_index of everything stored for an RFP (no text or vectors)"""
+        existing = {}
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=self._rfp_filter(rfp_id),
+                limit=1000,
+                offset=offset,
+                with_payload=["chunk_index"],
+                with_vectors=False
+            )
+            for point in points:
+                existing[str(point.id)] = (point.payload or {}).get("chunk_index")
+            if offset is None:
+                return existing
+    
     def ingest_document(
         self, 
         pdf_path: str, 
         rfp_id: str, 
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        document: Optional[ParsedDocument] = None,
+        on_progress: Optional[ProgressCallback] = None
     ) -> bool:
         """
         Ingest a PDF document into Qdrant
         
+        Re-ingestion is incremental: point IDs derive from (rfp_id, chunk
+        text), so chunks already stored are not embedded again and chunks
+        no longer in the document are removed.
+        
         Args:
             pdf_path: Path to PDF file
             rfp_id: RFP ID for reference
             metadata: Additional metadata (title, source, etc.)
+            document: Already parsed document; skips re-reading the PDF
+            on_progress: Called with pages_parsed/pages_total, chunks_embedded,
+                chunks_upserted as they advance, and the ingest stats at the end
         
         Returns:
             True if successful, False otherwise
@@ -126,50 +248,235 @@ class DocumentRAGService:
             return False
         
         try:
-            # Extract text from PDF
-            text = self.extract_text_from_pdf(pdf_path)
+            # Reuse the pipeline's parsed text when available
+            if document is not None:
+                text = document.text
+                if on_progress is not None:
+                    pages = len(document.page_texts)
+                    on_progress(pages_total=pages, pages_parsed=pages)
+            else:
+                text = self.extract_text_from_pdf(pdf_path, on_progress)
             if not text:
                 logger.warning(f"No text extracted from {pdf_path}")
                 return False
             
-            # Split into chunks
-            chunks = self.chunk_text(text)
+            existing = self._existing_chunks(rfp_id)
+            seen = set()
+            moved = []
+            preview = []
             
-            # Generate embeddings and store in Qdrant
-            points = []
-            for i, chunk in enumerate(chunks):
-                # Generate embedding
-                embedding = self.embedding_model.encode(chunk).tolist()
-                
-                # Create point
-                point_id = str(uuid.uuid4())
-                point = self.models.PointStruct(
-                    id=point_id,
-                    vector=embedding,
-                    payload={
-                        "rfp_id": rfp_id,
-                        "chunk_index": i,
-                        "text": chunk,
-                        "pdf_path": pdf_path,
-                        "ingested_at": datetime.now().isoformat(),
-                        **(metadata or {})
-                    }
-                )
-                points.append(point)
+            def new_entries():
+                # Chunks stream straight into embedding; identical chunks are stored once
+                for i, chunk in enumerate(self.iter_chunks(text)):
+                    if i < PREVIEW_CHUNKS:
+                        preview.append(_preview(i, chunk))
+                    point_id = chunk_point_id(rfp_id, chunk)
+                    if point_id in seen:
+                        continue
+                    seen.add(point_id)
+                    if point_id not in existing:
+                        yield point_id, i, chunk
+                    elif existing[point_id] != i:
+                        moved.append((point_id, i))
             
-            # Upload to Qdrant
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=points
+            document_payload = {
+                "pdf_path": pdf_path,
+                "ingested_at": datetime.now().isoformat(),
+                **(metadata or {})
+            }
+            stats = self._embed_and_upsert(new_entries(), rfp_id, document_payload, on_progress)
+            
+            # Unchanged chunks get the new document metadata, and their new
+            # position if they moved within the document
+            self._refresh_payloads(
+                [point_id for point_id in existing if point_id in seen],
+                dict(moved),
+                document_payload
             )
             
-            logger.info(f"Ingested {len(chunks)} chunks from {pdf_path} for RFP {rfp_id}")
+            # Drop chunks of the previous version (after the new ones are in)
+            stale = [point_id for point_id in existing if point_id not in seen]
+            if stale:
+                self.client.delete(
+                    collection_name=self.collection_name,
+                    points_selector=self.models.PointIdsList(points=stale)
+                )
+                if self.text_store is not None:
+                    self.text_store.delete(stale)
+            
+            if stats["chunks"] or existing:
+                self.result_cache.invalidate(rfp_id)
+            
+            stats.update({
+                "total_chunks": len(seen),
+                "skipped": len(seen) - stats["chunks"],
+                "reindexed": len(moved),
+                "removed": len(stale)
+            })
+            self.last_ingest_stats = stats
+            self._save_stats(rfp_id, pdf_path, stats, preview)
+            if on_progress is not None:
+                on_progress(**stats)
+            
+            logger.info(
+                f"Ingested {pdf_path} for RFP {rfp_id}: {stats['chunks']} new chunks, "
+                f"{stats['skipped']} unchanged, {stats['removed']} removed "
+                f"in {stats['seconds']:.2f}s ({stats['chunks_per_second']:.1f} chunks/s; "
+                f"embed {stats['embed_seconds']:.2f}s, upsert {stats['upsert_seconds']:.2f}s)"
+            )
             return True
             
         except Exception as e:
             logger.error(f"Error ingesting document: {e}")
+            # Some batches may have been written before the failure
+            self.result_cache.invalidate(rfp_id)
             return False
     
+    def _refresh_payloads(
+        self,
+        point_ids: List[str],
+        moved: Dict[str, int],
+        document_payload: Dict[str, Any]
+    ) -> None:
+        """
+        Set document-level payload fields on already stored chunks, plus
+        chunk_index on those that moved, in batched update requests
+        
+        Args:
+            point_ids: Stored chunks still in the document
+            moved: Point ID -> new chunk_index
+            document_payload: pdf_path, ingested_at and metadata fields
+        """
+        SetPayload, SetPayloadOperation = self.models.SetPayload, self.models.SetPayloadOperation
+        unmoved = [point_id for point_id in point_ids if point_id not in moved]
+        operations = [
+            SetPayloadOperation(set_payload=SetPayload(
+                payload=document_payload,
+                points=unmoved[start:start + self.upsert_batch_size]
+            ))
+            for start in range(0, len(unmoved), self.upsert_batch_size)
+        ]
+        operations.extend(
+            SetPayloadOperation(set_payload=SetPayload(
+                payload={**document_payload, "chunk_index": chunk_index},
+                points=[point_id]
+            ))
+            for point_id, chunk_index in moved.items()
+        )
+        for start in range(0, len(operations), self.upsert_batch_size):
+            self.client.batch_update_points(
+                collection_name=self.collection_name,
+                update_operations=operations[start:start + self.upsert_batch_size]
+            )
+    
+    def _embed_and_upsert(
+        self,
+        entries: Iterable[Tuple[str, int, str]],
+        rfp_id: str,
+        document_payload: Dict[str, Any],
+        on_progress: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Embed chunks in batches and stream them to Qdrant in bounded upserts
+        
+        Args:
+            entries: (point ID, chunk index, chunk text) per chunk to store
+            rfp_id: RFP ID for reference
+            document_payload: Payload fields shared by all chunks (pdf_path,
+                ingested_at, metadata)
+            on_progress: Receives chunks_embedded / chunks_upserted after each batch
+        
+        Only one upsert batch of points is held in memory at a time (plus
+        up to upload_parallelism batches being uploaded).
+        
+        Returns:
+            Ingestion stats: chunks, seconds, embed/upsert seconds, chunks_per_second
+        """
+        start = time.perf_counter()
+        embed_seconds = 0.0
+        upsert_seconds = 0.0
+        total = 0
+        upserted = 0
+        entries = iter(entries)
+        
+        def upload(points):
+            upload_start = time.perf_counter()
+            self.client.upsert(
+                collection_name=self.collection_name,
+                points=points
+            )
+            return time.perf_counter() - upload_start, len(points)
+        
+        def uploaded(result):
+            nonlocal upsert_seconds, upserted
+            upsert_seconds += result[0]
+            upserted += result[1]
+            if on_progress is not None:
+                on_progress(chunks_upserted=upserted)
+        
+        executor = ThreadPoolExecutor(max_workers=self.upload_parallelism) if self.upload_parallelism > 1 else None
+        in_flight = []
+        try:
+            while True:
+                batch = list(islice(entries, self.upsert_batch_size))
+                if not batch:
+                    break
+                total += len(batch)
+                
+                # Generate embeddings (batched forward passes)
+                embed_start = time.perf_counter()
+                embeddings = self.embedding_model.encode(
+                    [chunk for _, _, chunk in batch],
+                    batch_size=self.embed_batch_size,
+                    convert_to_numpy=True
+                )
+                embed_seconds += time.perf_counter() - embed_start
+                if on_progress is not None:
+                    on_progress(chunks_embedded=total)
+                
+                # Out-of-band text is written first so no searchable point lacks it
+                if self.text_store is not None:
+                    self.text_store.put_many(rfp_id, ((point_id, chunk) for point_id, _, chunk in batch))
+                
+                points = [
+                    self.models.PointStruct(
+                        id=point_id,
+                        vector=embedding.tolist(),
+                        payload={
+                            "rfp_id": rfp_id,
+                            "chunk_index": chunk_index,
+                            **({} if self.text_store is not None else {"text": chunk}),
+                            **document_payload
+                        }
+                    )
+                    for (point_id, chunk_index, chunk), embedding in zip(batch, embeddings)
+                ]
+                
+                # Upload to Qdrant
+                if executor is None:
+                    uploaded(upload(points))
+                    continue
+                
+                in_flight.append(executor.submit(upload, points))
+                if len(in_flight) >= self.upload_parallelism:
+                    # Bound memory: wait for the oldest upload before embedding more
+                    uploaded(in_flight.pop(0).result())
+            
+            for future in in_flight:
+                uploaded(future.result())
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        
+        seconds = time.perf_counter() - start
+        return {
+            "chunks": total,
+            "seconds": round(seconds, 3),
+            "embed_seconds": round(embed_seconds, 3),
+            "upsert_seconds": round(upsert_seconds, 3),
+            "chunks_per_second": round(total / seconds, 1) if seconds > 0 else 0.0
+        }
+    
     def query_documents(
         self, 
         query: str, 
@@ -191,6 +498,11 @@ class DocumentRAGService:
             logger.error("Qdrant client not initialized")
             return []
         
+        cached = self.result_cache.get(query, rfp_id, limit)
+        if cached is not None:
+            logger.info(f"Found {len(cached)} relevant chunks for query (cached): {query}")
+            return cached
+        
         try:
             # Generate query embedding
             query_embedding = self.embedding_model.encode(query).tolist()
@@ -198,44 +510,99 @@ class DocumentRAGService:
             # Build filter
             query_filter = None
             if rfp_id:
-                query_filter = self.models.Filter(
-                    must=[
-                        self.models.FieldCondition(
-                            key="rfp_id",
-                            match=self.models.MatchValue(value=rfp_id)
-                        )
-                    ]
-                )
+                query_filter = self._rfp_filter(rfp_id)
             
             # Search in Qdrant
             results = self.client.search(
                 collection_name=self.collection_name,
                 query_vector=query_embedding,
                 query_filter=query_filter,
-                limit=limit
+                limit=limit,
+                search_params=self.storage.search_params(self.models)
             )
             
-            # Format results
-            formatted_results = []
-            for result in results:
-                formatted_results.append({
-                    "text": result.payload.get("text", ""),
-                    "score": result.score,
-                    "rfp_id": result.payload.get("rfp_id", ""),
-                    "chunk_index": result.payload.get("chunk_index", 0),
-                    "metadata": {
-                        k: v for k, v in result.payload.items() 
-                        if k not in ["text", "rfp_id", "chunk_index"]
-                    }
-                })
+            formatted_results = self._format_results(results)
             
             logger.info(f"Found {len(formatted_results)} relevant chunks for query: {query}")
+            self.result_cache.put(query, rfp_id, limit, formatted_results)
             return formatted_results
             
         except Exception as e:
             logger.error(f"Error querying documents: {e}")
             return []
     
+    def _chunk_texts(self, points: List[Any]) -> Dict[str, str]:
+        """Point ID -> chunk text, from the payload or the out-of-band store"""
+        texts = {str(p.id): p.payload["text"] for p in points if "text" in (p.payload or {})}
+        missing = [str(p.id) for p in points if str(p.id) not in texts]
+        if missing and self.text_store is not None:
+            texts.update(self.text_store.get_many(missing))
+        return texts
+    
+    def _format_results(self, results: List[Any]) -> List[Dict[str, Any]]:
+        """Shape search hits as chunk dicts with metadata"""
+        texts = self._chunk_texts(results)
+        formatted_results = []
+        for result in results:
+            formatted_results.append({
+                "text": texts.get(str(result.id), ""),
+                "score": result.score,
+                "rfp_id": result.payload.get("rfp_id", ""),
+                "chunk_index": result.payload.get("chunk_index", 0),
+                "metadata": {
+                    k: v for k, v in result.payload.items() 
+                    if k not in ["text", "rfp_id", "chunk_index"]
+                }
+            })
+        return formatted_results
+    
+    def _save_stats(
+        self,
+        rfp_id: str,
+        pdf_path: str,
+        stats: Dict[str, Any],
+        preview: List[Dict[str, Any]]
+    ) -> None:
+        """Store the RFP's ingest summary (best effort; stats fall back to counting)"""
+        if not self.store_ingest_stats:
+            return
+        try:
+            self.client.upsert(
+                collection_name=self.stats_collection_name,
+                points=[
+                    self.models.PointStruct(
+                        id=stats_point_id(rfp_id),
+                        vector=[1.0],
+                        payload={
+                            "rfp_id": rfp_id,
+                            "pdf_path": pdf_path,
+                            "ingested_at": datetime.now().isoformat(),
+                            "total_chunks": stats["total_chunks"],
+                            "chunks_preview": preview,
+                            "last_ingest": stats
+                        }
+                    )
+                ]
+            )
+        except Exception as e:
+            logger.warning(f"Could not store ingest stats for RFP {rfp_id}: {e}")
+    
+    def _load_stats(self, rfp_id: str) -> Optional[Dict[str, Any]]:
+        """Stored ingest summary of an RFP, or None"""
+        if not self.store_ingest_stats:
+            return None
+        try:
+            points = self.client.retrieve(
+                collection_name=self.stats_collection_name,
+                ids=[stats_point_id(rfp_id)],
+                with_payload=True,
+                with_vectors=False
+            )
+        except Exception as e:
+            logger.warning(f"Could not read ingest stats for RFP {rfp_id}: {e}")
+            return None
+        return points[0].payload if points else None
+    
     def delete_document(self, rfp_id: str) -> bool:
         """Delete all chunks for a specific RFP"""
         if not self.client:
@@ -246,56 +613,89 @@ class DocumentRAGService:
             self.client.delete(
                 collection_name=self.collection_name,
                 points_selector=self.models.FilterSelector(
-                    filter=self.models.Filter(
-                        must=[
-                            self.models.FieldCondition(
-                                key="rfp_id",
-                                match=self.models.MatchValue(value=rfp_id)
-                            )
-                        ]
-                    )
+                    filter=self._rfp_filter(rfp_id)
                 )
             )
+            if self.store_ingest_stats:
+                self.client.delete(
+                    collection_name=self.stats_collection_name,
+                    points_selector=self.models.PointIdsList(points=[stats_point_id(rfp_id)])
+                )
+            if self.text_store is not None:
+                self.text_store.delete_rfp(rfp_id)
             logger.info(f"Deleted document chunks for RFP {rfp_id}")
             return True
         except Exception as e:
             logger.error(f"Error deleting document: {e}")
             return False
+        finally:
+            self.result_cache.invalidate(rfp_id)
     
-    def get_document_stats(self, rfp_id: str) -> Dict[str, Any]:
-        """Get statistics about ingested document"""
+    def get_document_stats(self, rfp_id: str, exact: bool = False) -> Dict[str, Any]:
+        """
+        Get statistics about ingested document
+        
+        Reads the summary stored at ingest time (one point lookup). RFPs
+        ingested before summaries existed are counted with the count API
+        and previewed from a few points, without vectors.
+        
+        Args:
+            rfp_id: RFP ID
+            exact: Count the RFP's chunks even when a summary is stored
+        
+        Returns:
+            rfp_id, total_chunks, ingested, chunks_preview (plus the stored
+            ingest summary fields when available)
+        """
         if not self.client:
             return {"error": "Qdrant client not initialized"}
         
         try:
-            # Count chunks for this RFP
-            results = self.client.scroll(
-                collection_name=self.collection_name,
-                scroll_filter=self.models.Filter(
-                    must=[
-                        self.models.FieldCondition(
-                            key="rfp_id",
-                            match=self.models.MatchValue(value=rfp_id)
-                        )
-                    ]
-                ),
-                limit=1000
-            )
+            summary = self._load_stats(rfp_id)
             
-            chunks = results[0]
+            if summary is not None and not exact:
+                total_chunks = summary.get("total_chunks", 0)
+            else:
+                total_chunks = self.client.count(
+                    collection_name=self.collection_name,
+                    count_filter=self._rfp_filter(rfp_id),
+                    exact=True
+                ).count
             
-            return {
+            if summary is not None:
+                preview = summary.get("chunks_preview", [])
+            elif total_chunks:
+                points, _ = self.client.scroll(
+                    collection_name=self.collection_name,
+                    scroll_filter=self._rfp_filter(rfp_id),
+                    limit=PREVIEW_CHUNKS,
+                    with_payload=["chunk_index", "text"],
+                    with_vectors=False
+                )
+                texts = self._chunk_texts(points)
+                preview = sorted(
+                    (
+                        _preview(p.payload.get("chunk_index", 0), texts.get(str(p.id), ""))
+                        for p in points
+                    ),
+                    key=lambda c: c["index"]
+                )
+            else:
+                preview = []
+            
+            stats = {
                 "rfp_id": rfp_id,
-                "total_chunks": len(chunks),
-                "ingested": len(chunks) > 0,
-                "chunks_preview": [
-                    {
-                        "index": c.payload.get("chunk_index", 0),
-                        "text_preview": c.payload.get("text", "")[:100] + "..."
-                    }
-                    for c in chunks[:3]
-                ]
+                "total_chunks": total_chunks,
+                "ingested": total_chunks > 0,
+                "chunks_preview": preview
             }
+            if summary is not None:
+                stats.update({
+                    "pdf_path": summary.get("pdf_path"),
+                    "ingested_at": summary.get("ingested_at"),
+                    "last_ingest": summary.get("last_ingest", {})
+                })
+            return stats
         except Exception as e:
             logger.error(f"Error getting document stats: {e}")
             return {"error": str(e)}
@@ -303,10 +703,14 @@ class DocumentRAGService:
 
 # Global instance
 _rag_service = None
+_rag_service_lock = Lock()
 
 def get_rag_service() -> DocumentRAGService:
     """Get or create RAG service instance"""
     global _rag_service
     if _rag_service is None:
-        _rag_service = DocumentRAGService()
+        # Async handlers and ingestion workers may ask for it concurrently
+        with _rag_service_lock:
+            if _rag_service is None:
+                _rag_service = DocumentRAGService()
     return _rag_service
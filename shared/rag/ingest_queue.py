@@ -0,0 +1,385 @@
+"""
+RAG Ingestion Queue - Background document ingestion with per-job progress
+"""
+import json
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from shared.models import ParsedDocument
+from .document_rag import DocumentRAGService, get_rag_service
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+# Reported by wait() for a job whose record is gone (expired or trimmed)
+UNKNOWN = "unknown"
+ACTIVE_STATES = (QUEUED, RUNNING)
+
+
+class IngestProgressStore:
+    """
+    Ingestion job records (status and progress counters)
+
+    Records live in memory, newest last; finished jobs beyond max_jobs are
+    dropped unless pinned by a caller that still has to read them. With
+    Redis enabled every update is mirrored there as JSON, so the API
+    process sees progress of jobs running in Celery workers.
+    """
+
+    def __init__(self, max_jobs: Optional[int] = None, use_redis: Optional[bool] = None, redis_ttl: Optional[int] = None):
+        """
+        Args:
+            max_jobs: Job records kept in memory
+            use_redis: Mirror records through RedisManager
+            redis_ttl: Expiry of Redis records in seconds
+        """
+        self.max_jobs = max_jobs or int(os.getenv("RAG_INGEST_HISTORY", 200))
+        self.redis_ttl = redis_ttl if redis_ttl is not None else int(os.getenv("RAG_INGEST_PROGRESS_TTL", 86400))
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Jobs kept past max_jobs until unpinned
+        self._pinned: Set[str] = set()
+        self._lock = Lock()
+
+        if use_redis is None:
+            use_redis = os.getenv("RAG_INGEST_PROGRESS_REDIS", "false").lower() == "true"
+        self.redis = None
+        if use_redis:
+            try:
+                from shared.cache.redis_manager import RedisManager
+                manager = RedisManager()
+                if manager.connected:
+                    self.redis = manager.client
+            except Exception as e:
+                logger.warning(f"Redis ingestion progress unavailable: {e}")
+
+    @staticmethod
+    def _redis_key(job_id: str) -> str:
+        return f"rag_ingest:{job_id}"
+
+    def _mirror(self, job: Dict[str, Any]) -> None:
+        if not self.redis:
+            return
+        try:
+            self.redis.set(self._redis_key(job['job_id']), json.dumps(job), ex=self.redis_ttl or None)
+        except Exception as e:
+            logger.warning(f"Redis ingestion progress update failed: {e}")
+
+    def _trim(self) -> None:
+        """Forget the oldest finished, unpinned jobs beyond max_jobs (lock held)"""
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.max_jobs:
+                break
+            if self._jobs[job_id].get('status') not in ACTIVE_STATES and job_id not in self._pinned:
+                del self._jobs[job_id]
+
+    def create(self, job: Dict[str, Any], pin: bool = False) -> Dict[str, Any]:
+        with self._lock:
+            self._jobs[job['job_id']] = job
+            if pin:
+                self._pinned.add(job['job_id'])
+            self._trim()
+            snapshot = dict(job)
+        self._mirror(snapshot)
+        return snapshot
+
+    def unpin(self, job_ids: Iterable[str]) -> None:
+        """Let pinned jobs be trimmed again"""
+        with self._lock:
+            self._pinned.difference_update(job_ids)
+            self._trim()
+
+    def update(self, job_id: str, **fields) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                # Job created by another process (Celery worker side)
+                job = self._load(job_id) or {'job_id': job_id}
+                self._jobs[job_id] = job
+                self._trim()
+            job.update(fields)
+            job['updated_at'] = datetime.now().isoformat()
+            snapshot = dict(job)
+        self._mirror(snapshot)
+
+    def _load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        if not self.redis:
+            return None
+        try:
+            value = self.redis.get(self._redis_key(job_id))
+        except Exception as e:
+            logger.warning(f"Redis ingestion progress lookup failed: {e}")
+            return None
+        return json.loads(value) if value else None
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Latest record of a job (Redis first, it may be updated elsewhere)"""
+        job = self._load(job_id)
+        if job is not None:
+            return job
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def list(self, rfp_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Records of jobs submitted from this process, newest first"""
+        with self._lock:
+            job_ids = [
+                job_id for job_id, job in self._jobs.items()
+                if rfp_id is None or job.get('rfp_id') == rfp_id
+            ]
+        jobs = (self.get(job_id) for job_id in reversed(job_ids))
+        return [job for job in jobs if job is not None]
+
+
+class RAGIngestionQueue:
+    """
+    Queue of document ingestion jobs run outside the request
+
+    Jobs run on a small worker pool (RAG_INGEST_WORKERS) or, with
+    RAG_INGEST_BACKEND=celery, as Celery tasks on their own queue so
+    ingestion workers can be scaled separately from RFP processing.
+    Either way at most max_pending jobs wait or run at once, which keeps
+    bulk ingestion from crowding out interactive matching and copilot
+    queries that share the embedding model. A Celery job no worker has
+    started within queued_timeout seconds is marked failed, so it stops
+    counting as pending (a worker reaching it later skips it).
+
+    Each job reports pages parsed, chunks embedded and chunks upserted
+    through IngestProgressStore.
+    """
+
+    def __init__(
+        self,
+        service: Optional[DocumentRAGService] = None,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        backend: Optional[str] = None,
+        store: Optional[IngestProgressStore] = None,
+        queued_timeout: Optional[float] = None
+    ):
+        """
+        Args:
+            service: RAG service used by thread workers (default: the global one)
+            workers: Concurrent ingestion jobs in this process
+            max_pending: Queued plus running jobs accepted before submit() refuses
+            backend: 'thread' or 'celery'
+            store: Progress store (Celery needs Redis to report progress back)
+            queued_timeout: Seconds a Celery job may wait for a worker; 0 waits forever
+        """
+        self._service = service
+        self.workers = workers or int(os.getenv("RAG_INGEST_WORKERS", 1))
+        self.max_pending = max_pending or int(os.getenv("RAG_INGEST_MAX_PENDING", 50))
+        self.backend = (backend or os.getenv("RAG_INGEST_BACKEND", "thread")).lower()
+        self.queued_timeout = queued_timeout if queued_timeout is not None else float(
+            os.getenv("RAG_INGEST_QUEUED_TIMEOUT", 3600)
+        )
+        self.store = store or IngestProgressStore(use_redis=True if self.backend == "celery" else None)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = Lock()
+
+    @property
+    def service(self) -> DocumentRAGService:
+        if self._service is None:
+            self._service = get_rag_service()
+        return self._service
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="rag-ingest-job")
+        return self._executor
+
+    def _expire(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Fail a Celery job that waited for a worker longer than queued_timeout"""
+        if (
+            job.get('status') != QUEUED
+            or job.get('backend') != "celery"
+            or not self.queued_timeout
+            or not job.get('submitted_at')
+        ):
+            return job
+        waited = (datetime.now() - datetime.fromisoformat(job['submitted_at'])).total_seconds()
+        if waited < self.queued_timeout:
+            return job
+        error = f"Not started by a worker within {self.queued_timeout:g}s"
+        logger.warning(f"Ingestion job {job['job_id']} for RFP {job.get('rfp_id')}: {error}")
+        self.store.update(job['job_id'], status=FAILED, error=error, finished_at=datetime.now().isoformat())
+        return self.store.get(job['job_id']) or job
+
+    def _active(self, rfp_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        return [job for job in self.jobs(rfp_id) if job.get('status') in ACTIVE_STATES]
+
+    def submit(
+        self,
+        pdf_path: str,
+        rfp_id: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        document: Optional[ParsedDocument] = None,
+        pin: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Queue a document for ingestion
+
+        A document already queued or running for the same RFP returns
+        that job instead of a new one.
+
+        Args:
+            pdf_path: Path to PDF file
+            rfp_id: RFP ID for reference
+            metadata: Additional metadata (title, source, etc.)
+            document: Already parsed document (thread backend only; Celery
+                workers re-read pdf_path)
+            pin: Keep the job record past RAG_INGEST_HISTORY until release(),
+                for callers that wait() on many jobs
+
+        Returns:
+            Job record (job_id, status, progress counters)
+
+        Raises:
+            RuntimeError: Too many jobs are pending
+        """
+        with self._lock:
+            active = self._active()
+            for job in active:
+                if job.get('rfp_id') == rfp_id and job.get('pdf_path') == pdf_path:
+                    return job
+            if len(active) >= self.max_pending:
+                raise RuntimeError(f"Ingestion queue is full ({len(active)} pending jobs)")
+
+            job = self.store.create({
+                'job_id': str(uuid.uuid4()),
+                'rfp_id': rfp_id,
+                'pdf_path': pdf_path,
+                'status': QUEUED,
+                'backend': self.backend,
+                'submitted_at': datetime.now().isoformat(),
+                'started_at': None,
+                'finished_at': None,
+                'pages_total': None,
+                'pages_parsed': 0,
+                'chunks_embedded': 0,
+                'chunks_upserted': 0,
+                'error': None
+            }, pin=pin)
+
+        if self.backend == "celery":
+            if document is not None:
+                logger.info(f"Parsed document for {rfp_id} not sent to Celery; the worker re-reads {pdf_path}")
+            try:
+                from orchestrator.tasks.rfp_tasks import ingest_rag_document_task
+                ingest_rag_document_task.apply_async(
+                    args=[job['job_id'], pdf_path, rfp_id, metadata],
+                    queue=os.getenv("RAG_INGEST_CELERY_QUEUE", "rag_ingest")
+                )
+            except Exception as e:
+                logger.error(f"Could not queue ingestion task for {rfp_id}: {e}")
+                self.store.update(job['job_id'], status=FAILED, error=str(e), finished_at=datetime.now().isoformat())
+                return self.store.get(job['job_id'])
+        else:
+            self._get_executor().submit(self.run_job, job['job_id'], pdf_path, rfp_id, metadata, document)
+
+        logger.info(f"Queued RAG ingestion of {pdf_path} for RFP {rfp_id} (job {job['job_id']})")
+        return job
+
+    def run_job(
+        self,
+        job_id: str,
+        pdf_path: str,
+        rfp_id: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        document: Optional[ParsedDocument] = None
+    ) -> bool:
+        """Run one ingestion job and record its progress (worker side)"""
+        job = self.store.get(job_id)
+        if job is not None and job.get('status') == FAILED:
+            # Expired while queued (see queued_timeout); don't resurrect it
+            logger.warning(f"Skipping ingestion job {job_id}: {job.get('error')}")
+            return False
+
+        self.store.update(job_id, rfp_id=rfp_id, pdf_path=pdf_path, status=RUNNING, started_at=datetime.now().isoformat())
+        try:
+            success = self.service.ingest_document(
+                pdf_path=pdf_path,
+                rfp_id=rfp_id,
+                metadata=metadata,
+                document=document,
+                on_progress=lambda **fields: self.store.update(job_id, **fields)
+            )
+            error = None if success else "Ingestion failed (see service logs)"
+        except Exception as e:
+            logger.error(f"Error in ingestion job {job_id}: {e}")
+            success, error = False, str(e)
+
+        self.store.update(
+            job_id,
+            status=COMPLETED if success else FAILED,
+            error=error,
+            finished_at=datetime.now().isoformat()
+        )
+        return success
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self.store.get(job_id)
+        return self._expire(job) if job is not None else None
+
+    def jobs(self, rfp_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        return [self._expire(job) for job in self.store.list(rfp_id)]
+
+    def release(self, job_ids: Iterable[str]) -> None:
+        """Unpin jobs submitted with pin=True once their result has been read"""
+        self.store.unpin(job_ids)
+
+    def wait(self, job_ids: Iterable[str], timeout: Optional[float] = None, poll_seconds: float = 1.0) -> List[Dict[str, Any]]:
+        """
+        Block until the jobs finish (or timeout)
+
+        Returns:
+            Latest record of each job; status UNKNOWN if its record is gone
+        """
+        job_ids = list(job_ids)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            jobs = [self.get(job_id) or {'job_id': job_id, 'status': UNKNOWN} for job_id in job_ids]
+            if all(job.get('status') not in ACTIVE_STATES for job in jobs):
+                return jobs
+            if deadline is not None and time.monotonic() >= deadline:
+                return jobs
+            time.sleep(poll_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        jobs = self.jobs()
+        counts = {state: 0 for state in (QUEUED, RUNNING, COMPLETED, FAILED)}
+        for job in jobs:
+            if job.get('status') in counts:
+                counts[job['status']] += 1
+        return {
+            'backend': self.backend,
+            'workers': self.workers,
+            'max_pending': self.max_pending,
+            **counts
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+# Global instance
+_ingestion_queue = None
+
+def get_ingestion_queue() -> RAGIngestionQueue:
+    """Get or create RAG ingestion queue instance"""
+    global _ingestion_queue
+    if _ingestion_queue is None:
+        _ingestion_queue = RAGIngestionQueue()
+    return _ingestion_queue
@@ -0,0 +1,194 @@
+"""
+RAG Result Cache - TTL cache of query_documents results with per-RFP invalidation
+"""
+import copy
+import logging
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from shared.embeddings.query_cache import normalize_query
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, Optional[str], int]
+Generations = Tuple[int, ...]
+
+_GENERATION_PREFIX = "rag_result_cache"
+
+
+class RAGResultCache:
+    """
+    LRU + TTL cache of RAG search results keyed by (normalized query, rfp_id, limit)
+
+    Copilot users often repeat the same question about the same RFP. Entries
+    expire after ttl_seconds and are dropped as soon as that RFP's chunks
+    change (ingest or delete). Unscoped searches (rfp_id=None) can return
+    chunks of any RFP, so they are dropped on every change.
+
+    When chunks can change in another process (Celery ingestion workers),
+    invalidations also bump generation counters in Redis. Each entry keeps
+    the generations seen before its search, and a lookup whose generations
+    moved on is a miss; this costs one Redis round trip per lookup.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        use_redis: Optional[bool] = None
+    ):
+        """
+        Args:
+            max_size: Maximum cached queries
+            ttl_seconds: Lifetime of an entry; 0 disables the cache
+            use_redis: Share invalidations through Redis (default
+                RAG_RESULT_CACHE_REDIS; always on with RAG_INGEST_BACKEND=celery)
+        """
+        self.max_size = max_size if max_size is not None else int(os.getenv("RAG_RESULT_CACHE_SIZE", 1024))
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv("RAG_RESULT_CACHE_TTL", 300)
+        )
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Generations, List[Dict[str, Any]]]]" = OrderedDict()
+        self._by_rfp: Dict[Optional[str], Set[CacheKey]] = {}
+        # Generations read by a miss, for the put() that follows its search
+        self._miss_generations: Dict[CacheKey, Generations] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+        if use_redis is None:
+            use_redis = (
+                os.getenv("RAG_RESULT_CACHE_REDIS", "false").lower() == "true"
+                or os.getenv("RAG_INGEST_BACKEND", "thread").lower() == "celery"
+            )
+        self.redis = None
+        if use_redis and self.enabled:
+            try:
+                from shared.cache.redis_manager import RedisManager
+                manager = RedisManager()
+                if manager.connected:
+                    self.redis = manager.client
+            except Exception as e:
+                logger.warning(f"Redis RAG cache invalidation unavailable: {e}")
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_size > 0
+
+    @staticmethod
+    def key(query: str, rfp_id: Optional[str], limit: int) -> CacheKey:
+        return normalize_query(query), rfp_id, limit
+
+    @staticmethod
+    def _generation_keys(rfp_id: Optional[str]) -> List[str]:
+        """Counters that change whenever results for rfp_id may change"""
+        if rfp_id is None:
+            # Unscoped results change with any RFP
+            return [f"{_GENERATION_PREFIX}:any"]
+        return [f"{_GENERATION_PREFIX}:rfp:{rfp_id}", f"{_GENERATION_PREFIX}:all"]
+
+    def _generations(self, rfp_id: Optional[str]) -> Optional[Generations]:
+        """Shared generations for rfp_id; () without Redis, None if Redis failed"""
+        if not self.redis:
+            return ()
+        try:
+            return tuple(int(v or 0) for v in self.redis.mget(self._generation_keys(rfp_id)))
+        except Exception as e:
+            logger.warning(f"Redis RAG cache generation lookup failed: {e}")
+            return None
+
+    def _drop(self, key: CacheKey) -> None:
+        self._entries.pop(key, None)
+        keys = self._by_rfp.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_rfp[key[1]]
+
+    def get(self, query: str, rfp_id: Optional[str], limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Cached results (a copy), or None on a miss or expired entry"""
+        if not self.enabled:
+            return None
+        key = self.key(query, rfp_id, limit)
+        generations = self._generations(rfp_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic() or entry[1] != generations:
+                if entry is not None:
+                    self._drop(key)
+                if generations is not None:
+                    self._miss_generations[key] = generations
+                    if len(self._miss_generations) > self.max_size:
+                        # Searches that failed never put(); forget the oldest
+                        del self._miss_generations[next(iter(self._miss_generations))]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            results = entry[2]
+        return copy.deepcopy(results)
+
+    def put(self, query: str, rfp_id: Optional[str], limit: int, results: List[Dict[str, Any]]) -> None:
+        if not self.enabled:
+            return
+        key = self.key(query, rfp_id, limit)
+        with self._lock:
+            generations = self._miss_generations.pop(key, None)
+        if generations is None:
+            # No preceding miss (or Redis failed); a later invalidation could be missed
+            if self.redis:
+                return
+            generations = ()
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, generations, copy.deepcopy(results))
+            self._entries.move_to_end(key)
+            self._by_rfp.setdefault(rfp_id, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, rfp_id: Optional[str] = None) -> int:
+        """
+        Drop cached results affected by a change to rfp_id's chunks
+        (None drops everything)
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            if rfp_id is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._by_rfp.clear()
+            else:
+                keys = self._by_rfp.get(rfp_id, set()) | self._by_rfp.get(None, set())
+                for key in keys:
+                    self._drop(key)
+                dropped = len(keys)
+            self.invalidations += 1
+        if self.redis:
+            try:
+                pipe = self.redis.pipeline()
+                pipe.incr(f"{_GENERATION_PREFIX}:any")
+                pipe.incr(f"{_GENERATION_PREFIX}:all" if rfp_id is None else f"{_GENERATION_PREFIX}:rfp:{rfp_id}")
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"Redis RAG cache invalidation failed: {e}")
+        if dropped:
+            logger.debug(f"RAG result cache: dropped {dropped} entries for {rfp_id or 'all RFPs'}")
+        return dropped
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'invalidations': self.invalidations
+        }
@@ -0,0 +1,93 @@
+"""
+Chunk Text Store - Chunk text kept outside the vector store, by point ID
+"""
+import logging
+import os
+import sqlite3
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits bound parameters per statement
+_MAX_PARAMS = 500
+
+
+class ChunkTextStore:
+    """
+    SQLite table of chunk text keyed by Qdrant point ID
+
+    With RAG_CHUNK_TEXT_STORE=sqlite the rfp_documents payload holds only
+    the metadata needed for filtering and display; the text is fetched
+    from here for the few hits a query returns. This keeps the bulk of
+    the corpus out of Qdrant's memory and snapshots.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: SQLite file (default RAG_CHUNK_TEXT_PATH)
+        """
+        self.path = path or os.getenv("RAG_CHUNK_TEXT_PATH", "data/cache/chunk_text.sqlite3")
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Shared by ingestion workers and query threads
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS chunk_text ("
+                "point_id TEXT PRIMARY KEY, rfp_id TEXT NOT NULL, text TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_chunk_text_rfp ON chunk_text (rfp_id)")
+            self._conn.commit()
+
+    def put_many(self, rfp_id: str, items: Iterable[Tuple[str, str]]) -> None:
+        """Store (point ID, text) pairs for an RFP"""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO chunk_text (point_id, rfp_id, text) VALUES (?, ?, ?)",
+                ((str(point_id), rfp_id, text) for point_id, text in items)
+            )
+            self._conn.commit()
+
+    def get_many(self, point_ids: Iterable[str]) -> Dict[str, str]:
+        """Point ID -> text for the IDs that are stored"""
+        point_ids = [str(point_id) for point_id in point_ids]
+        texts = {}
+        with self._lock:
+            for start in range(0, len(point_ids), _MAX_PARAMS):
+                batch = point_ids[start:start + _MAX_PARAMS]
+                rows = self._conn.execute(
+                    f"SELECT point_id, text FROM chunk_text WHERE point_id IN ({','.join('?' * len(batch))})",
+                    batch
+                )
+                texts.update(rows)
+        return texts
+
+    def delete(self, point_ids: List[str]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM chunk_text WHERE point_id = ?",
+                ((str(point_id),) for point_id in point_ids)
+            )
+            self._conn.commit()
+
+    def delete_rfp(self, rfp_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM chunk_text WHERE rfp_id = ?", (rfp_id,))
+            self._conn.commit()
+
+    def count(self, rfp_id: Optional[str] = None) -> int:
+        with self._lock:
+            if rfp_id is None:
+                return self._conn.execute("SELECT COUNT(*) FROM chunk_text").fetchone()[0]
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM chunk_text WHERE rfp_id = ?", (rfp_id,)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,14 @@
+"""
+Vectors module - vector store client (Qdrant or in-process fallback)
+"""
+try:
+    from qdrant_client.http import models
+except ImportError:
+    # Lets filters and points be built without qdrant-client installed
+    from . import lite_models as models
+
+from .client import get_vector_client, is_local_client
+from .local_index import LocalVectorClient
+from .storage import VectorStorageConfig
+
+__all__ = ['LocalVectorClient', 'VectorStorageConfig', 'get_vector_client', 'is_local_client', 'models']
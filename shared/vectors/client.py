@@ -0,0 +1,82 @@
+"""
+Vector Client - Qdrant connection with an in-process fallback
+"""
+import logging
+import os
+from threading import Lock
+from typing import Any, Optional
+
+from .local_index import LocalVectorClient
+
+logger = logging.getLogger(__name__)
+
+_client = None
+# Set once _connect has run, so a missing vector store is not re-probed
+_client_resolved = False
+_client_lock = Lock()
+
+
+def _connect(host: str, port: int) -> Optional[Any]:
+    try:
+        from qdrant_client import QdrantClient
+        
+        client = QdrantClient(host=host, port=port)
+        # The constructor doesn't connect; make sure the server answers
+        client.get_collections()
+        logger.info(f"Connected to Qdrant at {host}:{port}")
+        return client
+    except ImportError:
+        logger.warning("qdrant-client not installed")
+    except Exception as e:
+        logger.warning(f"Qdrant not reachable at {host}:{port}: {str(e)}")
+    
+    if os.getenv("VECTOR_STORE_FALLBACK", "none").lower() != "local":
+        logger.error("Vector store unavailable (set VECTOR_STORE_FALLBACK=local for the in-process index)")
+        return None
+    
+    path = os.getenv("VECTOR_STORE_PATH", "data/cache/vector_store")
+    # Loud on purpose: the choice holds for the life of the process, and
+    # the local index does not see what was written to Qdrant
+    logger.error(
+        f"Qdrant unavailable; using the in-process vector index at {path or 'memory'} "
+        f"until this process restarts"
+    )
+    try:
+        return LocalVectorClient(path or None)
+    except RuntimeError as e:
+        logger.error(f"Vector store unavailable: {e}")
+        return None
+
+
+def get_vector_client(host: Optional[str] = None, port: Optional[int] = None) -> Optional[Any]:
+    """
+    Get the process-wide vector store client
+    
+    Returns a QdrantClient when the server answers, otherwise None, or a
+    LocalVectorClient with the same interface if VECTOR_STORE_FALLBACK is
+    'local' (opt-in, for dev / CI / edge deployments without a server).
+    The choice is made once per process, including None: callers don't pay
+    the connection timeout again on every call while Qdrant is down.
+    
+    Args:
+        host: Qdrant host (default QDRANT_HOST)
+        port: Qdrant port (default QDRANT_PORT)
+        
+    Returns:
+        Client instance, or None if no vector store is available
+    """
+    global _client, _client_resolved
+    if not _client_resolved:
+        with _client_lock:
+            if not _client_resolved:
+                _client = _connect(
+                    host or os.getenv("QDRANT_HOST", "localhost"),
+                    int(port or os.getenv("QDRANT_PORT", 6333))
+                )
+                _client_resolved = True
+    return _client
+
+
+def is_local_client(client: Any) -> bool:
+    """True if client is the in-process fallback"""
+    return isinstance(client, LocalVectorClient)
@@ -0,0 +1,183 @@
+"""
+Lite Models - Minimal stand-ins for qdrant_client.http.models
+
+Used by the in-process vector index when qdrant-client is not installed, so
+code written against the Qdrant models keeps working. Only the fields this
+repo uses are modelled.
+"""
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+ExtendedPointId = Union[int, str]
+
+
+class Distance(str, Enum):
+    COSINE = "Cosine"
+    EUCLID = "Euclid"
+    DOT = "Dot"
+
+
+class PayloadSchemaType(str, Enum):
+    KEYWORD = "keyword"
+    INTEGER = "integer"
+    FLOAT = "float"
+    BOOL = "bool"
+    TEXT = "text"
+
+
+@dataclass
+class VectorParams:
+    size: int
+    distance: Distance = Distance.COSINE
+    on_disk: Optional[bool] = None
+
+
+class ScalarType(str, Enum):
+    INT8 = "int8"
+
+
+@dataclass
+class ScalarQuantizationConfig:
+    type: ScalarType = ScalarType.INT8
+    quantile: Optional[float] = None
+    always_ram: Optional[bool] = None
+
+
+@dataclass
+class ScalarQuantization:
+    scalar: ScalarQuantizationConfig
+
+
+@dataclass
+class BinaryQuantizationConfig:
+    always_ram: Optional[bool] = None
+
+
+@dataclass
+class BinaryQuantization:
+    binary: BinaryQuantizationConfig
+
+
+@dataclass
+class QuantizationSearchParams:
+    ignore: Optional[bool] = None
+    rescore: Optional[bool] = None
+    oversampling: Optional[float] = None
+
+
+@dataclass
+class SearchParams:
+    hnsw_ef: Optional[int] = None
+    exact: Optional[bool] = None
+    quantization: Optional[QuantizationSearchParams] = None
+
+
+@dataclass
+class MatchValue:
+    value: Any
+
+
+@dataclass
+class MatchAny:
+    any: List[Any]
+
+
+@dataclass
+class FieldCondition:
+    key: str
+    match: Any = None
+
+
+@dataclass
+class HasIdCondition:
+    has_id: List[ExtendedPointId]
+
+
+@dataclass
+class Filter:
+    must: Optional[List[Any]] = None
+    should: Optional[List[Any]] = None
+    must_not: Optional[List[Any]] = None
+
+
+@dataclass
+class FilterSelector:
+    filter: Filter
+
+
+@dataclass
+class PointIdsList:
+    points: List[ExtendedPointId]
+
+
+@dataclass
+class SetPayload:
+    payload: Dict[str, Any]
+    points: Optional[List[ExtendedPointId]] = None
+
+
+@dataclass
+class SetPayloadOperation:
+    set_payload: SetPayload
+
+
+@dataclass
+class PointStruct:
+    id: ExtendedPointId
+    vector: List[float]
+    payload: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class SearchRequest:
+    vector: List[float]
+    limit: int
+    filter: Optional[Filter] = None
+    with_payload: Any = None
+    with_vector: Any = None
+    score_threshold: Optional[float] = None
+    offset: Optional[int] = None
+    params: Optional[SearchParams] = None
+
+
+@dataclass
+class ScoredPoint:
+    id: ExtendedPointId
+    version: int
+    score: float
+    payload: Optional[Dict[str, Any]] = None
+    vector: Optional[List[float]] = None
+
+
+@dataclass
+class Record:
+    id: ExtendedPointId
+    payload: Optional[Dict[str, Any]] = None
+    vector: Optional[List[float]] = None
+
+
+@dataclass
+class CollectionDescription:
+    name: str
+
+
+@dataclass
+class CollectionsResponse:
+    collections: List[CollectionDescription] = field(default_factory=list)
+
+
+@dataclass
+class CountResult:
+    count: int
+
+
+class UpdateStatus(str, Enum):
+    ACKNOWLEDGED = "acknowledged"
+    COMPLETED = "completed"
+
+
+@dataclass
+class UpdateResult:
+    operation_id: int
+    status: UpdateStatus = UpdateStatus.COMPLETED
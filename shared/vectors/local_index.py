@@ -0,0 +1,679 @@
+"""
+Local Vector Index - In-process, Qdrant-compatible vector store
+
+Fallback for dev, CI and edge deployments without a Qdrant server. Vectors
+live in a memory-mapped .npy file per collection, payloads in a JSON
+snapshot next to it plus an append-only log of the writes since. Search is
+exact (NumPy brute force) and switches to an HNSW graph (hnswlib, if
+installed) for large collections.
+"""
+import json
+import logging
+import os
+from pathlib import Path
+from threading import RLock
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from . import lite_models
+
+logger = logging.getLogger(__name__)
+
+# Use the HNSW graph once a search has at least this many eligible points
+HNSW_MIN_POINTS = int(os.getenv("LOCAL_VECTOR_HNSW_MIN_POINTS", 20000))
+
+_INITIAL_CAPACITY = 1024
+
+
+def _lock_directory(path: Path) -> Any:
+    """
+    Take an exclusive lock on a store directory for this process
+
+    Returns the open lock file (closing it releases the lock).
+
+    Raises:
+        RuntimeError: Another process (or client) already holds the lock
+    """
+    handle = open(path / '.lock', 'a+')
+    try:
+        if fcntl:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        handle.close()
+        raise RuntimeError(f"Local vector index at {path} is already open in another process")
+    return handle
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, 'value', value)
+
+
+def _payload_values(payload: Dict[str, Any], key: str) -> List[Any]:
+    """Values at a dotted payload key; lists are flattened like in Qdrant"""
+    values = [payload]
+    for part in key.split('.'):
+        found = []
+        for value in values:
+            if isinstance(value, dict) and part in value:
+                found.append(value[part])
+            elif isinstance(value, list):
+                found.extend(v[part] for v in value if isinstance(v, dict) and part in v)
+        values = found
+
+    flat = []
+    for value in values:
+        if isinstance(value, list):
+            flat.extend(value)
+        else:
+            flat.append(value)
+    return flat
+
+
+def _condition_matches(point_id: Any, payload: Dict[str, Any], condition: Any) -> bool:
+    if hasattr(condition, 'has_id'):
+        return str(point_id) in {str(i) for i in condition.has_id}
+    if hasattr(condition, 'must'):
+        return _filter_matches(point_id, payload, condition)
+
+    match = getattr(condition, 'match', None)
+    if hasattr(match, 'value'):
+        accepted = [match.value]
+    elif hasattr(match, 'any'):
+        accepted = list(match.any)
+    else:
+        raise ValueError(f"Unsupported filter condition for local vector index: {condition}")
+    return any(value in accepted for value in _payload_values(payload, condition.key))
+
+
+def _filter_matches(point_id: Any, payload: Dict[str, Any], query_filter: Any) -> bool:
+    payload = payload or {}
+    if query_filter.must and not all(_condition_matches(point_id, payload, c) for c in query_filter.must):
+        return False
+    if query_filter.must_not and any(_condition_matches(point_id, payload, c) for c in query_filter.must_not):
+        return False
+    if query_filter.should and not any(_condition_matches(point_id, payload, c) for c in query_filter.should):
+        return False
+    return True
+
+
+def _select_payload(payload: Dict[str, Any], with_payload: Any) -> Optional[Dict[str, Any]]:
+    if with_payload is None or with_payload is True:
+        return dict(payload)
+    if with_payload is False:
+        return None
+    if isinstance(with_payload, (list, tuple)):
+        return {k: v for k, v in payload.items() if k in with_payload}
+    # PayloadSelectorInclude / Exclude
+    if hasattr(with_payload, 'include'):
+        return {k: v for k, v in payload.items() if k in with_payload.include}
+    if hasattr(with_payload, 'exclude'):
+        return {k: v for k, v in payload.items() if k not in with_payload.exclude}
+    return dict(payload)
+
+
+class _LocalCollection:
+    """One collection: vector rows in a memmap, ids and payloads per row"""
+
+    def __init__(self, name: str, dim: int, distance: str, directory: Optional[Path]):
+        self.name = name
+        self.dim = dim
+        self.distance = distance
+        self.vec_path = directory / f"{name}.npy" if directory else None
+        self.meta_path = directory / f"{name}.json" if directory else None
+        self.log_path = directory / f"{name}.log" if directory else None
+        # Bumped per snapshot; log entries of older snapshots are stale
+        self.generation = 0
+        # Points written since the last snapshot
+        self.logged = 0
+
+        # Per row; None marks a deleted row (compacted away on save)
+        self.ids: List[Any] = []
+        self.payloads: List[Optional[Dict[str, Any]]] = []
+        self.row_of: Dict[Any, int] = {}
+        self.alive = np.zeros(0, dtype=bool)
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self._hnsw = None
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    @property
+    def points_count(self) -> int:
+        return len(self.row_of)
+
+    # Persistence -------------------------------------------------------
+
+    def create(self) -> None:
+        self._allocate(_INITIAL_CAPACITY)
+        self.save()
+
+    @classmethod
+    def load(cls, directory: Path, name: str) -> '_LocalCollection':
+        with open(directory / f"{name}.json", 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+
+        collection = cls(name, meta['dim'], meta['distance'], directory)
+        collection.ids = meta['ids']
+        collection.payloads = meta['payloads']
+        collection.generation = meta.get('generation', 0)
+        collection.row_of = {pid: row for row, pid in enumerate(collection.ids) if pid is not None}
+        collection._replay_log()
+        collection.vectors = np.lib.format.open_memmap(collection.vec_path, mode='r+')
+        collection.alive = np.zeros(collection.vectors.shape[0], dtype=bool)
+        collection.alive[np.fromiter(collection.row_of.values(), dtype=np.int64)] = True
+        return collection
+
+    def _replay_log(self) -> None:
+        """Apply the writes logged after the snapshot (ids and payloads only)"""
+        if not self.log_path.exists():
+            return
+        with open(self.log_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Torn last line from a crash mid-write
+                    break
+                if entry.get('generation') != self.generation:
+                    continue
+                if entry['op'] == 'upsert':
+                    for pid, row, payload in entry['points']:
+                        if row == self.size:
+                            self.ids.append(pid)
+                            self.payloads.append(None)
+                        self.ids[row] = pid
+                        self.payloads[row] = payload
+                        self.row_of[pid] = row
+                elif entry['op'] == 'set_payload':
+                    for pid in entry['ids']:
+                        row = self.row_of.get(pid)
+                        if row is not None:
+                            self.payloads[row].update(entry['payload'])
+                elif entry['op'] == 'delete':
+                    for pid in entry['ids']:
+                        row = self.row_of.pop(pid, None)
+                        if row is not None:
+                            self.ids[row] = None
+                            self.payloads[row] = None
+                self.logged += len(entry.get('points') or entry.get('ids') or [])
+
+    def _log(self, entry: Dict[str, Any], points: int) -> None:
+        """
+        Record a write: append it to the log, or take a new snapshot once
+        the log holds as many points as the collection (amortized O(batch))
+        """
+        self.logged += points
+        if self.logged >= max(self.points_count, _INITIAL_CAPACITY):
+            self.save()
+            return
+        if not self.log_path:
+            return
+        if isinstance(self.vectors, np.memmap):
+            # Vectors must be on disk before the log refers to their rows
+            self.vectors.flush()
+        entry['generation'] = self.generation
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
+
+    def save(self) -> None:
+        """Flush vectors, atomically rewrite the payload snapshot and clear the log"""
+        if self.size and self.points_count < self.size // 2 and self.size > _INITIAL_CAPACITY:
+            self._compact()
+        self.logged = 0
+        if not self.meta_path:
+            return
+        if isinstance(self.vectors, np.memmap):
+            self.vectors.flush()
+        self.generation += 1
+        tmp = self.meta_path.with_suffix('.json.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({
+                'dim': self.dim,
+                'distance': self.distance,
+                'generation': self.generation,
+                'ids': self.ids,
+                'payloads': self.payloads
+            }, f)
+        os.replace(tmp, self.meta_path)
+        # Entries left behind by a crash here carry the old generation
+        self.log_path.unlink(missing_ok=True)
+
+    def drop(self) -> None:
+        self.vectors = np.zeros((0, self.dim), dtype=np.float32)
+        for path in (self.vec_path, self.meta_path, self.log_path):
+            if path and path.exists():
+                path.unlink()
+
+    def _allocate(self, capacity: int) -> None:
+        """(Re)allocate vector storage with room for capacity rows"""
+        used = min(self.size, self.vectors.shape[0])
+        if self.vec_path:
+            tmp = self.vec_path.with_suffix('.npy.tmp')
+            grown = np.lib.format.open_memmap(tmp, mode='w+', dtype=np.float32, shape=(capacity, self.dim))
+            grown[:used] = self.vectors[:used]
+            grown.flush()
+            # Release both maps before swapping files (required on Windows)
+            del grown
+            self.vectors = None
+            os.replace(tmp, self.vec_path)
+            self.vectors = np.lib.format.open_memmap(self.vec_path, mode='r+')
+        else:
+            grown = np.zeros((capacity, self.dim), dtype=np.float32)
+            grown[:used] = self.vectors[:used]
+            self.vectors = grown
+
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:used] = self.alive[:used]
+        self.alive = alive
+
+        if self._hnsw is not None:
+            self._hnsw.resize_index(capacity)
+
+    def _compact(self) -> None:
+        rows = np.flatnonzero(self.alive[:self.size])
+        vectors = np.array(self.vectors[rows])
+        self.ids = [self.ids[r] for r in rows]
+        self.payloads = [self.payloads[r] for r in rows]
+        self.row_of = {pid: row for row, pid in enumerate(self.ids)}
+        self.alive[:] = False
+        self.alive[:len(rows)] = True
+        self.vectors[:len(rows)] = vectors
+        self._hnsw = None
+        logger.info(f"Compacted local collection {self.name} to {len(rows)} points")
+
+    # Writes ------------------------------------------------------------
+
+    def _prepare(self, vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        if self.distance == lite_models.Distance.COSINE.value:
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1, norms)
+        return vectors
+
+    def upsert(self, points: Iterable[Any]) -> None:
+        points = list(points)
+        if not points:
+            return
+        vectors = self._prepare([p.vector for p in points])
+
+        rows = []
+        for point in points:
+            row = self.row_of.get(point.id)
+            if row is None:
+                row = self.size
+                self.ids.append(point.id)
+                self.payloads.append(None)
+                self.row_of[point.id] = row
+            self.payloads[row] = dict(point.payload or {})
+            rows.append(row)
+
+        if self.size > self.vectors.shape[0]:
+            self._allocate(max(self.size, self.vectors.shape[0] * 2))
+
+        entry = {'op': 'upsert', 'points': [[self.ids[r], r, self.payloads[r]] for r in rows]}
+        rows = np.asarray(rows)
+        self.vectors[rows] = vectors
+        self.alive[rows] = True
+        if self._hnsw is not None:
+            self._hnsw.add_items(vectors, rows)
+        self._log(entry, len(rows))
+
+    def set_payload(self, ids: Iterable[Any], payload: Dict[str, Any]) -> None:
+        updated = []
+        for pid in ids:
+            row = self.row_of.get(pid)
+            if row is not None:
+                self.payloads[row].update(payload)
+                updated.append(pid)
+        if updated:
+            self._log({'op': 'set_payload', 'ids': updated, 'payload': payload}, len(updated))
+
+    def delete_rows(self, rows: Iterable[int]) -> int:
+        deleted = []
+        for row in rows:
+            pid = self.ids[row]
+            if pid is None:
+                continue
+            del self.row_of[pid]
+            self.ids[row] = None
+            self.payloads[row] = None
+            self.alive[row] = False
+            if self._hnsw is not None:
+                self._hnsw.mark_deleted(int(row))
+            deleted.append(pid)
+        if deleted:
+            self._log({'op': 'delete', 'ids': deleted}, len(deleted))
+        return len(deleted)
+
+    # Reads -------------------------------------------------------------
+
+    def rows(self, query_filter: Any = None) -> np.ndarray:
+        """Rows of live points matching the filter, in insertion order"""
+        live = np.flatnonzero(self.alive[:self.size])
+        if query_filter is None:
+            return live
+        return np.fromiter(
+            (r for r in live if _filter_matches(self.ids[r], self.payloads[r], query_filter)),
+            dtype=np.int64
+        )
+
+    def search(
+        self,
+        vector: Any,
+        query_filter: Any,
+        limit: int,
+        offset: int = 0,
+        score_threshold: Optional[float] = None
+    ) -> List[Tuple[int, float]]:
+        """(row, score) pairs, best first"""
+        rows = self.rows(query_filter)
+        k = min(limit + (offset or 0), len(rows))
+        if k <= 0:
+            return []
+        query = self._prepare(vector)[0]
+
+        hits = None
+        if len(rows) >= HNSW_MIN_POINTS and self.distance != lite_models.Distance.EUCLID.value:
+            hits = self._hnsw_search(query, rows, k, filtered=query_filter is not None)
+        if hits is None:
+            hits = self._exact_search(query, rows, k)
+
+        hits = hits[offset or 0:]
+        if score_threshold is not None:
+            if self.distance == lite_models.Distance.EUCLID.value:
+                hits = [(r, s) for r, s in hits if s <= score_threshold]
+            else:
+                hits = [(r, s) for r, s in hits if s >= score_threshold]
+        return hits
+
+    def _exact_search(self, query: np.ndarray, rows: np.ndarray, k: int) -> List[Tuple[int, float]]:
+        candidates = self.vectors[rows]
+        if self.distance == lite_models.Distance.EUCLID.value:
+            scores = np.linalg.norm(candidates - query, axis=1)
+            ranked = -scores
+        else:
+            scores = candidates @ query
+            ranked = scores
+        if k < len(rows):
+            top = np.argpartition(-ranked, k - 1)[:k]
+        else:
+            top = np.arange(len(rows))
+        top = top[np.argsort(-ranked[top], kind='stable')]
+        return [(int(rows[i]), float(scores[i])) for i in top]
+
+    def _hnsw_search(self, query: np.ndarray, rows: np.ndarray, k: int, filtered: bool) -> Optional[List[Tuple[int, float]]]:
+        try:
+            import hnswlib
+        except ImportError:
+            return None
+
+        try:
+            if self._hnsw is None:
+                index = hnswlib.Index(space='ip', dim=self.dim)
+                index.init_index(max_elements=self.vectors.shape[0], ef_construction=200, M=16)
+                live = np.flatnonzero(self.alive[:self.size])
+                index.add_items(self.vectors[live], live)
+                self._hnsw = index
+                logger.info(f"Built HNSW graph for local collection {self.name} ({len(live)} points)")
+
+            self._hnsw.set_ef(max(128, 4 * k))
+            if filtered:
+                eligible = np.zeros(self.vectors.shape[0], dtype=bool)
+                eligible[rows] = True
+                labels, distances = self._hnsw.knn_query(query, k=k, filter=lambda label: bool(eligible[label]))
+            else:
+                labels, distances = self._hnsw.knn_query(query, k=k)
+            # 'ip' distance is 1 - dot product
+            return [(int(r), float(1.0 - d)) for r, d in zip(labels[0], distances[0])]
+        except Exception as e:
+            logger.warning(f"HNSW search failed on {self.name}, using exact search: {e}")
+            return None
+
+
+class LocalVectorClient:
+    """
+    In-process vector store exposing the subset of the QdrantClient API used
+    in this repo (collections, upsert, search, search_batch, scroll,
+    retrieve, count, set_payload, batch_update_points with set-payload
+    operations, delete), so callers work unchanged without a server
+
+    Payload filters support must / should / must_not with MatchValue,
+    MatchAny, HasIdCondition and nested filters; dotted keys reach into
+    nested payloads. A path is locked by the client that opens it; a
+    second process opening the same path gets a RuntimeError.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: Directory for memory-mapped vectors and payloads; None keeps
+                everything in memory
+        """
+        self.path = Path(path) if path else None
+        self._collections: Dict[str, _LocalCollection] = {}
+        self._lock = RLock()
+        self._operation_id = 0
+        self._path_lock = None
+
+        if self.path:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._path_lock = _lock_directory(self.path)
+            for meta in self.path.glob('*.json'):
+                try:
+                    self._collections[meta.stem] = _LocalCollection.load(self.path, meta.stem)
+                except Exception as e:
+                    logger.error(f"Error loading local collection {meta.stem}: {str(e)}")
+
+        logger.info(
+            f"Local vector index ready ({self.path or 'in-memory'}): "
+            + (', '.join(f"{n}={c.points_count}" for n, c in self._collections.items()) or 'no collections')
+        )
+
+    def _collection(self, collection_name: str) -> _LocalCollection:
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            raise ValueError(f"Collection {collection_name} not found")
+        return collection
+
+    def _updated(self) -> Any:
+        self._operation_id += 1
+        return lite_models.UpdateResult(operation_id=self._operation_id)
+
+    # Collections -------------------------------------------------------
+
+    def get_collections(self) -> Any:
+        return lite_models.CollectionsResponse(
+            collections=[lite_models.CollectionDescription(name=n) for n in self._collections]
+        )
+
+    def collection_exists(self, collection_name: str) -> bool:
+        return collection_name in self._collections
+
+    def get_collection(self, collection_name: str) -> Any:
+        collection = self._collection(collection_name)
+        return SimpleNamespace(
+            status='green',
+            points_count=collection.points_count,
+            vectors_count=collection.points_count,
+            config=SimpleNamespace(params=SimpleNamespace(
+                vectors=lite_models.VectorParams(size=collection.dim, distance=collection.distance)
+            ))
+        )
+
+    def create_collection(self, collection_name: str, vectors_config: Any, **kwargs) -> bool:
+        with self._lock:
+            if collection_name in self._collections:
+                raise ValueError(f"Collection {collection_name} already exists")
+            collection = _LocalCollection(
+                collection_name,
+                vectors_config.size,
+                _enum_value(vectors_config.distance),
+                self.path
+            )
+            collection.create()
+            self._collections[collection_name] = collection
+            logger.info(f"Created local collection {collection_name} (dim={vectors_config.size})")
+            return True
+
+    def recreate_collection(self, collection_name: str, vectors_config: Any, **kwargs) -> bool:
+        self.delete_collection(collection_name)
+        return self.create_collection(collection_name, vectors_config, **kwargs)
+
+    def delete_collection(self, collection_name: str, **kwargs) -> bool:
+        with self._lock:
+            collection = self._collections.pop(collection_name, None)
+            if collection:
+                collection.drop()
+            return collection is not None
+
+    def create_payload_index(self, collection_name: str, field_name: str, field_schema: Any = None, **kwargs) -> Any:
+        # Filters are evaluated by scanning payloads; nothing to build
+        self._collection(collection_name)
+        return self._updated()
+
+    # Points ------------------------------------------------------------
+
+    def upsert(self, collection_name: str, points: List[Any], wait: bool = True, **kwargs) -> Any:
+        with self._lock:
+            self._collection(collection_name).upsert(points)
+            return self._updated()
+
+    def set_payload(self, collection_name: str, payload: Dict[str, Any], points: List[Any], wait: bool = True, **kwargs) -> Any:
+        with self._lock:
+            self._collection(collection_name).set_payload(points, payload)
+            return self._updated()
+
+    def batch_update_points(self, collection_name: str, update_operations: List[Any], wait: bool = True, **kwargs) -> List[Any]:
+        with self._lock:
+            collection = self._collection(collection_name)
+            results = []
+            for operation in update_operations:
+                if not hasattr(operation, 'set_payload'):
+                    raise ValueError(f"Unsupported update operation for local vector index: {operation}")
+                collection.set_payload(operation.set_payload.points or [], operation.set_payload.payload)
+                results.append(self._updated())
+            return results
+
+    def delete(self, collection_name: str, points_selector: Any, wait: bool = True, **kwargs) -> Any:
+        with self._lock:
+            collection = self._collection(collection_name)
+            if hasattr(points_selector, 'filter'):
+                rows = collection.rows(points_selector.filter)
+            else:
+                ids = getattr(points_selector, 'points', points_selector)
+                rows = [collection.row_of[i] for i in ids if i in collection.row_of]
+            deleted = collection.delete_rows(rows)
+            logger.debug(f"Deleted {deleted} points from local collection {collection_name}")
+            return self._updated()
+
+    def search(
+        self,
+        collection_name: str,
+        query_vector: Any,
+        query_filter: Any = None,
+        limit: int = 10,
+        offset: int = 0,
+        with_payload: Any = True,
+        with_vectors: bool = False,
+        score_threshold: Optional[float] = None,
+        **kwargs
+    ) -> List[Any]:
+        with self._lock:
+            collection = self._collection(collection_name)
+            hits = collection.search(query_vector, query_filter, limit, offset, score_threshold)
+            return [
+                lite_models.ScoredPoint(
+                    id=collection.ids[row],
+                    version=0,
+                    score=score,
+                    payload=_select_payload(collection.payloads[row], with_payload),
+                    vector=collection.vectors[row].tolist() if with_vectors else None
+                )
+                for row, score in hits
+            ]
+
+    def search_batch(self, collection_name: str, requests: List[Any], **kwargs) -> List[List[Any]]:
+        return [
+            self.search(
+                collection_name,
+                query_vector=request.vector,
+                query_filter=request.filter,
+                limit=request.limit,
+                offset=getattr(request, 'offset', 0) or 0,
+                with_payload=request.with_payload if request.with_payload is not None else False,
+                with_vectors=bool(getattr(request, 'with_vector', False)),
+                score_threshold=getattr(request, 'score_threshold', None)
+            )
+            for request in requests
+        ]
+
+    def _record(self, collection: _LocalCollection, row: int, with_payload: Any, with_vectors: bool) -> Any:
+        return lite_models.Record(
+            id=collection.ids[row],
+            payload=_select_payload(collection.payloads[row], with_payload),
+            vector=collection.vectors[row].tolist() if with_vectors else None
+        )
+
+    def scroll(
+        self,
+        collection_name: str,
+        scroll_filter: Any = None,
+        limit: int = 10,
+        offset: Any = None,
+        with_payload: Any = True,
+        with_vectors: bool = False,
+        **kwargs
+    ) -> Tuple[List[Any], Any]:
+        """Points in insertion order; the returned offset is the next point id"""
+        with self._lock:
+            collection = self._collection(collection_name)
+            rows = collection.rows(scroll_filter)
+            if offset is not None:
+                start_row = collection.row_of.get(offset)
+                if start_row is None:
+                    return [], None
+                rows = rows[rows >= start_row]
+            page = rows[:limit]
+            next_offset = collection.ids[rows[limit]] if len(rows) > limit else None
+            return [self._record(collection, r, with_payload, with_vectors) for r in page], next_offset
+
+    def retrieve(
+        self,
+        collection_name: str,
+        ids: List[Any],
+        with_payload: Any = True,
+        with_vectors: bool = False,
+        **kwargs
+    ) -> List[Any]:
+        with self._lock:
+            collection = self._collection(collection_name)
+            return [
+                self._record(collection, collection.row_of[i], with_payload, with_vectors)
+                for i in ids if i in collection.row_of
+            ]
+
+    def count(self, collection_name: str, count_filter: Any = None, exact: bool = True, **kwargs) -> Any:
+        with self._lock:
+            collection = self._collection(collection_name)
+            if count_filter is None:
+                return lite_models.CountResult(count=collection.points_count)
+            return lite_models.CountResult(count=len(collection.rows(count_filter)))
+
+    def close(self) -> None:
+        with self._lock:
+            for collection in self._collections.values():
+                collection.save()
+            if self._path_lock:
+                self._path_lock.close()
+                self._path_lock = None
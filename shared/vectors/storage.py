@@ -0,0 +1,134 @@
+"""
+Vector Storage - Quantization and on-disk settings for vector collections
+"""
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+QUANTIZATION_MODES = ('none', 'scalar', 'binary')
+
+
+def _env(prefix: str, name: str, default: str) -> str:
+    """PREFIX_NAME, falling back to NAME, then default"""
+    value = os.getenv(f"{prefix}_{name}") if prefix else None
+    return value if value is not None else os.getenv(name, default)
+
+
+def _env_bool(prefix: str, name: str, default: str) -> bool:
+    return _env(prefix, name, default).lower() == "true"
+
+
+@dataclass
+class VectorStorageConfig:
+    """
+    How a collection stores its vectors and payloads
+
+    With quantization the collection keeps a compressed copy of every
+    vector (int8 for scalar: 4x smaller; 1 bit per dimension for binary:
+    32x smaller) in RAM and searches that first. The float32 originals can
+    then live on disk and are only read to rescore the oversampled
+    candidates. On-disk payloads keep chunk text and specifications out of
+    RAM. Filters then only stay fast on fields with a payload index, which
+    the collection owners create: rfp_id on rfp_documents
+    (DocumentRAGService) and sku plus the hard-constraint fields on
+    products (product_loader). Filtering on any other field reads payloads
+    from disk.
+
+    Only Qdrant applies these settings; the in-process index ignores them.
+    """
+    quantization: str = 'none'
+    always_ram: bool = True
+    vectors_on_disk: bool = False
+    payload_on_disk: bool = False
+    rescore: bool = True
+    oversampling: float = 2.0
+    quantile: float = 0.99
+
+    @classmethod
+    def from_env(cls, prefix: str = '') -> 'VectorStorageConfig':
+        """
+        Settings from VECTOR_* environment variables; PREFIX_VECTOR_*
+        (e.g. RAG_VECTOR_QUANTIZATION) overrides them for one collection
+        """
+        quantization = _env(prefix, "VECTOR_QUANTIZATION", "none").lower()
+        if quantization not in QUANTIZATION_MODES:
+            logger.warning(f"Unknown vector quantization '{quantization}', using none")
+            quantization = 'none'
+        return cls(
+            quantization=quantization,
+            always_ram=_env_bool(prefix, "VECTOR_QUANTIZATION_ALWAYS_RAM", "true"),
+            vectors_on_disk=_env_bool(prefix, "VECTOR_ON_DISK", "false"),
+            payload_on_disk=_env_bool(prefix, "VECTOR_PAYLOAD_ON_DISK", "false"),
+            rescore=_env_bool(prefix, "VECTOR_QUANTIZATION_RESCORE", "true"),
+            oversampling=float(_env(prefix, "VECTOR_QUANTIZATION_OVERSAMPLING", "2.0")),
+            quantile=float(_env(prefix, "VECTOR_QUANTIZATION_QUANTILE", "0.99"))
+        )
+
+    @property
+    def quantized(self) -> bool:
+        return self.quantization != 'none'
+
+    def quantization_config(self, models: Any) -> Optional[Any]:
+        if self.quantization == 'scalar':
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=self.quantile,
+                    always_ram=self.always_ram
+                )
+            )
+        if self.quantization == 'binary':
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=self.always_ram)
+            )
+        return None
+
+    def create_kwargs(self, models: Any, size: int, distance: Any) -> Dict[str, Any]:
+        """Keyword arguments for client.create_collection"""
+        kwargs = {
+            'vectors_config': models.VectorParams(
+                size=size,
+                distance=distance,
+                on_disk=self.vectors_on_disk or None
+            )
+        }
+        if self.quantized:
+            kwargs['quantization_config'] = self.quantization_config(models)
+        if self.payload_on_disk:
+            kwargs['on_disk_payload'] = True
+        return kwargs
+
+    def search_params(self, models: Any) -> Optional[Any]:
+        """Search params rescoring quantized candidates (None when not quantized)"""
+        if not self.quantized:
+            return None
+        return models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                rescore=self.rescore,
+                oversampling=self.oversampling
+            )
+        )
+
+    def ram_bytes_per_vector(self, size: int) -> int:
+        """Approximate vector RAM per point (excluding the HNSW graph and payload)"""
+        original = 0 if self.vectors_on_disk else 4 * size
+        if self.quantization == 'scalar':
+            quantized = size + 4  # int8 components plus a per-vector offset
+        elif self.quantization == 'binary':
+            quantized = -(-size // 8)
+        else:
+            return original
+        return original + (quantized if self.always_ram else 0)
+
+    def describe(self) -> str:
+        parts = [self.quantization if self.quantized else 'float32']
+        if self.quantized and self.rescore:
+            parts.append(f"rescore x{self.oversampling:g}")
+        if self.vectors_on_disk:
+            parts.append('vectors on disk')
+        if self.payload_on_disk:
+            parts.append('payload on disk')
+        return ', '.join(parts)
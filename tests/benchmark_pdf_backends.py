@@ -0,0 +1,76 @@
+"""
+Benchmark: PDF text backends (PyMuPDF vs pdfplumber) over a corpus of tender PDFs
+Times page-text extraction per backend and checks that the specifications
+extracted from each backend's text agree.
+
+Usage: python tests/benchmark_pdf_backends.py [corpus_dir]   (default: data/uploads)
+"""
+import sys
+import os
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.document.extraction import SpecExtractionEngine
+from shared.pdf import available_backends, open_pdf
+
+# Fields compared across backends
+COMPARED_FIELDS = ['voltage', 'conductor_size', 'conductor_material', 'insulation_material', 'cable_type']
+
+
+def time_backend(pdf_path: Path, backend: str, rounds: int = 3):
+    """Best-of-rounds wall time to open the PDF and extract every page"""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        with open_pdf(str(pdf_path), backend) as pdf:
+            page_texts = pdf.page_texts()
+        best = min(best, time.perf_counter() - start)
+    return best, page_texts
+
+
+def main():
+    corpus = Path(sys.argv[1] if len(sys.argv) > 1 else 'data/uploads')
+    pdfs = sorted(corpus.glob('**/*.pdf'))
+    if not pdfs:
+        print(f"No PDFs found under {corpus}")
+        return
+
+    backends = available_backends()
+    engine = SpecExtractionEngine()
+    totals = {name: [0.0, 0] for name in backends}
+    mismatches = 0
+
+    print(f"{'file':<32} {'pages':>6} " + ' '.join(f"{name + ' ms':>15}" for name in backends) + "  specs")
+    for pdf_path in pdfs:
+        timings = {}
+        specs = {}
+        for name in backends:
+            elapsed, page_texts = time_backend(pdf_path, name)
+            timings[name] = elapsed
+            totals[name][0] += elapsed
+            totals[name][1] += len(page_texts)
+            fields, _ = engine.extract('\n\n'.join(page_texts))
+            specs[name] = {f: fields[f] for f in COMPARED_FIELDS}
+
+        same = len({tuple(s.items()) for s in specs.values()}) == 1
+        mismatches += not same
+        print(
+            f"{pdf_path.name[:32]:<32} {len(page_texts):>6} "
+            + ' '.join(f"{timings[name] * 1000:>15.1f}" for name in backends)
+            + f"  {'✅' if same else '❌'}"
+        )
+        if not same:
+            for name, fields in specs.items():
+                print(f"    {name}: {fields}")
+
+    print()
+    for name, (seconds, pages) in totals.items():
+        print(f"{name:>12}: {pages / seconds:>8.0f} pages/s")
+    print(f"Spec mismatches: {mismatches}/{len(pdfs)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark: per-product rule-based matching vs indexed ProductCatalog scoring
+Builds synthetic catalogs of increasing size, checks both paths return the
+same SKUs and scores, and reports timings.
+"""
+import sys
+import os
+import random
+import time
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.technical.agent import MATCH_THRESHOLD, TechnicalAgent
+from agents.technical.catalog import normalize_value
+from agents.technical.catalog_store import CatalogStore
+from shared.models import Specification
+
+VOLTAGES = ['1.1kV', '3.3kV', '6.6kV', '11kV', '11 kV', '22kV', '33kV', '66 kV', '650V', '']
+SIZES = ['16 sq mm', '25 sq mm', '50 sq mm', '95sqmm', '120 sq mm', '185 sq mm',
+         '240 sq mm', '300 mm2', '400 sq mm', '1185 sq mm']
+CONDUCTORS = ['Copper', 'Aluminium', 'Aluminum', 'Cu', 'Al', None]
+INSULATIONS = ['XLPE', 'PVC', 'EPR', 'PE', None]
+CABLE_TYPES = ['3 core, armoured', '4 core', 'single core', '3 core', 'multicore, unarmoured', None]
+
+RFP_SPECS = [
+    {'voltage': '11kV', 'conductor_size': '185 sq mm', 'conductor_material': 'Copper',
+     'insulation_material': 'XLPE', 'cable_type': '3 core, armoured'},
+    {'voltage': '33 kV', 'conductor_size': '240sqmm', 'conductor_material': 'Aluminium',
+     'insulation_material': None, 'cable_type': None},
+    {'voltage': '1.1kV', 'conductor_size': None, 'conductor_material': 'Cu',
+     'insulation_material': 'PVC', 'cable_type': '4 core'},
+]
+
+
+def build_catalog(size: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [
+        {
+            'sku': f'SKU-{i:06d}',
+            'product_name': f'Cable {i}',
+            'specifications': {
+                'voltage': rng.choice(VOLTAGES),
+                'conductor_size': rng.choice(SIZES),
+                'conductor_material': rng.choice(CONDUCTORS),
+                'insulation_material': rng.choice(INSULATIONS),
+                'cable_type': rng.choice(CABLE_TYPES),
+            },
+            'datasheet_url': ''
+        }
+        for i in range(size)
+    ]
+
+
+def legacy_matching(agent, products, specs, top_k):
+    """The original per-product loop: score, filter, sort (plus hard constraints)"""
+    constraints = agent._hard_constraints(specs)
+    matches = []
+    for product in products:
+        if any(
+            normalize_value(product['specifications'].get(key)) not in accepted
+            for key, accepted in constraints.items()
+        ):
+            continue
+        score = agent._calculate_match_score(specs, product['specifications'])
+        if score > MATCH_THRESHOLD:
+            matches.append((product['sku'], score))
+    matches.sort(key=lambda x: x[1], reverse=True)
+    return matches[:top_k]
+
+
+def main():
+    agent = TechnicalAgent()
+    top_k = 10
+
+    print(f"{'SKUs':>8} {'loop ms':>10} {'compile ms':>11} {'vector ms':>10} {'speedup':>9}  match")
+    for size in [1_000, 10_000, 50_000]:
+        products = build_catalog(size)
+
+        start = time.perf_counter()
+        agent.catalog_store = CatalogStore(products=products)
+        compile_s = time.perf_counter() - start
+
+        loop_s = vector_s = 0.0
+        same = True
+        for specs in RFP_SPECS:
+            start = time.perf_counter()
+            legacy = legacy_matching(agent, products, specs, top_k)
+            loop_s += time.perf_counter() - start
+
+            start = time.perf_counter()
+            matches = agent._rule_based_matching(Specification('BENCH', specs, {}, 1.0), top_k)
+            vector_s += time.perf_counter() - start
+
+            same &= legacy == [(m.sku, m.match_score) for m in matches]
+
+        print(
+            f"{size:>8,} {loop_s * 1000:>10.1f} {compile_s * 1000:>11.1f} {vector_s * 1000:>10.1f} "
+            f"{loop_s / vector_s:>8.1f}x  {'✅' if same else '❌'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
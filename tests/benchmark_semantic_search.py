@@ -0,0 +1,61 @@
+"""
+Benchmark: one-at-a-time semantic_search vs batched semantic_search_many
+Requires a running Qdrant with the products collection loaded
+(python agents/technical/product_loader.py) and the embedding model.
+Reports queries/sec for 1, 10 and 100 queries.
+"""
+import sys
+import os
+import itertools
+import time
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.technical.agent import TechnicalAgent
+
+VOLTAGES = ['1.1kV', '3.3kV', '6.6kV', '11kV', '22kV', '33kV']
+INSULATIONS = ['XLPE', 'PVC', 'EPR']
+SIZES = ['50 sq mm', '95 sq mm', '185 sq mm', '240 sq mm', '300 sq mm', '400 sq mm']
+
+
+def build_queries(count: int):
+    combos = itertools.cycle(itertools.product(VOLTAGES, INSULATIONS, SIZES))
+    return [
+        f"voltage {v} {ins} insulation {size} cross section"
+        for v, ins, size in itertools.islice(combos, count)
+    ]
+
+
+def main():
+    agent = TechnicalAgent()
+    agent.initialize_vector_db()
+    agent.initialize_embedding_model()
+    if not agent.vector_db or not agent.embedding_model:
+        print("Qdrant or the embedding model is not available - nothing to benchmark")
+        return
+
+    # Warm up model and connection
+    agent.semantic_search_many(build_queries(4))
+
+    print(f"{'queries':>8} {'one-by-one q/s':>15} {'batched q/s':>12} {'speedup':>9}  same")
+    for count in [1, 10, 100]:
+        queries = build_queries(count)
+
+        start = time.perf_counter()
+        single = [agent.semantic_search(q) for q in queries]
+        single_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = agent.semantic_search_many(queries)
+        batched_s = time.perf_counter() - start
+
+        same = [[p.get('sku') for p in r] for r in single] == [[p.get('sku') for p in r] for r in batched]
+        print(
+            f"{count:>8} {count / single_s:>15.1f} {count / batched_s:>12.1f} "
+            f"{single_s / batched_s:>8.1f}x  {'✅' if same else '❌'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Benchmark: per-field regex extraction vs single-scan SpecExtractionEngine
+Builds synthetic tender texts of increasing size, checks both paths agree,
+and reports timings.
+"""
+import sys
+import os
+import re
+import time
+from typing import Dict, List, Optional
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.document.agent import DocumentAgent
+
+BOILERPLATE = (
+    "Clause 4.2 General conditions of contract. The bidder shall submit "
+    "the price schedule within 30 days. Payment terms: 90% against delivery "
+    "and 10% after commissioning. Page 12 of 200.\n"
+)
+SPEC_BLOCK = (
+    "Technical Specification: 11kV XLPE insulated cable, copper conductor, "
+    "185 sq mm, 3 core armoured. Rated current 300A. Cable length: 5000 m. "
+    "Standards IEC 60502-2, IS 7098 and BS 6622. Type test, routine test, "
+    "partial discharge and conductor resistance tests are mandatory.\n"
+)
+
+
+def build_text(target_chars: int) -> str:
+    """Boilerplate with the spec block buried three quarters of the way in"""
+    repeats = max(1, target_chars // len(BOILERPLATE))
+    head = BOILERPLATE * (repeats * 3 // 4)
+    tail = BOILERPLATE * (repeats - repeats * 3 // 4)
+    return head + SPEC_BLOCK + tail
+
+
+# Reference path: the per-field extractors DocumentAgent used before the
+# single-scan engine, one regex pass per field. Kept here only to check the
+# engine against them.
+
+def extract_voltage(text: str) -> Optional[str]:
+    """Extract voltage specification"""
+    patterns = [
+        r'(\d+\.?\d*)\s*[kK][vV]',
+        r'voltage[:\s]+(\d+\.?\d*)\s*[kK]?[vV]',
+        r'rated voltage[:\s]+(\d+\.?\d*)\s*[kK]?[vV]'
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            return match.group(0)
+
+    return None
+
+
+def extract_current(text: str) -> Optional[str]:
+    """Extract current rating"""
+    patterns = [
+        r'(\d+\.?\d*)\s*[aA]',
+        r'current[:\s]+(\d+\.?\d*)\s*[aA]',
+        r'rated current[:\s]+(\d+\.?\d*)\s*[aA]'
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            return match.group(0)
+
+    return None
+
+
+def extract_conductor_material(text: str) -> Optional[str]:
+    """Extract conductor material"""
+    materials = ['copper', 'aluminium', 'aluminum', 'cu', 'al']
+
+    text_lower = text.lower()
+    for material in materials:
+        if f'conductor' in text_lower and material in text_lower:
+            return material.upper() if len(material) <= 2 else material.capitalize()
+
+    return None
+
+
+def extract_insulation_material(text: str) -> Optional[str]:
+    """Extract insulation material"""
+    materials = ['XLPE', 'PVC', 'EPR', 'PE', 'rubber']
+
+    for material in materials:
+        if material.lower() in text.lower():
+            return material
+
+    return None
+
+
+def extract_conductor_size(text: str) -> Optional[str]:
+    """Extract conductor cross-section size"""
+    patterns = [
+        r'(\d+\.?\d*)\s*[sS][qQ]\s*[mM][mM]',
+        r'(\d+\.?\d*)\s*mm[²2]',
+        r'cross[- ]section[:\s]+(\d+\.?\d*)'
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            return match.group(0)
+
+    return None
+
+
+def extract_cable_type(text: str) -> Optional[str]:
+    """Extract cable type"""
+    cable_types = [
+        'single core', 'multi-core', 'multicore', '3 core', '4 core',
+        'armoured', 'unarmoured', 'aerial', 'underground'
+    ]
+
+    text_lower = text.lower()
+    found_types = []
+
+    for cable_type in cable_types:
+        if cable_type in text_lower:
+            found_types.append(cable_type)
+
+    return ', '.join(found_types) if found_types else None
+
+
+def extract_length(text: str) -> Optional[str]:
+    """Extract cable length requirement"""
+    patterns = [
+        r'(\d+\.?\d*)\s*[kK]?[mM]',
+        r'length[:\s]+(\d+\.?\d*)',
+        r'quantity[:\s]+(\d+\.?\d*)'
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match and 'length' in text[max(0, match.start()-20):match.end()+20].lower():
+            return match.group(0)
+
+    return None
+
+
+def extract_standards(text: str) -> List[str]:
+    """Extract applicable standards"""
+    standards_patterns = [
+        r'IEC\s*\d+[-/]?\d*',
+        r'IS\s*\d+',
+        r'BS\s*\d+',
+        r'ASTM\s*[A-Z]\d+',
+        r'IEEE\s*\d+'
+    ]
+
+    standards = []
+    for pattern in standards_patterns:
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        standards.extend(matches)
+
+    return list(set(standards))
+
+
+def extract_testing_requirements(text: str) -> Dict[str, List[str]]:
+    """Extract testing requirements"""
+    testing_requirements = {
+        'type_tests': [],
+        'routine_tests': [],
+        'sample_tests': []
+    }
+
+    # Type tests
+    type_test_keywords = [
+        'type test', 'voltage test', 'impulse test', 'partial discharge',
+        'thermal test', 'flame test'
+    ]
+
+    # Routine tests
+    routine_test_keywords = [
+        'routine test', 'conductor resistance', 'voltage test',
+        'continuity test', 'insulation resistance'
+    ]
+
+    text_lower = text.lower()
+
+    for keyword in type_test_keywords:
+        if keyword in text_lower:
+            testing_requirements['type_tests'].append(keyword)
+
+    for keyword in routine_test_keywords:
+        if keyword in text_lower:
+            testing_requirements['routine_tests'].append(keyword)
+
+    return testing_requirements
+
+
+def extract_per_field(text):
+    """Reference extraction: one pass per field"""
+    specifications = {
+        'voltage': extract_voltage(text),
+        'current': extract_current(text),
+        'conductor_material': extract_conductor_material(text),
+        'insulation_material': extract_insulation_material(text),
+        'conductor_size': extract_conductor_size(text),
+        'cable_type': extract_cable_type(text),
+        'length': extract_length(text),
+        'standards': extract_standards(text)
+    }
+    return specifications, extract_testing_requirements(text)
+
+
+def time_call(fn, text, rounds=3):
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def normalize(result):
+    fields, tests = result
+    fields = dict(fields)
+    fields['standards'] = sorted(fields['standards'])
+    return fields, tests
+
+
+def main():
+    agent = DocumentAgent(cache=None)
+
+    print(f"{'chars':>12} {'per-field ms':>14} {'single-scan ms':>16} {'speedup':>9}  match")
+    for size in [10_000, 100_000, 1_000_000, 5_000_000]:
+        text = build_text(size)
+        legacy_s, legacy = time_call(extract_per_field, text)
+        engine_s, engine = time_call(agent.extraction_engine.extract, text)
+        same = normalize(legacy) == normalize(engine)
+        print(
+            f"{len(text):>12,} {legacy_s * 1000:>14.1f} {engine_s * 1000:>16.1f} "
+            f"{legacy_s / engine_s:>8.1f}x  {'✅' if same else '❌'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Benchmark: recall vs vector memory for the collection storage options
+(VectorStorageConfig: float32, scalar int8, binary; with and without rescoring)
+
+Uses all-MiniLM-L6-v2 embeddings of generated RFP-style chunks when
+sentence-transformers is installed, otherwise clustered synthetic 384-dim
+vectors. Quantized search is simulated the way Qdrant does it (quantile
+clipped int8 / sign bits, then optional float32 rescoring of the
+oversampled candidates). With --qdrant the same settings are also
+measured on a running Qdrant server (temporary collections).
+
+Usage: python tests/benchmark_vector_quantization.py [points] [--qdrant]
+"""
+import sys
+import os
+import itertools
+import time
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from shared.vectors import VectorStorageConfig, get_vector_client, is_local_client, models
+
+DIM = 384
+TOP_K = 10
+QUERIES = 200
+
+CONFIGS = [
+    VectorStorageConfig(),
+    VectorStorageConfig(quantization='scalar', rescore=False, vectors_on_disk=True),
+    VectorStorageConfig(quantization='scalar', oversampling=2.0, vectors_on_disk=True),
+    VectorStorageConfig(quantization='binary', rescore=False, vectors_on_disk=True),
+    VectorStorageConfig(quantization='binary', oversampling=2.0, vectors_on_disk=True),
+    VectorStorageConfig(quantization='binary', oversampling=4.0, vectors_on_disk=True),
+]
+
+VOLTAGES = ['1.1kV', '3.3kV', '6.6kV', '11kV', '22kV', '33kV']
+INSULATIONS = ['XLPE', 'PVC', 'EPR']
+SIZES = ['50 sq mm', '95 sq mm', '185 sq mm', '240 sq mm', '300 sq mm', '400 sq mm']
+CLAUSES = [
+    'The contractor shall supply {v} {ins} insulated cable of {s} cross section as per IEC 60502.',
+    'Routine and type tests for {v} {ins} cables of {s} shall be witnessed by the purchaser.',
+    'Liquidated damages of 0.5% per week apply to late delivery of {s} {v} cable drums.',
+    'Armoured {ins} cable, {v}, {s}, copper conductor, to be laid in trenches with sand bedding.',
+]
+
+
+def build_texts(count: int):
+    combos = itertools.cycle(itertools.product(CLAUSES, VOLTAGES, INSULATIONS, SIZES))
+    return [
+        f"Section {i}. " + clause.format(v=v, ins=ins, s=s)
+        for i, (clause, v, ins, s) in enumerate(itertools.islice(combos, count))
+    ]
+
+
+def load_vectors(count: int):
+    """(points, queries, chunk texts or None), L2-normalised"""
+    try:
+        from shared.embeddings import get_embedding_model
+        model = get_embedding_model('all-MiniLM-L6-v2')
+        texts = build_texts(count + QUERIES)
+        vectors = model.encode(texts, batch_size=256, convert_to_numpy=True, normalize_embeddings=True)
+        return vectors[:count].astype(np.float32), vectors[count:].astype(np.float32), texts[:count]
+    except Exception as e:
+        print(f"Embedding model unavailable ({e}); using synthetic vectors")
+
+    rng = np.random.default_rng(7)
+    # Clustered and anisotropic, like sentence embeddings
+    centers = rng.normal(size=(200, DIM)) + rng.normal(scale=2.0, size=DIM)
+    labels = rng.integers(0, len(centers), size=count + QUERIES)
+    vectors = centers[labels] + rng.normal(scale=1.5, size=(count + QUERIES, DIM))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors = vectors.astype(np.float32)
+    return vectors[:count], vectors[count:], None
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    idx = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.take_along_axis(scores, idx, axis=1).argsort(axis=1)[:, ::-1]
+    return np.take_along_axis(idx, order, axis=1)
+
+
+def quantized_scores(config: VectorStorageConfig, points: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    if config.quantization == 'scalar':
+        tail = (1 - config.quantile) / 2
+        lo, hi = np.quantile(points, [tail, 1 - tail])
+        step = (hi - lo) / 255
+
+        def quantize(x):
+            return lo + np.clip(np.round((x - lo) / step), 0, 255) * step
+
+        return quantize(queries) @ quantize(points).T
+    if config.quantization == 'binary':
+        return np.where(queries > 0, 1.0, -1.0) @ np.where(points > 0, 1.0, -1.0).T
+    return queries @ points.T
+
+
+def simulate(config: VectorStorageConfig, points: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    scores = quantized_scores(config, points, queries)
+    if not config.quantized or not config.rescore:
+        return top_k(scores, TOP_K)
+    candidates = top_k(scores, int(TOP_K * config.oversampling))
+    exact = np.einsum('qd,qcd->qc', queries, points[candidates])
+    order = np.argsort(-exact, axis=1)[:, :TOP_K]
+    return np.take_along_axis(candidates, order, axis=1)
+
+
+def recall(found: np.ndarray, truth: np.ndarray) -> float:
+    return float(np.mean([len(set(f) & set(t)) / TOP_K for f, t in zip(found, truth)]))
+
+
+def run_qdrant(client, points: np.ndarray, queries: np.ndarray, truth: np.ndarray):
+    print(f"\nQdrant ({len(points)} points; quantization is used once segments are indexed)")
+    for i, config in enumerate(CONFIGS):
+        name = f"bench_quantization_{i}"
+        if client.collection_exists(name):
+            client.delete_collection(name)
+        client.create_collection(collection_name=name, **config.create_kwargs(models, DIM, models.Distance.COSINE))
+        for start in range(0, len(points), 1000):
+            client.upsert(
+                collection_name=name,
+                points=[
+                    models.PointStruct(id=start + j, vector=v.tolist())
+                    for j, v in enumerate(points[start:start + 1000])
+                ]
+            )
+        while client.get_collection(name).status != models.CollectionStatus.GREEN:
+            time.sleep(0.5)
+
+        params = config.search_params(models)
+        start = time.perf_counter()
+        found = np.array([
+            [hit.id for hit in client.search(collection_name=name, query_vector=q.tolist(), limit=TOP_K, search_params=params)]
+            for q in queries
+        ])
+        seconds = time.perf_counter() - start
+        print(f"{config.describe():<45} recall@{TOP_K} {recall(found, truth):.3f}  {len(queries) / seconds:>7.1f} q/s")
+        client.delete_collection(name)
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    count = int(args[0]) if args else 20000
+    points, queries, texts = load_vectors(count)
+    truth = top_k(queries @ points.T, TOP_K)
+
+    print(f"{count} points x {DIM} dims, {len(queries)} queries, recall@{TOP_K} vs exact float32")
+    print(f"{'storage':<45} {'recall':>7} {'vector RAM/1M pts':>18}")
+    for config in CONFIGS:
+        ram_mb = config.ram_bytes_per_vector(DIM) * 1_000_000 / 2**20
+        print(f"{config.describe():<45} {recall(simulate(config, points, queries), truth):>7.3f} {ram_mb:>15.0f} MB")
+
+    if texts:
+        text_mb = sum(len(t.encode('utf-8')) for t in texts) / len(texts) * 1_000_000 / 2**20
+        print(f"\nChunk text payload: ~{text_mb:.0f} MB per 1M chunks (moved out with RAG_CHUNK_TEXT_STORE=sqlite)")
+
+    if '--qdrant' in sys.argv:
+        client = get_vector_client()
+        if client is None or is_local_client(client):
+            print("\nQdrant is not running - skipping server measurements")
+            return
+        run_qdrant(client, points, queries, truth)
+
+
+if __name__ == "__main__":
+    main()
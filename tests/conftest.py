@@ -0,0 +1,91 @@
+"""
+Pytest configuration - puts the project root on sys.path for the unit tests
+"""
+import os
+import sys
+import zlib
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+EMBEDDING_DIM = 16
+
+
+class HashEmbedding:
+    """Deterministic stand-in for a SentenceTransformer; counts forward passes"""
+
+    def __init__(self, dim=EMBEDDING_DIM):
+        self.dim = dim
+        self.calls = []
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, **kwargs):
+        if isinstance(texts, str):
+            return self.encode([texts])[0]
+        self.calls.append(len(texts))
+        return np.stack([
+            np.random.default_rng(zlib.crc32(text.encode())).normal(size=self.dim) for text in texts
+        ]).astype(np.float32)
+
+
+@pytest.fixture
+def make_technical_agent():
+    """
+    Build a TechnicalAgent over a static product list, optionally with an
+    in-process 'products' vector collection (payloads as product_loader writes them)
+    """
+    from agents.technical.agent import TechnicalAgent
+    from agents.technical.catalog import MATCH_KEYS, normalize_value
+    from agents.technical.catalog_store import CatalogStore
+    from shared.vectors import LocalVectorClient, models
+
+    def build(products, vectors=True):
+        agent = TechnicalAgent(CatalogStore(products=products))
+        if not vectors:
+            return agent
+
+        model = HashEmbedding()
+        client = LocalVectorClient()
+        client.create_collection(
+            'products', models.VectorParams(size=EMBEDDING_DIM, distance=models.Distance.COSINE)
+        )
+        client.upsert('products', [
+            models.PointStruct(
+                id=i,
+                vector=model.encode([p['product_name']])[0].tolist(),
+                payload={
+                    'sku': p['sku'],
+                    'product_name': p['product_name'],
+                    'normalized': {
+                        k: normalize_value(p['specifications'][k])
+                        for k in MATCH_KEYS if p['specifications'].get(k)
+                    }
+                }
+            )
+            for i, p in enumerate(products)
+        ])
+        agent.vector_db = client
+        agent.embedding_model = HashEmbedding()
+        return agent
+
+    return build
+
+
+@pytest.fixture
+def rag_service(monkeypatch):
+    """DocumentRAGService over an in-memory vector index and a HashEmbedding model"""
+    from shared.rag import document_rag
+    from shared.vectors import LocalVectorClient, models
+
+    for name in ('RAG_RESULT_CACHE_REDIS', 'RAG_INGEST_BACKEND', 'RAG_CHUNK_TEXT_STORE'):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(document_rag, 'get_vector_client', lambda: None)
+    model = HashEmbedding(dim=384)
+    monkeypatch.setattr(document_rag, 'get_embedding_model', lambda name: model)
+
+    service = document_rag.DocumentRAGService()
+    service.client = LocalVectorClient()
+    service.models = models
+    service._ensure_collection()
+    return service
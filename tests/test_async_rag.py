@@ -0,0 +1,68 @@
+"""
+Async RAG service tests: blocking work stays off the event loop
+"""
+import asyncio
+import threading
+
+from shared.rag import async_rag
+from shared.rag.async_rag import AsyncDocumentRAGService
+from shared.models import ParsedDocument
+
+TEXT = "Clause 1. Cables shall be XLPE insulated.\n\nClause 2. Conductors shall be copper.\n"
+
+
+class ThreadRecordingRedis:
+    """Generation counters that remember which thread read them"""
+
+    def __init__(self):
+        self.threads = []
+
+    def mget(self, keys):
+        self.threads.append(threading.current_thread())
+        return [None] * len(keys)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_service_is_built_on_a_worker_thread(rag_service, monkeypatch):
+    built_on = []
+
+    def build():
+        built_on.append(threading.current_thread())
+        return rag_service
+
+    monkeypatch.setattr(async_rag, 'get_rag_service', build)
+    service = AsyncDocumentRAGService()
+    assert built_on == []
+
+    async def first_requests():
+        return await asyncio.gather(service.get_document_stats('RFP-1'), service.query_documents('copper'))
+
+    run(first_requests())
+
+    assert built_on and threading.main_thread() not in built_on
+    assert service.service is rag_service
+
+
+def test_shared_cache_lookup_runs_off_the_loop(rag_service):
+    redis = ThreadRecordingRedis()
+    rag_service.result_cache.redis = redis
+    service = AsyncDocumentRAGService(rag_service)
+
+    run(service.query_documents('copper', 'RFP-1'))
+
+    assert redis.threads and threading.main_thread() not in redis.threads
+
+
+def test_results_match_the_sync_service(rag_service):
+    document = ParsedDocument(source_path='rfp.pdf', text=TEXT, page_texts=[TEXT], metadata={})
+    service = AsyncDocumentRAGService(rag_service)
+    assert run(service.ingest_document('rfp.pdf', 'RFP-1', document=document))
+
+    async_hits = run(service.query_documents('copper conductors', 'RFP-1'))
+    rag_service.result_cache.invalidate()
+
+    assert async_hits == rag_service.query_documents('copper conductors', 'RFP-1')
+    assert async_hits and async_hits[0]['rfp_id'] == 'RFP-1'
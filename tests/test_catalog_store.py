@@ -0,0 +1,101 @@
+"""
+Catalog store incremental refresh tests (against an in-memory products table)
+"""
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+
+from agents.technical import catalog_store
+from agents.technical.catalog_store import CatalogStore
+
+T0 = datetime(2026, 1, 1, 12, 0, 0)
+
+
+class FakeProductsTable:
+    """Answers the two queries CatalogStore issues, like psycopg2 would"""
+
+    def __init__(self):
+        self.rows = {}
+
+    def put(self, sku, voltage, updated_at):
+        self.rows[sku] = (
+            sku, f"Cable {sku}", {'voltage': voltage, 'insulation_material': 'XLPE'},
+            '', 100.0, 'in_stock', updated_at
+        )
+
+    @contextmanager
+    def get_connection(self):
+        yield self
+
+    @contextmanager
+    def cursor(self):
+        yield self
+
+    def execute(self, sql, params=None):
+        if sql.strip() == "SELECT sku FROM products":
+            self._result = [(sku,) for sku in self.rows]
+        elif params:
+            self._result = [row for row in self.rows.values() if row[6] > params[0]]
+        else:
+            self._result = list(self.rows.values())
+
+    def fetchall(self):
+        return self._result
+
+
+@pytest.fixture
+def table(monkeypatch):
+    table = FakeProductsTable()
+    monkeypatch.setattr(catalog_store, 'get_db_manager', lambda: table)
+    return table
+
+
+def _skus(store):
+    return sorted(p['sku'] for p in store.get_catalog().products)
+
+
+def test_delete_plus_insert_with_unchanged_count_drops_the_deleted_sku(table):
+    table.put('A', '11kV', T0)
+    table.put('B', '11kV', T0)
+    store = CatalogStore(refresh_seconds=0, overlap_seconds=0)
+    assert _skus(store) == ['A', 'B']
+
+    # Row count stays at 2, and C's updated_at is behind the watermark
+    del table.rows['A']
+    table.put('C', '33kV', T0 - timedelta(hours=1))
+
+    assert _skus(store) == ['B', 'C']
+
+
+def test_deleted_sku_is_dropped_without_a_full_reload(table, monkeypatch):
+    table.put('A', '11kV', T0)
+    table.put('B', '11kV', T0)
+    store = CatalogStore(refresh_seconds=0, overlap_seconds=0)
+    store.get_catalog()
+    monkeypatch.setattr(store, '_full_load', lambda: pytest.fail("unexpected full reload"))
+
+    del table.rows['A']
+
+    assert _skus(store) == ['B']
+    assert store.version == 2
+
+
+def test_unchanged_table_keeps_the_snapshot(table):
+    table.put('A', '11kV', T0)
+    store = CatalogStore(refresh_seconds=0, overlap_seconds=0)
+    first = store.get_catalog()
+
+    assert store.get_catalog() is first
+    assert store.version == 1
+
+
+def test_row_missed_by_the_watermark_forces_a_full_reload(table):
+    table.put('A', '11kV', T0)
+    store = CatalogStore(refresh_seconds=0, overlap_seconds=0)
+    store.get_catalog()
+
+    # Committed late with an updated_at older than the watermark
+    table.put('B', '11kV', T0 - timedelta(hours=1))
+
+    assert _skus(store) == ['A', 'B']
@@ -0,0 +1,55 @@
+"""
+Chunk text store tests, standalone and behind DocumentRAGService
+"""
+import pytest
+
+from shared.models import ParsedDocument
+from shared.rag.text_store import ChunkTextStore
+
+TEXT = '\n\n'.join(
+    f"Clause {i}. " + ' '.join(f"term{i}x{j}" for j in range(60)) + '.' for i in range(12)
+) + '\n'
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ChunkTextStore(str(tmp_path / 'chunks.sqlite3'))
+    yield store
+    store.close()
+
+
+def test_round_trip_beyond_the_parameter_limit(store):
+    store.put_many('RFP-1', ((f'p{i}', f'text {i}') for i in range(1200)))
+
+    texts = store.get_many([f'p{i}' for i in range(1200)] + ['missing'])
+
+    assert len(texts) == 1200 and texts['p1199'] == 'text 1199'
+
+
+def test_delete_by_point_and_by_rfp(store):
+    store.put_many('RFP-1', [('a', 'A'), ('b', 'B')])
+    store.put_many('RFP-2', [('c', 'C')])
+
+    store.delete(['a'])
+    assert store.get_many(['a', 'b']) == {'b': 'B'}
+
+    store.delete_rfp('RFP-1')
+    assert (store.count('RFP-1'), store.count('RFP-2'), store.count()) == (0, 1, 1)
+
+
+def test_rag_service_keeps_text_out_of_payloads(rag_service, store):
+    rag_service.text_store = store
+    document = ParsedDocument(source_path='rfp.pdf', text=TEXT, page_texts=[TEXT], metadata={})
+    assert rag_service.ingest_document('rfp.pdf', 'RFP-1', document=document)
+
+    points, _ = rag_service.client.scroll('rfp_documents', limit=100)
+    assert points and not any('text' in p.payload for p in points)
+    assert store.count('RFP-1') == len(points)
+
+    some_text = store.get_many([str(points[0].id)])[str(points[0].id)]
+    [hit] = rag_service.query_documents(some_text, 'RFP-1', limit=1)
+    assert hit['text'] == some_text
+    assert rag_service.get_document_stats('RFP-1', exact=True)['chunks_preview'][0]['text_preview']
+
+    rag_service.delete_document('RFP-1')
+    assert store.count() == 0
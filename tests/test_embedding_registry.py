@@ -0,0 +1,63 @@
+"""
+Embedding model registry tests (model loading replaced by a counting stub)
+"""
+import threading
+import time
+
+import pytest
+
+from shared.embeddings.registry import EmbeddingModelRegistry, canonical_model_name
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = EmbeddingModelRegistry()
+    registry.loads = []
+
+    def fake_load(name):
+        registry.loads.append(name)
+        time.sleep(0.05)  # long enough for concurrent first calls to overlap
+        registry._models[name] = object()
+        registry._metrics[name] = {'requests': 0}
+
+    monkeypatch.setattr(registry, '_load', fake_load)
+    return registry
+
+
+def test_aliases_share_one_instance(registry):
+    short = registry.get('all-MiniLM-L6-v2')
+    full = registry.get('sentence-transformers/all-MiniLM-L6-v2')
+
+    assert short is full
+    assert registry.loads == ['sentence-transformers/all-MiniLM-L6-v2']
+    assert registry.stats()['sentence-transformers/all-MiniLM-L6-v2']['requests'] == 2
+
+
+def test_default_model_comes_from_env(registry, monkeypatch):
+    monkeypatch.setenv('EMBEDDING_MODEL', 'all-mpnet-base-v2')
+    assert canonical_model_name() == 'sentence-transformers/all-mpnet-base-v2'
+    registry.get()
+    assert registry.is_loaded('all-mpnet-base-v2')
+
+
+def test_concurrent_first_calls_load_once(registry):
+    barrier = threading.Barrier(8)
+    results = []
+
+    def first_call():
+        barrier.wait()
+        results.append(registry.get('all-MiniLM-L6-v2'))
+
+    threads = [threading.Thread(target=first_call) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(registry.loads) == 1
+    assert len({id(model) for model in results}) == 1
+
+
+def test_different_models_load_separately(registry):
+    assert registry.get('all-MiniLM-L6-v2') is not registry.get('all-mpnet-base-v2')
+    assert len(registry.loads) == 2
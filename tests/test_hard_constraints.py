@@ -0,0 +1,78 @@
+"""
+Hard-constraint tests: voltage and materials must match exactly, on both matching paths
+"""
+import pytest
+
+from shared.models import LineItem, Specification
+
+
+def product(sku, voltage, insulation, size='185 sq mm'):
+    return {
+        'sku': sku,
+        'product_name': f'{voltage} {insulation} cable {size}',
+        'specifications': {
+            'voltage': voltage,
+            'conductor_size': size,
+            'conductor_material': 'Copper',
+            'insulation_material': insulation,
+            'cable_type': '3 core, armoured'
+        },
+        'datasheet_url': ''
+    }
+
+
+PRODUCTS = [
+    product('PE-11KV-185', '11kV', 'PE'),
+    product('PE-11KV-240', '11 kV', 'PE', '240 sq mm'),
+    product('XLPE-11KV-185', '11kV', 'XLPE'),
+    product('PE-1KV-185', '1kV', 'PE'),
+    product('PE-33KV-185', '33kV', 'PE'),
+]
+
+SPEC = Specification(
+    rfp_id='RFP-HC',
+    specifications={
+        'voltage': '11kV',
+        'conductor_size': '185 sq mm',
+        'conductor_material': 'Copper',
+        'insulation_material': 'PE',
+        'cable_type': '3 core, armoured'
+    },
+    testing_requirements={},
+    confidence_score=1.0
+)
+
+
+def test_constraints_are_exact_canonical_values(make_technical_agent):
+    agent = make_technical_agent(PRODUCTS, vectors=False)
+    assert agent._hard_constraints({'voltage': '11kV', 'insulation_material': 'PE'}) == {
+        'voltage': ['11000.0'],
+        'insulation_material': ['pe']
+    }
+
+
+def test_unmatched_constraint_is_not_applied(make_technical_agent):
+    agent = make_technical_agent(PRODUCTS, vectors=False)
+    assert agent._hard_constraints({'voltage': '66kV', 'insulation_material': 'PE'}) == {
+        'insulation_material': ['pe']
+    }
+
+
+@pytest.mark.parametrize('vectors', [False, True], ids=['rules', 'hybrid'])
+def test_1kv_and_xlpe_products_are_excluded(make_technical_agent, vectors):
+    agent = make_technical_agent(PRODUCTS, vectors=vectors)
+
+    matches = agent.match_products('RFP-HC', SPEC, top_k=10)
+
+    assert [m.sku for m in matches] == ['PE-11KV-185', 'PE-11KV-240']
+
+
+def test_rules_apply_constraints_when_hybrid_finds_nothing(make_technical_agent, monkeypatch):
+    agent = make_technical_agent(PRODUCTS)
+    monkeypatch.setattr(agent, '_hybrid_matching', lambda specs, top_k: [[] for _ in specs])
+
+    item = LineItem('1', '11kV PE cable 185 sq mm', 2.0, 'km', SPEC.specifications)
+
+    [matches] = agent.match_line_items('RFP-HC', [item], top_k=10)
+
+    assert {m.sku for m in matches} == {'PE-11KV-185', 'PE-11KV-240'}
@@ -0,0 +1,102 @@
+"""
+RAG ingestion queue tests (thread backend, fake RAG service, no Redis)
+"""
+import threading
+
+import pytest
+
+from shared.rag.ingest_queue import (
+    COMPLETED, FAILED, QUEUED, UNKNOWN, IngestProgressStore, RAGIngestionQueue
+)
+
+
+class FakeRAGService:
+    """Reports progress like DocumentRAGService.ingest_document; optionally blocks"""
+
+    def __init__(self, gate=None, fail=()):
+        self.gate = gate
+        self.fail = set(fail)
+
+    def ingest_document(self, pdf_path, rfp_id, metadata=None, document=None, on_progress=None):
+        if self.gate is not None:
+            self.gate.wait(5)
+        on_progress(pages_total=2, pages_parsed=2)
+        on_progress(chunks_embedded=10)
+        on_progress(chunks_upserted=10)
+        on_progress(chunks=10, total_chunks=10, skipped=0, removed=0)
+        return rfp_id not in self.fail
+
+
+def make_queue(service, history=200, max_pending=100, workers=2):
+    return RAGIngestionQueue(
+        service=service,
+        workers=workers,
+        max_pending=max_pending,
+        backend='thread',
+        store=IngestProgressStore(max_jobs=history, use_redis=False)
+    )
+
+
+@pytest.fixture
+def queue():
+    queue = make_queue(FakeRAGService(fail={'RFP-BAD'}))
+    yield queue
+    queue.shutdown()
+
+
+def test_job_records_progress_and_outcome(queue):
+    good = queue.submit('/uploads/RFP-1_a.pdf', 'RFP-1')
+    bad = queue.submit('/uploads/RFP-BAD_a.pdf', 'RFP-BAD')
+
+    done, failed = queue.wait([good['job_id'], bad['job_id']], timeout=5, poll_seconds=0.01)
+
+    assert done['status'] == COMPLETED
+    assert (done['pages_parsed'], done['chunks_embedded'], done['chunks_upserted']) == (2, 10, 10)
+    assert done['started_at'] and done['finished_at']
+    assert failed['status'] == FAILED and failed['error']
+
+
+def test_pinned_jobs_outlive_the_history_limit():
+    queue = make_queue(FakeRAGService(), history=20)
+    try:
+        job_ids = [queue.submit(f'/uploads/RFP-{i}_a.pdf', f'RFP-{i}', pin=True)['job_id'] for i in range(60)]
+
+        jobs = queue.wait(job_ids, timeout=10, poll_seconds=0.01)
+
+        assert [job['status'] for job in jobs] == [COMPLETED] * 60
+        queue.release(job_ids)
+        assert len(queue.jobs()) == 20
+    finally:
+        queue.shutdown()
+
+
+def test_forgotten_jobs_are_unknown_not_failed():
+    queue = make_queue(FakeRAGService(), history=5, workers=1)
+    try:
+        job_ids = [queue.submit(f'/uploads/RFP-{i}_a.pdf', f'RFP-{i}')['job_id'] for i in range(5)]
+        queue.wait(job_ids, timeout=5, poll_seconds=0.01)
+        for i in range(5, 10):
+            queue.submit(f'/uploads/RFP-{i}_a.pdf', f'RFP-{i}')
+        queue.shutdown()
+
+        assert {job['status'] for job in queue.wait(job_ids, timeout=0)} == {UNKNOWN}
+    finally:
+        queue.shutdown()
+
+
+def test_duplicate_submission_returns_the_active_job():
+    gate = threading.Event()
+    queue = make_queue(FakeRAGService(gate=gate), max_pending=2, workers=1)
+    try:
+        first = queue.submit('/uploads/RFP-1_a.pdf', 'RFP-1')
+        assert queue.submit('/uploads/RFP-1_a.pdf', 'RFP-1')['job_id'] == first['job_id']
+
+        queue.submit('/uploads/RFP-2_a.pdf', 'RFP-2')
+        with pytest.raises(RuntimeError):
+            queue.submit('/uploads/RFP-3_a.pdf', 'RFP-3')
+        assert queue.stats()[QUEUED] + queue.stats()['running'] == 2
+    finally:
+        gate.set()
+        queue.shutdown()
+
+    assert queue.stats()[COMPLETED] == 2
@@ -0,0 +1,56 @@
+"""
+BOQ line item pricing tests
+"""
+import pytest
+
+from agents.pricing.agent import PricingAgent
+from shared.models import LineItem, ProductMatch
+
+
+def _item(item_no, quantity):
+    return LineItem(item_no=item_no, description=f"Cable {item_no}", quantity=quantity, unit='m', specifications={})
+
+
+def _match(sku):
+    return ProductMatch(sku=sku, product_name=sku, match_score=0.9, specification_alignment={}, datasheet_url='')
+
+
+@pytest.fixture
+def priced_boq():
+    # '1' repeats (two sections of the BOQ) and also collides with a
+    # positional fallback number; item '3' has no match
+    line_items = [_item('1', 100), _item('2', 200), _item('3', 50), _item('1', 400)]
+    item_matches = [
+        [_match('XLPE-11KV-185')],
+        [_match('XLPE-11KV-240')],
+        [],
+        [_match('XLPE-33KV-185')],
+    ]
+    pricing = PricingAgent().calculate_line_item_pricing('RFP-1', line_items, item_matches)
+    return line_items, item_matches, pricing
+
+
+def test_pricing_follows_line_item_order(priced_boq):
+    line_items, _, pricing = priced_boq
+    assert [(p.item_no, p.sku, p.quantity) for p in pricing] == [
+        ('1', 'XLPE-11KV-185', 100),
+        ('2', 'XLPE-11KV-240', 200),
+        ('1', 'XLPE-33KV-185', 400),
+    ]
+
+
+def test_serialized_line_items_keep_their_own_price(priced_boq):
+    # Skipped where the workflow's agent dependencies are not installed
+    RFPWorkflow = pytest.importorskip("orchestrator.workflow").RFPWorkflow
+
+    line_items, item_matches, pricing = priced_boq
+    rows = RFPWorkflow._serialize_line_items(None, line_items, item_matches, pricing)
+
+    assert [(r['item_no'], r['pricing'] and r['pricing']['sku']) for r in rows] == [
+        ('1', 'XLPE-11KV-185'),
+        ('2', 'XLPE-11KV-240'),
+        ('3', None),
+        ('1', 'XLPE-33KV-185'),
+    ]
+    assert rows[0]['pricing']['quantity'] == 100
+    assert rows[3]['pricing']['quantity'] == 400
@@ -0,0 +1,93 @@
+"""
+Local vector index tests: filtered search, persistence through the write log, lock
+"""
+import numpy as np
+import pytest
+
+from shared.vectors import LocalVectorClient, models
+
+DIM = 8
+
+
+def points(ids, rng):
+    return [
+        models.PointStruct(
+            id=i,
+            vector=rng.normal(size=DIM).tolist(),
+            payload={'rfp_id': f"RFP-{i % 3}", 'meta': {'page': i}}
+        )
+        for i in ids
+    ]
+
+
+def rfp_filter(rfp_id):
+    return models.Filter(must=[models.FieldCondition(key='rfp_id', match=models.MatchValue(value=rfp_id))])
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+def new_client(path=None):
+    client = LocalVectorClient(str(path) if path else None)
+    client.create_collection('docs', models.VectorParams(size=DIM, distance=models.Distance.COSINE))
+    return client
+
+
+def test_filtered_search_matches_brute_force(rng):
+    client = new_client()
+    batch = points(range(300), rng)
+    client.upsert('docs', batch)
+    query = rng.normal(size=DIM)
+
+    hits = client.search('docs', query.tolist(), query_filter=rfp_filter('RFP-1'), limit=5)
+
+    vectors = np.array([p.vector for p in batch])
+    scores = vectors @ query / np.linalg.norm(vectors, axis=1) / np.linalg.norm(query)
+    eligible = [i for i in range(300) if i % 3 == 1]
+    expected = sorted(eligible, key=lambda i: -scores[i])[:5]
+    assert [h.id for h in hits] == expected
+    assert np.allclose([h.score for h in hits], scores[expected], atol=1e-5)
+
+
+def test_nested_keys_and_match_any(rng):
+    client = new_client()
+    client.upsert('docs', points(range(10), rng))
+    query_filter = models.Filter(must=[
+        models.FieldCondition(key='meta.page', match=models.MatchAny(any=[2, 4, 5]))
+    ])
+
+    hits = client.search('docs', rng.normal(size=DIM).tolist(), query_filter=query_filter, limit=10)
+
+    assert sorted(h.id for h in hits) == [2, 4, 5]
+
+
+def test_writes_survive_reopen_without_close(tmp_path, rng):
+    client = new_client(tmp_path)
+    client.upsert('docs', points(range(20), rng))
+    client.set_payload('docs', payload={'stale': True}, points=[1, 2])
+    client.delete('docs', points_selector=models.PointIdsList(points=[3]))
+    client.delete('docs', points_selector=models.FilterSelector(filter=rfp_filter('RFP-2')))
+    # Simulate a crash: release the lock without taking a snapshot
+    client._path_lock.close()
+
+    reopened = LocalVectorClient(str(tmp_path))
+    try:
+        expected = [i for i in range(20) if i != 3 and i % 3 != 2]
+        assert reopened.count('docs').count == len(expected)
+        records, _ = reopened.scroll('docs', limit=100)
+        assert [r.id for r in records] == expected
+        assert reopened.retrieve('docs', [1])[0].payload['stale'] is True
+        assert 'stale' not in reopened.retrieve('docs', [4])[0].payload
+    finally:
+        reopened.close()
+
+
+def test_path_is_locked_until_close(tmp_path):
+    client = new_client(tmp_path)
+    with pytest.raises(RuntimeError):
+        LocalVectorClient(str(tmp_path))
+    client.close()
+
+    LocalVectorClient(str(tmp_path)).close()
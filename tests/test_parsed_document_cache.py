@@ -0,0 +1,52 @@
+"""
+Parsed document cache and PDF text backend tests
+"""
+import pytest
+
+pymupdf = pytest.importorskip("pymupdf")
+pytest.importorskip("pdfplumber")
+
+from agents.document.agent import DocumentAgent
+from agents.document.cache import ParsedDocumentCache
+from shared.pdf import backends
+
+
+def _write_pdf(path, pages=3):
+    doc = pymupdf.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"Page {i + 1}: 11kV XLPE cable, copper conductor")
+    doc.save(str(path))
+    doc.close()
+
+
+class _BrokenPyMuPDF(backends.PyMuPDFDocument):
+    def __init__(self, pdf_path):
+        raise RuntimeError("cannot open document")
+
+
+def test_fallback_backend_document_is_a_cache_hit(tmp_path, monkeypatch):
+    pdf_path = tmp_path / "tender.pdf"
+    _write_pdf(pdf_path)
+    monkeypatch.setitem(backends.TEXT_BACKENDS, 'pymupdf', _BrokenPyMuPDF)
+
+    cache = ParsedDocumentCache(cache_dir=str(tmp_path / "cache"))
+    agent = DocumentAgent(cache=cache, text_backend='pymupdf')
+
+    first = agent.parse_document(str(pdf_path))
+    assert first.text_backend == 'pdfplumber'
+
+    second = agent.parse_document(str(pdf_path))
+    assert cache.hits == 1
+    assert second.page_texts == first.page_texts
+
+
+def test_cache_entry_of_other_backend_is_a_miss(tmp_path):
+    pdf_path = tmp_path / "tender.pdf"
+    _write_pdf(pdf_path)
+    cache = ParsedDocumentCache(cache_dir=str(tmp_path / "cache"))
+
+    DocumentAgent(cache=cache, text_backend='pdfplumber').parse_document(str(pdf_path))
+    DocumentAgent(cache=cache, text_backend='pymupdf').parse_document(str(pdf_path))
+
+    assert cache.hits == 0
+    assert cache.misses == 2
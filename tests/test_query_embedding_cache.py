@@ -0,0 +1,70 @@
+"""
+Query embedding cache tests (in-memory only, fake models)
+"""
+import zlib
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from shared.embeddings.query_cache import QueryEmbeddingCache
+
+
+class FakeModel:
+    """Deterministic per-text vectors; records every text it embeds"""
+
+    def __init__(self, lowercase=False):
+        self.tokenizer = SimpleNamespace(do_lower_case=lowercase)
+        self.encoded = []
+
+    def encode(self, texts, convert_to_numpy=True, **kwargs):
+        self.encoded.extend(texts)
+        if self.tokenizer.do_lower_case:
+            texts = [t.lower() for t in texts]
+        return np.stack([
+            np.random.default_rng(zlib.crc32(t.encode())).normal(size=8) for t in texts
+        ]).astype(np.float32)
+
+
+@pytest.fixture
+def cache():
+    return QueryEmbeddingCache('all-MiniLM-L6-v2', max_size=3, use_redis=False)
+
+
+def test_cased_model_keeps_case_distinct(cache):
+    model = FakeModel(lowercase=False)
+    upper, lower = cache.encode(model, ['PE insulation', 'pe insulation'])
+
+    assert model.encoded == ['PE insulation', 'pe insulation']
+    assert not np.allclose(upper, lower)
+    assert np.allclose(upper, model.encode(['PE insulation'])[0])
+
+
+def test_uncased_model_shares_entries_across_case(cache):
+    model = FakeModel(lowercase=True)
+    cache.encode(model, ['PE insulation'])
+    cache.encode(model, ['pe insulation'])
+
+    assert model.encoded == ['PE insulation']
+    assert cache.stats()['hits'] == 1
+
+
+def test_whitespace_is_always_folded(cache):
+    model = FakeModel()
+    first, second = cache.encode(model, ['11kV  XLPE', ' 11kV XLPE\n'])
+
+    assert model.encoded == ['11kV  XLPE']
+    assert np.array_equal(first, second)
+
+
+def test_lru_bound_and_order(cache):
+    model = FakeModel()
+    cache.encode(model, ['a', 'b', 'c'])
+    cache.encode(model, ['a'])       # refresh a
+    cache.encode(model, ['d'])       # evicts b
+    model.encoded.clear()
+
+    cache.encode(model, ['a', 'b', 'c', 'd'])
+
+    assert model.encoded == ['b']
+    assert cache.stats()['size'] == 3
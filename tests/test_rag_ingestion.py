@@ -0,0 +1,148 @@
+"""
+RAG ingestion tests: batched embedding, bounded upserts, incremental re-ingestion
+"""
+from shared.models import ParsedDocument
+
+
+def document(paragraphs):
+    text = '\n\n'.join(paragraphs) + '\n'
+    return ParsedDocument(source_path='rfp.pdf', text=text, page_texts=[text], metadata={})
+
+
+def paragraph(i, words=60):
+    return f"Clause {i}. " + ' '.join(f"term{i}x{j}" for j in range(words)) + '.'
+
+
+DOCUMENT = document([paragraph(i) for i in range(40)])
+
+
+def stored(service, rfp_id='RFP-1'):
+    points, _ = service.client.scroll(
+        'rfp_documents', scroll_filter=service._rfp_filter(rfp_id), limit=10_000
+    )
+    return {str(p.id): p.payload for p in points}
+
+
+def test_chunks_are_embedded_and_upserted_in_bounded_batches(rag_service):
+    rag_service.upsert_batch_size = 8
+    upserts = []
+    upsert = rag_service.client.upsert
+
+    def counting_upsert(collection_name, points, **kwargs):
+        if collection_name == 'rfp_documents':
+            upserts.append(len(points))
+        return upsert(collection_name, points, **kwargs)
+
+    rag_service.client.upsert = counting_upsert
+
+    assert rag_service.ingest_document('rfp.pdf', 'RFP-1', document=DOCUMENT)
+
+    chunks = rag_service.last_ingest_stats['chunks']
+    assert chunks > 16
+    assert max(upserts) <= 8 and sum(upserts) == chunks
+    assert rag_service.embedding_model.calls == upserts
+    assert len(stored(rag_service)) == chunks
+
+
+def test_parallel_uploads_store_the_same_points(rag_service):
+    rag_service.upsert_batch_size = 4
+    rag_service.ingest_document('rfp.pdf', 'RFP-1', document=DOCUMENT)
+    sequential = {pid: payload['text'] for pid, payload in stored(rag_service).items()}
+
+    rag_service.delete_document('RFP-1')
+    rag_service.upload_parallelism = 3
+    rag_service.ingest_document('rfp.pdf', 'RFP-1', document=DOCUMENT)
+
+    assert {pid: payload['text'] for pid, payload in stored(rag_service).items()} == sequential
+
+
+def test_progress_is_reported_per_batch(rag_service):
+    rag_service.upsert_batch_size = 8
+    events = []
+
+    rag_service.ingest_document('rfp.pdf', 'RFP-1', document=DOCUMENT, on_progress=lambda **kw: events.append(kw))
+
+    chunks = rag_service.last_ingest_stats['chunks']
+    embedded = [e['chunks_embedded'] for e in events if 'chunks_embedded' in e and 'chunks' not in e]
+    upserted = [e['chunks_upserted'] for e in events if 'chunks_upserted' in e]
+    assert events[0] == {'pages_total': 1, 'pages_parsed': 1}
+    assert embedded == sorted(embedded) and embedded[-1] == chunks
+    assert upserted == sorted(upserted) and upserted[-1] == chunks
+    assert events[-1]['total_chunks'] == chunks
+
+
+def test_ingested_chunks_are_searchable(rag_service):
+    rag_service.ingest_document('rfp.pdf', 'RFP-1', document=DOCUMENT)
+    some_chunk = next(iter(stored(rag_service).values()))['text']
+
+    [hit] = rag_service.query_documents(some_chunk, 'RFP-1', limit=1)
+
+    assert hit['text'] == some_chunk
+    assert hit['metadata']['pdf_path'] == 'rfp.pdf'
+
+
+def test_reingesting_the_same_document_embeds_nothing(rag_service):
+    rag_service.ingest_document('rfp.pdf', 'RFP-1', document=DOCUMENT)
+    first = stored(rag_service)
+    calls = len(rag_service.embedding_model.calls)
+
+    rag_service.ingest_document('rfp.pdf', 'RFP-1', document=DOCUMENT)
+
+    stats = rag_service.last_ingest_stats
+    assert (stats['chunks'], stats['skipped'], stats['removed']) == (0, len(first), 0)
+    assert len(rag_service.embedding_model.calls) == calls
+    assert stored(rag_service).keys() == first.keys()
+
+
+def test_edited_document_embeds_only_new_chunks(rag_service):
+    rag_service.ingest_document('rfp.pdf', 'RFP-1', document=DOCUMENT)
+    before = stored(rag_service)
+
+    # Two clauses inserted up front (one chunk's worth), one clause reworded
+    edited = document(
+        [paragraph('new1'), paragraph('new2')]
+        + [paragraph('reworded') if i == 20 else paragraph(i) for i in range(40)]
+    )
+    rag_service.ingest_document('rfp.pdf', 'RFP-1', document=edited)
+
+    stats = rag_service.last_ingest_stats
+    after = stored(rag_service)
+    assert 0 < stats['chunks'] < len(before) // 2
+    assert stats['removed'] == len(before.keys() - after.keys()) > 0
+    assert stats['reindexed'] > 0
+    assert len(after) == stats['total_chunks']
+    # Every chunk sits at its position in the edited document
+    assert [after[pid]['text'] for pid in sorted(after, key=lambda p: after[p]['chunk_index'])] == \
+        rag_service.chunk_text(edited.text)
+
+
+def test_unchanged_chunks_get_new_document_metadata(rag_service):
+    rag_service.ingest_document('rfp.pdf', 'RFP-1', metadata={'title': 'v1'}, document=DOCUMENT)
+    rag_service.upsert_batch_size = 4
+    updates = []
+    batch_update_points = rag_service.client.batch_update_points
+
+    def counting_update(collection_name, update_operations, **kwargs):
+        updates.append([len(op.set_payload.points) for op in update_operations])
+        return batch_update_points(collection_name, update_operations, **kwargs)
+
+    rag_service.client.batch_update_points = counting_update
+    rag_service.ingest_document('v2.pdf', 'RFP-1', metadata={'title': 'v2'}, document=DOCUMENT)
+
+    payloads = stored(rag_service).values()
+    assert {(p['title'], p['pdf_path']) for p in payloads} == {('v2', 'v2.pdf')}
+    # Batched: at most upsert_batch_size points per operation and operations per request
+    assert all(len(ops) <= 4 and max(ops) <= 4 for ops in updates)
+    assert sum(map(sum, updates)) == len(payloads)
+
+
+def test_rfps_do_not_share_chunks(rag_service):
+    rag_service.ingest_document('rfp.pdf', 'RFP-1', document=DOCUMENT)
+    rag_service.ingest_document('rfp.pdf', 'RFP-2', document=DOCUMENT)
+
+    assert rag_service.last_ingest_stats['skipped'] == 0
+    assert not stored(rag_service, 'RFP-1').keys() & stored(rag_service, 'RFP-2').keys()
+
+    rag_service.delete_document('RFP-2')
+    assert stored(rag_service, 'RFP-2') == {}
+    assert stored(rag_service, 'RFP-1')
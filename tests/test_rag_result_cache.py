@@ -0,0 +1,136 @@
+"""
+RAG result cache tests: TTL, LRU, per-RFP invalidation, shared invalidation through Redis
+"""
+import pytest
+
+from shared.rag import result_cache
+from shared.rag.result_cache import RAGResultCache
+
+HITS = [{'text': 'XLPE 11kV', 'score': 0.9, 'metadata': {'page': 1}}]
+
+
+class FakeRedis:
+    """Counters shared by every cache holding the same instance"""
+
+    def __init__(self):
+        self.values = {}
+
+    def mget(self, keys):
+        return [self.values.get(k) for k in keys]
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+
+    def execute(self):
+        pass
+
+
+def cache(**kwargs):
+    return RAGResultCache(**{'max_size': 16, 'ttl_seconds': 60, 'use_redis': False, **kwargs})
+
+
+def search(cache, query, rfp_id, results=HITS, limit=5):
+    """What query_documents does: look up, and store on a miss"""
+    cached = cache.get(query, rfp_id, limit)
+    if cached is not None:
+        return cached
+    cache.put(query, rfp_id, limit, results)
+    return None
+
+
+def test_hit_returns_a_copy():
+    c = cache()
+    search(c, 'cable size', 'RFP-1')
+
+    hit = c.get('cable  size', 'RFP-1', 5)
+    hit[0]['metadata']['page'] = 99
+
+    assert c.get('cable size', 'RFP-1', 5) == HITS
+    assert c.get('Cable size', 'RFP-1', 5) is None  # case is significant
+    assert c.get('cable size', 'RFP-1', 10) is None
+
+
+def test_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, 'monotonic', lambda: now[0])
+    c = cache(ttl_seconds=30)
+    search(c, 'q', 'RFP-1')
+
+    now[0] += 29
+    assert c.get('q', 'RFP-1', 5) == HITS
+    now[0] += 2
+    assert c.get('q', 'RFP-1', 5) is None
+
+
+def test_least_recently_used_is_evicted():
+    c = cache(max_size=2)
+    search(c, 'a', 'RFP-1')
+    search(c, 'b', 'RFP-1')
+    c.get('a', 'RFP-1', 5)
+    search(c, 'c', 'RFP-1')
+
+    assert c.get('b', 'RFP-1', 5) is None
+    assert c.get('a', 'RFP-1', 5) == HITS
+    assert c.stats()['size'] == 2
+
+
+def test_invalidation_drops_the_rfp_and_unscoped_entries():
+    c = cache()
+    for rfp_id in ('RFP-1', 'RFP-2', None):
+        search(c, 'q', rfp_id)
+
+    assert c.invalidate('RFP-1') == 2
+
+    assert c.get('q', 'RFP-1', 5) is None
+    assert c.get('q', None, 5) is None
+    assert c.get('q', 'RFP-2', 5) == HITS
+    assert c.invalidate() == 1
+
+
+def test_disabled_cache_stores_nothing():
+    c = cache(ttl_seconds=0)
+    search(c, 'q', 'RFP-1')
+    assert c.get('q', 'RFP-1', 5) is None
+    assert c.stats()['size'] == 0
+
+
+@pytest.fixture
+def shared_caches():
+    redis = FakeRedis()
+    api, worker = cache(), cache()
+    api.redis = worker.redis = redis
+    return api, worker
+
+
+def test_invalidation_in_another_process_is_seen(shared_caches):
+    api, worker = shared_caches
+    for rfp_id in ('RFP-1', 'RFP-2', None):
+        search(api, 'q', rfp_id)
+
+    worker.invalidate('RFP-1')
+
+    assert api.get('q', 'RFP-1', 5) is None
+    assert api.get('q', None, 5) is None
+    assert api.get('q', 'RFP-2', 5) == HITS
+
+    worker.invalidate()
+    assert api.get('q', 'RFP-2', 5) is None
+
+
+def test_invalidation_during_a_search_is_not_cached_over(shared_caches):
+    api, worker = shared_caches
+    assert api.get('q', 'RFP-1', 5) is None
+    # Chunks change while the search for the miss is running
+    worker.invalidate('RFP-1')
+    api.put('q', 'RFP-1', 5, HITS)
+
+    assert api.get('q', 'RFP-1', 5) is None
+
+
+def test_put_without_a_miss_is_not_cached_with_redis(shared_caches):
+    api, _ = shared_caches
+    api.put('q', 'RFP-1', 5, HITS)
+    assert api.get('q', 'RFP-1', 5) is None
@@ -0,0 +1,44 @@
+"""
+Batched semantic search tests (in-process vector index, deterministic embeddings)
+"""
+import pytest
+
+from agents.technical import agent as technical_agent
+from agents.technical.catalog_store import FALLBACK_PRODUCTS
+
+
+@pytest.fixture
+def agent(make_technical_agent):
+    return make_technical_agent(FALLBACK_PRODUCTS)
+
+
+def test_batched_results_match_one_query_at_a_time(agent, monkeypatch):
+    monkeypatch.setattr(technical_agent, 'SEARCH_BATCH_SIZE', 4)
+    queries = [f"11kV XLPE cable {size} sq mm" for size in (95, 120, 150, 185, 240, 300, 400)]
+
+    batched = agent.semantic_search_many(queries, top_k=3)
+    single = [agent.semantic_search_many([q], top_k=3)[0] for q in queries]
+
+    assert [[p['sku'] for p in hits] for hits in batched] == [[p['sku'] for p in hits] for hits in single]
+    assert all(len(hits) == 3 for hits in batched)
+    # One forward pass for the whole batch
+    assert agent.embedding_model.calls[0] == len(queries)
+
+
+def test_per_query_filters_stay_with_their_query(agent):
+    spec_11kv = {'voltage': '11kV'}
+    spec_33kv = {'voltage': '33kV'}
+
+    hits_11kv, hits_33kv = agent.semantic_search_many(
+        ['XLPE cable', 'XLPE cable'],
+        top_k=5,
+        filters=[agent._payload_filter(spec_11kv), agent._payload_filter(spec_33kv)]
+    )
+
+    assert hits_11kv and all('11KV' in p['sku'] for p in hits_11kv)
+    assert [p['sku'] for p in hits_33kv] == ['XLPE-33KV-185']
+
+
+def test_no_vector_db_returns_one_empty_list_per_query(make_technical_agent):
+    agent = make_technical_agent(FALLBACK_PRODUCTS, vectors=False)
+    assert agent.semantic_search_many(['a', 'b']) == [[], []]
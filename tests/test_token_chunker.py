@@ -0,0 +1,68 @@
+"""
+TokenChunker tests: token budget, lossless splitting, overlap, table rows
+"""
+import re
+
+import pytest
+
+from shared.rag.chunker import TokenChunker, approximate_token_count
+
+URL = 'https://tenders.example.com/' + '/'.join(f'section{i}' for i in range(400)) + '/annexure.pdf'
+
+
+def sentences(n, prefix='Sentence'):
+    return ' '.join(f"{prefix} {i} covers cable item {i} in detail." for i in range(n))
+
+
+def squash(text):
+    return re.sub(r'\s+', '', text)
+
+
+@pytest.mark.parametrize('count_tokens', [approximate_token_count, len], ids=['words', 'chars'])
+@pytest.mark.parametrize('text', [
+    sentences(300),
+    f"Refer to {URL} for drawings. " + sentences(20),
+    'x' * 5000,
+    'Schedule\n\n' + '\n'.join(f"{i}\tXLPE cable 185 sq mm\t{i * 10}\tkm" for i in range(200)),
+], ids=['prose', 'long-url', 'one-word', 'table'])
+def test_every_chunk_fits_the_budget(text, count_tokens):
+    chunker = TokenChunker(max_tokens=50, overlap_tokens=10, count_tokens=count_tokens)
+
+    chunks = list(chunker.iter_chunks(text))
+
+    assert chunks
+    assert max(count_tokens(chunk) for chunk in chunks) <= 50
+
+
+@pytest.mark.parametrize('text', [
+    sentences(200),
+    f"See {URL} and {URL[::-1]} now.\n\n" + sentences(30),
+], ids=['prose', 'long-words'])
+def test_without_overlap_chunks_reassemble_the_text(text):
+    chunker = TokenChunker(max_tokens=40, overlap_tokens=0)
+
+    assert squash(''.join(chunker.iter_chunks(text))) == squash(text)
+
+
+def test_chunks_overlap_within_a_section():
+    chunker = TokenChunker(max_tokens=60, overlap_tokens=15)
+    chunks = list(chunker.iter_chunks(sentences(60)))
+
+    assert len(chunks) > 3
+    for previous, chunk in zip(chunks, chunks[1:]):
+        first_sentence = chunk.split('. ')[0] + '.'
+        assert first_sentence in previous
+
+
+def test_sections_start_fresh_chunks():
+    text = sentences(8, 'Intro') + '\n\n' + sentences(8, 'Scope')
+    chunks = list(TokenChunker(max_tokens=100, overlap_tokens=20).iter_chunks(text))
+
+    assert [chunk.split()[0] for chunk in chunks] == ['Intro', 'Scope']
+
+
+def test_table_rows_are_not_split():
+    rows = [f"{i} | XLPE cable 3C x 185 sq mm. Armoured. | {i * 10} | km" for i in range(50)]
+    chunks = list(TokenChunker(max_tokens=60, overlap_tokens=0).iter_chunks('\n'.join(rows)))
+
+    assert sorted(line for chunk in chunks for line in chunk.split('\n')) == sorted(rows)
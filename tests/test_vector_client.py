@@ -0,0 +1,41 @@
+"""
+Vector client selection tests (qdrant-client made unimportable)
+"""
+import sys
+
+import pytest
+
+from shared.vectors import LocalVectorClient, client as vector_client, is_local_client
+
+
+@pytest.fixture(autouse=True)
+def no_qdrant(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'qdrant_client', None)
+    monkeypatch.setattr(vector_client, '_client', None)
+    monkeypatch.setattr(vector_client, '_client_resolved', False)
+
+
+def test_unavailable_store_is_probed_once(monkeypatch):
+    monkeypatch.setenv('VECTOR_STORE_FALLBACK', 'none')
+    attempts = []
+    connect = vector_client._connect
+    monkeypatch.setattr(vector_client, '_connect', lambda *args: attempts.append(args) or connect(*args))
+
+    assert vector_client.get_vector_client() is None
+    assert vector_client.get_vector_client() is None
+    assert len(attempts) == 1
+
+
+def test_local_fallback_is_shared(monkeypatch, tmp_path):
+    monkeypatch.setenv('VECTOR_STORE_FALLBACK', 'local')
+    monkeypatch.setenv('VECTOR_STORE_PATH', str(tmp_path))
+
+    client = vector_client.get_vector_client()
+    try:
+        assert is_local_client(client)
+        assert vector_client.get_vector_client() is client
+        # The store directory is locked by the process-wide client
+        with pytest.raises(RuntimeError):
+            LocalVectorClient(str(tmp_path))
+    finally:
+        client.close()
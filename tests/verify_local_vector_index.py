@@ -0,0 +1,120 @@
+"""
+Local Vector Index Verification Script
+Checks the in-process vector index (Qdrant fallback) without any server:
+filtered search against brute force, the per-path lock, persistence across
+reopen, scroll, count and delete, and HNSW recall when hnswlib is installed.
+"""
+import sys
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from shared.vectors import LocalVectorClient, models
+from shared.vectors import local_index
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DIM = 32
+
+
+def _points(vectors):
+    return [
+        models.PointStruct(id=i, vector=v.tolist(), payload={'rfp_id': f"RFP-{i % 4}", 'chunk_index': i})
+        for i, v in enumerate(vectors)
+    ]
+
+
+def _rfp_filter(rfp_id):
+    return models.Filter(must=[models.FieldCondition(key='rfp_id', match=models.MatchValue(value=rfp_id))])
+
+
+def verify_exact_search(path):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(5000, DIM)).astype(np.float32)
+    query = rng.normal(size=DIM).astype(np.float32)
+
+    client = LocalVectorClient(path)
+    client.create_collection('docs', models.VectorParams(size=DIM, distance=models.Distance.COSINE))
+    client.upsert('docs', _points(vectors))
+
+    # Brute force reference
+    normed = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normed @ (query / np.linalg.norm(query))
+    eligible = np.arange(len(vectors))[np.arange(len(vectors)) % 4 == 1]
+    expected = eligible[np.argsort(-scores[eligible])[:10]].tolist()
+
+    hits = client.search('docs', query.tolist(), query_filter=_rfp_filter('RFP-1'), limit=10)
+    assert [h.id for h in hits] == expected, "filtered search differs from brute force"
+
+    # One client per path
+    try:
+        LocalVectorClient(path)
+        raise AssertionError("second client opened a locked path")
+    except RuntimeError:
+        pass
+
+    # Reopen from disk (snapshot plus write log)
+    client.set_payload('docs', {'reviewed': True}, points=[1, 2])
+    client.close()
+    reopened = LocalVectorClient(path)
+    assert reopened.retrieve('docs', [1])[0].payload['reviewed'] is True
+    assert reopened.count('docs').count == 5000
+    assert [h.id for h in reopened.search('docs', query.tolist(), query_filter=_rfp_filter('RFP-1'), limit=10)] == expected
+
+    assert reopened.count('docs', count_filter=_rfp_filter('RFP-2')).count == 1250
+    page, next_offset = reopened.scroll('docs', scroll_filter=_rfp_filter('RFP-3'), limit=2, with_payload=False)
+    assert [p.id for p in page] == [3, 7] and next_offset == 11
+
+    reopened.delete('docs', models.FilterSelector(filter=_rfp_filter('RFP-0')))
+    assert reopened.count('docs').count == 3750
+    reopened.close()
+    logger.info("Exact search, persistence, scroll, count and delete verified.")
+
+
+def verify_hnsw(path):
+    try:
+        import hnswlib  # noqa: F401
+    except ImportError:
+        logger.info("hnswlib not installed - skipping HNSW check")
+        return
+
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(30000, DIM)).astype(np.float32)
+    queries = rng.normal(size=(50, DIM)).astype(np.float32)
+
+    client = LocalVectorClient(path)
+    client.create_collection('big', models.VectorParams(size=DIM, distance=models.Distance.COSINE))
+    client.upsert('big', _points(vectors))
+
+    local_index.HNSW_MIN_POINTS = 10 ** 9
+    start = time.perf_counter()
+    exact = [[h.id for h in client.search('big', q.tolist(), limit=10)] for q in queries]
+    exact_s = time.perf_counter() - start
+
+    local_index.HNSW_MIN_POINTS = 1000
+    client.search('big', queries[0].tolist(), limit=10)  # build graph
+    start = time.perf_counter()
+    approx = [[h.id for h in client.search('big', q.tolist(), limit=10)] for q in queries]
+    hnsw_s = time.perf_counter() - start
+
+    recall = np.mean([len(set(a) & set(e)) / 10 for a, e in zip(approx, exact)])
+    logger.info(
+        f"HNSW recall@10 {recall:.3f}, {len(queries) / exact_s:.0f} q/s exact "
+        f"vs {len(queries) / hnsw_s:.0f} q/s HNSW"
+    )
+    assert recall >= 0.9, "HNSW recall too low"
+    client.close()
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        verify_exact_search(tmp)
+        verify_hnsw(tmp)
+    logger.info("Local vector index verified successfully.")